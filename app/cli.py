@@ -0,0 +1,75 @@
+import argparse
+import os
+import sys
+from typing import Optional, Sequence
+
+import duckdb
+
+from app.database.connection import CSV_NOMINATIONS_SQL
+
+
+def convert_to_parquet(source: str, destination: str, partition_by_year: bool = True) -> int:
+    """
+    Convert a semicolon CSV of nominations into Parquet.
+
+    The rows are normalized to the 'worst_movie_nominations' schema (integer year, boolean
+    winner) so DatabaseManager can load the output without any further parsing. With
+    `partition_by_year`, the output is a Hive-style directory with one 'year=YYYY'
+    subdirectory per year; otherwise it is a single Parquet file.
+
+    Args:
+        source (str): Path to the CSV file.
+        destination (str): Output directory (partitioned) or file path.
+        partition_by_year (bool): Write a year-partitioned directory instead of a single file.
+
+    Returns:
+        int: Number of rows written.
+
+    Raises:
+        FileNotFoundError: If the CSV file does not exist.
+    """
+    if not os.path.isfile(source):
+        raise FileNotFoundError(f"CSV file not found at '{source}'")
+
+    conn = duckdb.connect()
+    try:
+        conn.execute("CREATE TEMP TABLE nominations AS " + CSV_NOMINATIONS_SQL, [source])
+        options = "FORMAT parquet, COMPRESSION zstd"
+        if partition_by_year:
+            options += ", PARTITION_BY (year), OVERWRITE_OR_IGNORE"
+        # The destination cannot be a prepared parameter in COPY, so quote it as a literal.
+        target = destination.replace("'", "''")
+        conn.execute(f"COPY (SELECT * FROM nominations ORDER BY year) TO '{target}' ({options});")
+        return conn.execute("SELECT COUNT(*) FROM nominations;").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Entry point of the command line interface.
+
+    Args:
+        argv (Optional[Sequence[str]]): Command line arguments, defaults to sys.argv[1:].
+
+    Returns:
+        int: Process exit code.
+    """
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Razzie Awards API utilities.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="Convert the nominations CSV into Parquet.")
+    convert.add_argument("source", help="Semicolon separated nominations CSV, e.g. data/Movielist.csv")
+    convert.add_argument("destination", help="Output directory, or output file with --single-file")
+    convert.add_argument("--single-file", action="store_true",
+                         help="Write one Parquet file instead of a year-partitioned directory")
+
+    args = parser.parse_args(argv)
+    if args.command == "convert":
+        rows = convert_to_parquet(args.source, args.destination, partition_by_year=not args.single_file)
+        print(f"Wrote {rows} nominations to {args.destination}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+import os
+from dataclasses import dataclass, field
+
+
+def _env_str(name: str, default: str = None) -> str:
+    """Read a string setting from the environment."""
+    return os.getenv(name, default)
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean setting from the environment ("1", "true", "yes" or "on")."""
+    value = os.getenv(name)
+    return value.strip().lower() in ("1", "true", "yes", "on") if value else default
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment."""
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment."""
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Application settings read from environment variables.
+
+    Attributes:
+        db_path (str): DuckDB database path (RAZZIE_DB_PATH). Defaults to an in-memory DB.
+        shared_db (bool): Share the on-disk database read-only across worker processes (RAZZIE_SHARED_DB).
+        csv_path (str): Source data file or Parquet directory (RAZZIE_CSV_PATH). Defaults to the bundled Movielist.csv.
+        source_format (str): "csv", "parquet" or "auto" to detect it from the path (RAZZIE_SOURCE_FORMAT).
+        pool_size (int): Maximum number of concurrent DuckDB cursors (RAZZIE_POOL_SIZE).
+        pool_timeout (float): Seconds a request waits for a free cursor (RAZZIE_POOL_TIMEOUT).
+        profiling_enabled (bool): Allow per-request profiling with the X-Profile header (RAZZIE_PROFILING).
+        profiling_interval (float): Seconds between profiler samples (RAZZIE_PROFILING_INTERVAL).
+        background_load (bool): Load the data after start-up instead of blocking it (RAZZIE_BACKGROUND_LOAD).
+        warmup_enabled (bool): Precompute the interval response once the data is loaded (RAZZIE_WARMUP).
+        admin_enabled (bool): Mount the administrative endpoints that change the dataset (RAZZIE_ADMIN).
+        admin_token (str): Bearer token required by the administrative endpoints (RAZZIE_ADMIN_TOKEN).
+    """
+    db_path: str = field(default_factory=lambda: _env_str("RAZZIE_DB_PATH", ":memory:"))
+    shared_db: bool = field(default_factory=lambda: _env_bool("RAZZIE_SHARED_DB", False))
+    csv_path: str = field(default_factory=lambda: _env_str("RAZZIE_CSV_PATH"))
+    source_format: str = field(default_factory=lambda: _env_str("RAZZIE_SOURCE_FORMAT", "auto"))
+    pool_size: int = field(default_factory=lambda: _env_int("RAZZIE_POOL_SIZE", os.cpu_count() or 4))
+    pool_timeout: float = field(default_factory=lambda: _env_float("RAZZIE_POOL_TIMEOUT", 5.0))
+    profiling_enabled: bool = field(default_factory=lambda: _env_bool("RAZZIE_PROFILING", False))
+    profiling_interval: float = field(default_factory=lambda: _env_float("RAZZIE_PROFILING_INTERVAL", 0.001))
+    background_load: bool = field(default_factory=lambda: _env_bool("RAZZIE_BACKGROUND_LOAD", True))
+    warmup_enabled: bool = field(default_factory=lambda: _env_bool("RAZZIE_WARMUP", True))
+    admin_enabled: bool = field(default_factory=lambda: _env_bool("RAZZIE_ADMIN", False))
+    admin_token: str = field(default_factory=lambda: _env_str("RAZZIE_ADMIN_TOKEN"))
+
+
+def get_settings() -> Settings:
+    """
+    Build the application settings from the current environment.
+
+    Returns:
+        Settings: The application settings.
+    """
+    return Settings()
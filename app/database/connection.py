@@ -1,16 +1,98 @@
 import os
+import hashlib
+import logging
+import threading
 
 import duckdb
-import pandas as pd
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
-from pandas.errors import EmptyDataError
+from typing import Generator, Iterable
+from app.database.file_lock import exclusive_file_lock
+from app.database.pool import CursorPool
+from app.metrics import DB_CONNECT_DURATION, INGEST_DURATION, INGEST_ROWS
+from app.profiling import profile_thread
+from app.schemas.nominations import Nomination
+from app.services.producer_index import ProducerIndex
+from app.services.producer_service import split_producers
+from app.services.tokenizer import canonical_name_sql, strip_sql
+
+# Column definitions of the tables managed by DatabaseManager.
+# Reloads build '<table>_staging' copies with the same schema and swap them in atomically.
+TABLE_SCHEMAS = {
+    "worst_movie_nominations": "year INTEGER, title TEXT, studios TEXT, producers TEXT, winner BOOLEAN",
+    "producer_dictionary": "producer_id INTEGER, producer TEXT, producer_key TEXT",
+    "producer_wins": "producer_id INTEGER, producer TEXT, year INTEGER",
+    "producer_intervals": "producer_id INTEGER, producer TEXT, interval INTEGER, previous_win INTEGER, following_win INTEGER",
+}
+
+# Consecutive-win gaps of the producers in 'producer_wins{suffix}' matching {where}.
+PRODUCER_INTERVALS_SQL = """
+    SELECT producer_id, producer, following_win - previous_win AS interval, previous_win, following_win
+    FROM (
+        SELECT producer_id, producer,
+               lag(year) OVER (PARTITION BY producer_id ORDER BY year) AS previous_win,
+               year AS following_win
+        FROM producer_wins{suffix}
+        WHERE {where}
+    ) AS gaps
+    WHERE previous_win IS NOT NULL
+"""
+STAGING_SUFFIX = "_staging"
+
+# Supported source formats. "auto" picks parquet for directories and *.parquet files, csv otherwise.
+SOURCE_FORMAT_AUTO = "auto"
+SOURCE_FORMAT_CSV = "csv"
+SOURCE_FORMAT_PARQUET = "parquet"
+SOURCE_FORMATS = (SOURCE_FORMAT_AUTO, SOURCE_FORMAT_CSV, SOURCE_FORMAT_PARQUET)
+
+# Nomination rows of a source, normalized to the 'worst_movie_nominations' schema.
+# Both readers take the source path (a file, or a glob for partitioned directories) as parameter.
+CSV_NOMINATIONS_SQL = """
+    SELECT CAST(year AS INTEGER) AS year,
+           title,
+           studios,
+           producers,
+           coalesce(lower(""" + strip_sql("winner") + """) = 'yes', FALSE) AS winner
+    FROM read_csv(?, delim = ';', header = true, all_varchar = true, quote = '"', escape = '"')
+"""
+PARQUET_NOMINATIONS_SQL = """
+    SELECT CAST(year AS INTEGER) AS year,
+           CAST(title AS VARCHAR) AS title,
+           CAST(studios AS VARCHAR) AS studios,
+           CAST(producers AS VARCHAR) AS producers,
+           coalesce(lower(""" + strip_sql("CAST(winner AS VARCHAR)") + """) IN ('yes', 'true'), FALSE) AS winner
+    FROM read_parquet(?, hive_partitioning = true, union_by_name = true)
+"""
+
+
+def _is_blank(path: str, chunk_size: int = 1 << 16) -> bool:
+    """Return True if a text file holds nothing but whitespace, reading only up to its first other character."""
+    with open(path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            if chunk.strip():
+                return False
+    return True
+
+
+def detect_source_format(path: str) -> str:
+    """
+    Guess the format of a nominations source.
+
+    Args:
+        path (str): Path to a CSV file, a Parquet file or a directory of Parquet files.
+
+    Returns:
+        str: SOURCE_FORMAT_PARQUET for directories and *.parquet files, SOURCE_FORMAT_CSV otherwise.
+    """
+    if os.path.isdir(path) or path.lower().endswith(".parquet"):
+        return SOURCE_FORMAT_PARQUET
+    return SOURCE_FORMAT_CSV
 
 
 class DatabaseManager:
     """
     Singleton class to manage a DuckDB connection, create tables,
-    load initial data from a CSV file, and manage the database lifecycle.
+    load initial data from a CSV or Parquet source, and manage the database lifecycle.
     """
     _instance = None
 
@@ -20,22 +102,52 @@ class DatabaseManager:
             cls._instance = super(DatabaseManager, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self, db_path: str = ":memory:", csv_path: str = None):
+    def __init__(self, db_path: str = ":memory:", csv_path: str = None, pool_size: int = 4, pool_timeout: float = 5.0,
+                 source_format: str = SOURCE_FORMAT_AUTO, shared: bool = False):
         """
         Initialize the database manager.
 
         Args:
             db_path (str): Path to the DuckDB database file. Defaults to in-memory DB.
-            csv_path (str): Optional path to the CSV file to preload data from.
+            csv_path (str): Optional path to the source to preload data from: a semicolon CSV file,
+                a Parquet file or a (Hive year-partitioned) directory of Parquet files.
+            pool_size (int): Maximum number of cursors handed out to concurrent requests.
+            pool_timeout (float): Seconds a request waits for a free cursor.
+            source_format (str): "csv", "parquet" or "auto" to detect it from the path.
+            shared (bool): Serve a database file shared by several worker processes. One process
+                builds the file while holding a lock; every process then opens it read-only.
+
+        Raises:
+            ValueError: If the source format is not supported, or `shared` is used with an in-memory DB.
         """
         # Avoid reinitialization if already initialized, but allow it in tests
         if not os.getenv("PYTEST_CURRENT_TEST") and hasattr(self, '_initialized') and self._initialized:
             return
 
+        if source_format not in SOURCE_FORMATS:
+            raise ValueError(f"Unknown source format '{source_format}', expected one of {SOURCE_FORMATS}")
+        if shared and db_path == ":memory:":
+            raise ValueError("A shared database needs an on-disk db_path")
+
         self.db_path = db_path
         self.csv_path = str(csv_path) if csv_path else str(Path(__file__).parent.parent.parent / 'data' / 'Movielist.csv')
+        self.source_format = source_format
+
+        self.pool_size = pool_size
+        self.pool_timeout = pool_timeout
+        self.shared = shared
 
         self.conn = None
+        self.pool = None
+        # In-memory producer win index, rebuilt on load and updated on append.
+        self.producer_index = None
+        # Id of the next producer added by an append, kept in memory to avoid a max() scan per producer.
+        self._next_producer_id = 1
+        # Incremented on every (re)load so cached results can be invalidated.
+        self.dataset_version = 0
+        self._write_lock = threading.Lock()
+        # Serializes the lazy creation of the cursor pool by concurrent first requests.
+        self._pool_lock = threading.Lock()
         self._initialized = True
 
     def __enter__(self):
@@ -45,12 +157,13 @@ class DatabaseManager:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Ensure connection is properly closed on exiting the 'with' block."""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
+        self.close()
 
     def close(self):
-        """Close the current database connection if it exists."""
+        """Close the cursor pool and the current database connection if they exist."""
+        if self.pool:
+            self.pool.close()
+            self.pool = None
         if self.conn:
             self.conn.close()
             self.conn = None
@@ -63,7 +176,8 @@ class DatabaseManager:
             duckdb.DuckDBPyConnection: Active database connection.
         """
         if not self.conn:
-            self.conn = duckdb.connect(database=self.db_path)
+            with DB_CONNECT_DURATION.time():
+                self.conn = duckdb.connect(database=self.db_path, read_only=self.shared)
         return self.conn
 
     def get_connection(self):
@@ -75,67 +189,526 @@ class DatabaseManager:
         """
         return self.connect()
 
-    def initialize_database(self):
+    def get_pool(self) -> CursorPool:
+        """
+        Retrieve the cursor pool of the current connection, creating both if necessary.
+
+        Creation is guarded by a lock, so concurrent first requests share one pool and the
+        pool size stays an upper bound on the open cursors.
+
+        Returns:
+            CursorPool: Pool of cursors on the active connection.
+        """
+        pool = self.pool
+        if pool:
+            return pool
+        with self._pool_lock:
+            conn = self.connect()
+            if not self.pool:
+                self.pool = CursorPool(conn, size=self.pool_size, timeout=self.pool_timeout)
+            return self.pool
+
+    @contextmanager
+    def cursor(self) -> Generator[duckdb.DuckDBPyConnection, None, None]:
+        """
+        Check out a pooled cursor for the duration of a 'with' block.
+
+        When the current request is being profiled, the calling thread is sampled while it
+        holds the cursor.
+
+        Yields:
+            duckdb.DuckDBPyConnection: A cursor for the exclusive use of the caller.
+        """
+        with profile_thread(), self.get_pool().cursor() as cursor:
+            yield cursor
+
+    def initialize_database(self, force: bool = False):
         """
         Initialize the database by creating tables, loading initial data, and creating indexes.
+        Bumps the dataset version once the new data is in place.
+
+        Data is loaded into staging tables and swapped in with a single transaction, so a
+        reload in a live process never exposes an empty or half-loaded table and requests
+        already in flight finish on the previous snapshot.
+
+        When the database is an on-disk file that already holds the data of the current
+        source file (same size, mtime and SHA-256 checksum), the reload and index rebuild
+        are skipped.
+
+        Args:
+            force (bool): Reload the source file even if the snapshot is up to date.
         """
+        if self.shared:
+            self._initialize_shared_database(force)
+            return
+
         self.connect()
-        self._create_tables()
-        self._load_initial_data()
-        self._create_indexes()
+
+        with self._write_lock:
+            self._create_tables()
+
+            if force or not self._snapshot_is_current():
+                self._ingest()
+
+            self._build_producer_index()
+            self.dataset_version += 1
+
+    def _initialize_shared_database(self, force: bool):
+        """
+        Build the shared database file if needed, then open it read-only.
+
+        Workers serialize on a lock file next to the database: the first one builds or refreshes
+        the file while the others wait, and they then find it current and only open it. The
+        table data is paged in from the shared file on demand, so memory and start-up time stay
+        flat as workers are added. DuckDB refuses writers while readers have the file open; if
+        the source changed while other workers still serve the file, the existing snapshot is
+        served until every worker restarts.
+        """
+        with self._write_lock, exclusive_file_lock(f"{self.db_path}.lock"):
+            self.close()
+            if force or not self._shared_snapshot_is_current():
+                self._build_shared_snapshot()
+            self.connect()
+            self._build_producer_index()
+            self.dataset_version += 1
+
+    def _shared_snapshot_is_current(self) -> bool:
+        """Check, through a read-only connection, whether the shared file holds the current source."""
+        if not os.path.exists(self.db_path):
+            return False
+        self.conn = duckdb.connect(database=self.db_path, read_only=True)
+        try:
+            return self._snapshot_is_current()
+        except duckdb.CatalogException:
+            # The file exists but was never fully built.
+            return False
+        finally:
+            self.close()
+
+    def _build_shared_snapshot(self):
+        """Load the source into the shared file through a short-lived writable connection."""
+        try:
+            self.conn = duckdb.connect(database=self.db_path)
+        except duckdb.IOException:
+            if not os.path.exists(self.db_path):
+                raise
+            logging.warning("Shared database '%s' is open in other workers, serving the existing snapshot",
+                            self.db_path)
+            return
+        try:
+            self._create_tables()
+            self._ingest()
+        finally:
+            self.close()
+
+    def _ingest(self):
+        """Load the source into staging tables, swap them in and record the snapshot."""
+        with INGEST_DURATION.time():
+            if self._load_initial_data():
+                self._build_producer_tables()
+                self._swap_staging_tables()
+            self._create_indexes()
+            self._record_snapshot()
+        INGEST_ROWS.set(self.conn.execute("SELECT COUNT(*) FROM worst_movie_nominations;").fetchone()[0])
+
+    def append_nominations(self, nominations: Iterable[Nomination]) -> int:
+        """
+        Append a batch of nominations without reloading the existing data.
+
+        The new rows are inserted into 'worst_movie_nominations', new producers are added to
+        'producer_dictionary' and the new wins to 'producer_wins', all in one transaction.
+        Like a reload, a producer is reported under the smallest spelling of its winning rows
+        (of all its rows while it has no win), so a batch can rename the producer in every
+        producer table.
+        Only the producers touched by the batch are updated in the in-memory producer index,
+        so the cost depends on the batch size and not on the stored history. Should that
+        update fail after the commit, the index is rebuilt from the committed tables.
+
+        Args:
+            nominations (Iterable[Nomination]): The nominations to append.
+
+        Returns:
+            int: Number of nominations inserted.
+
+        Raises:
+            RuntimeError: If the database has not been initialized yet, or is a read-only shared database.
+        """
+        if self.producer_index is None:
+            raise RuntimeError("Movie Awards DB: initialize_database must run before appending nominations")
+        if self.shared:
+            raise RuntimeError("Movie Awards DB: the shared database is read-only")
+
+        rows = [(n.year, n.title, n.studios, n.producers, n.winner) for n in nominations]
+        if not rows:
+            return 0
+
+        with self._write_lock:
+            new_wins = []
+            touched_ids = set()
+            # Stored name of every producer of the batch, and the name of the renamed ones before the batch
+            names = {}
+            renamed = {}
+            # Whether each producer of the batch has a recorded win
+            has_win = {}
+            next_producer_id = self._next_producer_id
+            self.conn.execute("BEGIN TRANSACTION;")
+            try:
+                self.conn.executemany("INSERT INTO worst_movie_nominations VALUES (?, ?, ?, ?, ?);", rows)
+
+                for year, _, _, producers_str, winner in rows:
+                    for producer in split_producers(producers_str):
+                        producer_id, stored = self._get_or_create_producer_id(producer)
+                        won = has_win.get(producer_id)
+                        if won is None:
+                            won = self._has_producer_win(producer_id)
+                        # A reload reports the smallest winning spelling of a name, so appends do too
+                        if producer != stored and (winner and not won or winner == won and producer < stored):
+                            self._rename_producer(producer_id, producer)
+                            renamed.setdefault(producer_id, stored)
+                            touched_ids.add(producer_id)
+                            stored = producer
+                        names[producer_id] = stored
+                        has_win[producer_id] = won or winner
+                        if winner and self._insert_producer_win(producer_id, stored, year):
+                            new_wins.append((producer_id, year))
+                            touched_ids.add(producer_id)
+
+                self._refresh_producer_intervals(touched_ids)
+                self.conn.execute("COMMIT;")
+            except Exception:
+                self.conn.execute("ROLLBACK;")
+                self._next_producer_id = next_producer_id
+                raise
+
+            try:
+                for producer_id, previous_name in renamed.items():
+                    self.producer_index.rename(previous_name, names[producer_id])
+                for producer_id, year in new_wins:
+                    self.producer_index.add_win(names[producer_id], year)
+            except Exception:
+                # The rows are committed: rebuild the index from them rather than leave it behind the tables
+                logging.exception("Movie Awards DB: incremental producer index update failed, rebuilding it")
+                self._build_producer_index()
+            finally:
+                self.dataset_version += 1
+
+        return len(rows)
+
+    def _get_or_create_producer_id(self, producer: str) -> tuple:
+        """
+        Look up a producer by name, ignoring case, adding the producer if needed.
+
+        The lookup is a single probe of the unique index on the lower-cased 'producer_key',
+        and new ids come from an in-memory counter, so the cost does not grow with the
+        number of stored producers.
+
+        Returns:
+            tuple: The producer id and the name stored in the dictionary.
+        """
+        row = self.conn.execute(
+            "SELECT producer_id, producer FROM producer_dictionary WHERE producer_key = lower(?);", [producer]
+        ).fetchone()
+        if row:
+            return row
+
+        producer_id = self._next_producer_id
+        self._next_producer_id += 1
+        self.conn.execute("INSERT INTO producer_dictionary VALUES (?, ?, lower(?));", [producer_id, producer, producer])
+        return producer_id, producer
+
+    def _rename_producer(self, producer_id: int, producer: str):
+        """Store a new spelling of a producer in the dictionary and its wins."""
+        self.conn.execute(
+            "UPDATE producer_dictionary SET producer = ? WHERE producer_id = CAST(? AS INTEGER);", [producer, producer_id]
+        )
+        self.conn.execute(
+            "UPDATE producer_wins SET producer = ? WHERE producer_id = CAST(? AS INTEGER);", [producer, producer_id]
+        )
+
+    def _has_producer_win(self, producer_id: int) -> bool:
+        """Check whether 'producer_wins' holds a win of a producer."""
+        return self.conn.execute(
+            "SELECT 1 FROM producer_wins WHERE producer_id = CAST(? AS INTEGER) LIMIT 1;", [producer_id]
+        ).fetchone() is not None
+
+    def _refresh_producer_intervals(self, producer_ids: set):
+        """Recompute the 'producer_intervals' rows of the given producers only."""
+        if not producer_ids:
+            return
+
+        ids = ", ".join(str(int(producer_id)) for producer_id in sorted(producer_ids))
+        self.conn.execute(f"DELETE FROM producer_intervals WHERE producer_id IN ({ids});")
+        self.conn.execute(
+            "INSERT INTO producer_intervals "
+            + PRODUCER_INTERVALS_SQL.format(suffix="", where=f"producer_id IN ({ids})")
+            + ";"
+        )
+
+    def _insert_producer_win(self, producer_id: int, producer: str, year: int) -> bool:
+        """Insert a win into 'producer_wins' unless it is already recorded."""
+        exists = self.conn.execute(
+            # Typed parameters, so the equality can probe the producer_id index
+            "SELECT 1 FROM producer_wins WHERE producer_id = CAST(? AS INTEGER) AND year = CAST(? AS INTEGER);",
+            [producer_id, year]
+        ).fetchone()
+        if exists:
+            return False
+
+        self.conn.execute("INSERT INTO producer_wins VALUES (?, ?, ?);", [producer_id, producer, year])
+        return True
 
     def _create_tables(self):
-        """Create the 'worst_movie_nominations' table if it doesn't exist."""
+        """Create the nominations, producer and metadata tables if they don't exist."""
+        for table, columns in TABLE_SCHEMAS.items():
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({columns});")
         self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS worst_movie_nominations (
-                year INTEGER,
-                title TEXT,
-                studios TEXT,
-                producers TEXT,
-                winner BOOLEAN
+            CREATE TABLE IF NOT EXISTS ingest_metadata (
+                source_path TEXT PRIMARY KEY,
+                size BIGINT,
+                mtime DOUBLE,
+                sha256 TEXT,
+                loaded_at TIMESTAMP
             );
         """)
 
-    def _load_initial_data(self):
+    def _load_initial_data(self) -> bool:
+        """
+        Load movie nominations from the source into the 'worst_movie_nominations_staging' table.
+
+        The source is streamed straight into the table by DuckDB's native multithreaded
+        CSV or Parquet reader, so it is never fully materialized in Python memory.
+        Converts the 'winner' field to a boolean value in the same vectorized pass.
+        Parquet directories are read with Hive partitioning, so a 'year=YYYY' directory
+        level provides the year column. Skips loading, keeping the current data, if the
+        source is empty, blank or has no data rows.
+
+        Returns:
+            bool: True if staging tables were loaded and must be swapped in.
+
+        Raises:
+            FileNotFoundError: If the source does not exist.
+        """
+        parquet = self._resolved_format() == SOURCE_FORMAT_PARQUET
+        if not os.path.exists(self.csv_path):
+            kind = "source" if parquet else "CSV"
+            raise FileNotFoundError(f"Movie Awards DB: {kind} file not found at '{self.csv_path}'")
+
+        files = self._source_files()
+        if not files or sum(os.path.getsize(path) for path in files) == 0 or (not parquet and _is_blank(files[0])):
+            # Silently skip loading data if the source is empty or blank
+            return False
+
+        for table, columns in TABLE_SCHEMAS.items():
+            self.conn.execute(f"CREATE OR REPLACE TABLE {table}{STAGING_SUFFIX} ({columns});")
+
+        if parquet:
+            self.conn.execute("INSERT INTO worst_movie_nominations_staging " + PARQUET_NOMINATIONS_SQL, [files])
+        else:
+            self.conn.execute("INSERT INTO worst_movie_nominations_staging " + CSV_NOMINATIONS_SQL, [self.csv_path])
+
+        if self.conn.execute("SELECT 1 FROM worst_movie_nominations_staging LIMIT 1;").fetchone() is None:
+            # A header without data rows: keep the current tables instead of swapping in empty ones
+            for table in TABLE_SCHEMAS:
+                self.conn.execute(f"DROP TABLE {table}{STAGING_SUFFIX};")
+            return False
+        return True
+
+    def _resolved_format(self) -> str:
+        """Return the configured source format, detecting it from the path when set to "auto"."""
+        if self.source_format == SOURCE_FORMAT_AUTO:
+            return detect_source_format(self.csv_path)
+        return self.source_format
+
+    def _source_files(self) -> list:
         """
-        Load movie nominations from the CSV file into the database.
-        Converts the 'winner' field to a boolean value.
-        Skips loading if the CSV is empty or has no data rows.
+        List the files making up the source, in a stable order.
+
+        Returns:
+            list: The source file itself, or every *.parquet file below a source directory.
         """
+        if os.path.isdir(self.csv_path):
+            return sorted(str(path) for path in Path(self.csv_path).rglob("*.parquet"))
+        return [self.csv_path] if os.path.isfile(self.csv_path) else []
+
+    def _build_producer_tables(self):
+        """
+        Build the normalized producer staging tables from 'worst_movie_nominations_staging'.
+
+        - 'producer_dictionary' maps every distinct producer name to an integer id.
+        - 'producer_wins' is the bridge table with one row per producer and winning year.
+        - 'producer_intervals' holds every consecutive-win gap, stored ordered by previous_win
+          so year-range queries only scan the row groups of the requested years.
+
+        The producers string is split on ',' and ' and ' only once, here at ingest time,
+        so per-producer queries become indexed lookups instead of repeated string parsing.
+        Names are canonicalized like the producer tokenizer: trimmed, inner whitespace
+        collapsed, compared case-insensitively and reported under their smallest winning
+        spelling, like the interval engines parsing the nominations (the smallest spelling
+        overall for producers without a win).
+        """
+        split_producers_sql = strip_sql(r"unnest(regexp_split_to_array(producers, ',|\s+and\s+'))")
+
+        # Distinct canonical names, grouped case-insensitively under their smallest winning spelling.
+        self.conn.execute(rf"""
+            CREATE OR REPLACE TEMP TABLE producer_keys AS
+            SELECT CAST(row_number() OVER (ORDER BY spelling) AS INTEGER) AS producer_id, producer_key, spelling AS producer
+            FROM (
+                SELECT lower(producer) AS producer_key,
+                       coalesce(min(producer) FILTER (WHERE winner), min(producer)) AS spelling
+                FROM (
+                    SELECT DISTINCT {canonical_name_sql("split.producer")} AS producer, split.winner
+                    FROM (
+                        SELECT {split_producers_sql} AS producer, winner AND year IS NOT NULL AS winner
+                        FROM worst_movie_nominations_staging
+                        WHERE producers IS NOT NULL AND producers <> ''
+                    ) AS split
+                    WHERE split.producer <> ''
+                ) AS names
+                GROUP BY lower(producer)
+            ) AS keys;
+        """)
+        self.conn.execute(
+            "INSERT INTO producer_dictionary_staging SELECT producer_id, producer, producer_key FROM producer_keys;"
+        )
+        self.conn.execute(rf"""
+            INSERT INTO producer_wins_staging
+            SELECT DISTINCT k.producer_id, k.producer, split.year
+            FROM (
+                SELECT year, {canonical_name_sql("raw.producer")} AS producer
+                FROM (
+                    SELECT year, {split_producers_sql} AS producer
+                    FROM worst_movie_nominations_staging
+                    WHERE winner = TRUE AND year IS NOT NULL AND producers IS NOT NULL AND producers <> ''
+                ) AS raw
+            ) AS split
+            JOIN producer_keys AS k ON k.producer_key = lower(split.producer)
+            ORDER BY k.producer_id, split.year;
+        """)
+        self.conn.execute("DROP TABLE producer_keys;")
+        self.conn.execute(
+            "INSERT INTO producer_intervals_staging "
+            + PRODUCER_INTERVALS_SQL.format(suffix=STAGING_SUFFIX, where="TRUE")
+            + " ORDER BY previous_win, producer_id;"
+        )
+
+    def _swap_staging_tables(self):
+        """
+        Atomically replace the live tables with their staging copies.
+
+        DuckDB cannot rename a table that already has indexes, so the indexes are created
+        right after the rename inside the same transaction. Until the commit, readers keep
+        seeing the previous tables and indexes.
+        """
+        self.conn.execute("BEGIN TRANSACTION;")
         try:
-            df = pd.read_csv(self.csv_path, sep=';', engine='python')
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Movie Awards DB: CSV file not found at '{self.csv_path}'")
-        except EmptyDataError:
-            # Log or silently skip loading data if file is empty
-            return
+            for table in TABLE_SCHEMAS:
+                self.conn.execute(f"DROP TABLE IF EXISTS {table};")
+                self.conn.execute(f"ALTER TABLE {table}{STAGING_SUFFIX} RENAME TO {table};")
+            self._create_indexes()
+            self.conn.execute("COMMIT;")
+        except Exception:
+            self.conn.execute("ROLLBACK;")
+            raise
+
+    def _is_persistent(self) -> bool:
+        """Check whether the database lives in a file that survives process restarts."""
+        return self.db_path != ":memory:"
+
+    def _file_checksum(self) -> str:
+        """
+        Compute the SHA-256 checksum of the source files in fixed-size chunks.
+
+        For a directory, the relative path of every file is hashed along with its contents,
+        so renamed or moved partitions change the checksum too.
 
-        if df.empty:
+        Returns:
+            str: Hex digest of the source contents.
+        """
+        digest = hashlib.sha256()
+        for path in self._source_files():
+            if os.path.isdir(self.csv_path):
+                digest.update(os.path.relpath(path, self.csv_path).encode("utf-8"))
+            with open(path, "rb") as source:
+                for chunk in iter(lambda: source.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    def _source_stat(self) -> tuple:
+        """Return the total size and latest mtime of the source files."""
+        stats = [os.stat(path) for path in self._source_files()]
+        return sum(stat.st_size for stat in stats), max((stat.st_mtime for stat in stats), default=0.0)
+
+    def _snapshot_is_current(self) -> bool:
+        """
+        Check whether the database already holds the data of the current source.
+
+        Size and mtime are compared first, so the checksum is only computed when they match.
+
+        Returns:
+            bool: True if loading the source again can be skipped.
+        """
+        if not self._is_persistent() or not os.path.exists(self.csv_path):
+            return False
+
+        # Databases built before 'producer_dictionary' had its lookup key are rebuilt.
+        has_key = self.conn.execute(
+            "SELECT COUNT(*) FROM duckdb_columns() "
+            "WHERE table_name = 'producer_dictionary' AND column_name = 'producer_key';"
+        ).fetchone()[0]
+        if not has_key:
+            return False
+
+        row = self.conn.execute(
+            "SELECT size, mtime, sha256 FROM ingest_metadata WHERE source_path = ?;",
+            [self.csv_path]
+        ).fetchone()
+        if row is None:
+            return False
+
+        size, mtime = self._source_stat()
+        if row[0] != size or row[1] != mtime:
+            return False
+        return row[2] == self._file_checksum()
+
+    def _record_snapshot(self):
+        """Record the size, mtime and checksum of the loaded source."""
+        if not self._is_persistent():
             return
 
-        # Convert 'winner' column to boolean
-        df['winner'] = df['winner'].fillna('').apply(lambda x: x.strip().lower() == 'yes')
+        size, mtime = self._source_stat()
+        self.conn.execute("DELETE FROM ingest_metadata;")
+        self.conn.execute(
+            "INSERT INTO ingest_metadata VALUES (?, ?, ?, ?, current_timestamp);",
+            [self.csv_path, size, mtime, self._file_checksum()]
+        )
 
-        # Clear existing data and insert new records
-        self.conn.execute("DELETE FROM worst_movie_nominations;")
-        self.conn.register('input_df', df)
-        self.conn.execute("""
-            INSERT INTO worst_movie_nominations 
-            SELECT year, title, studios, producers, winner FROM input_df;
-        """)
+    def _build_producer_index(self):
+        """Build the in-memory producer index from the 'producer_wins' table."""
+        self.producer_index = ProducerIndex.from_wins(
+            self.conn.execute("SELECT producer, year FROM producer_wins ORDER BY producer_id, year;").fetchall()
+        )
+        self._next_producer_id = self.conn.execute(
+            "SELECT coalesce(max(producer_id), 0) + 1 FROM producer_dictionary;"
+        ).fetchone()[0]
 
     def _create_indexes(self):
         """Create indexes on relevant columns to improve query performance."""
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_producer ON worst_movie_nominations(producers);")
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_year ON worst_movie_nominations(year);")
+        self.conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_producer_dictionary_id ON producer_dictionary(producer_id);")
+        self.conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_producer_dictionary_name ON producer_dictionary(producer);")
+        self.conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_producer_dictionary_key ON producer_dictionary(producer_key);")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_producer_wins_producer ON producer_wins(producer_id);")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_producer_wins_year ON producer_wins(year);")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_producer_intervals_producer ON producer_intervals(producer_id);")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_producer_intervals_previous_win ON producer_intervals(previous_win);")
 
 
-def get_connection_db() -> Generator:
+def get_db_manager() -> DatabaseManager:
     """
-    Generator function to yield a DuckDB connection managed by DatabaseManager.
+    Return the shared DatabaseManager instance without reinitializing it.
 
-    Yields:
-        duckdb.DuckDBPyConnection: An active DuckDB connection.
+    Returns:
+        DatabaseManager: The singleton database manager.
     """
-    db_manager = DatabaseManager()
-    yield db_manager.get_connection()
+    return DatabaseManager._instance or DatabaseManager()
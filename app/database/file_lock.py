@@ -0,0 +1,35 @@
+import os
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - fcntl is only available on POSIX systems
+    fcntl = None
+
+
+@contextmanager
+def exclusive_file_lock(path: str):
+    """
+    Hold an exclusive advisory lock on a file, blocking until it is available.
+
+    Used to let a single process among several workers build the shared database while the
+    others wait. The lock is released when the block exits or the process dies.
+
+    Args:
+        path (str): Lock file path, created if missing.
+
+    Raises:
+        RuntimeError: If the platform does not support fcntl locks.
+    """
+    if fcntl is None:
+        raise RuntimeError("File locks require a POSIX system with fcntl.")
+
+    descriptor = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(descriptor, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(descriptor, fcntl.LOCK_UN)
+    finally:
+        os.close(descriptor)
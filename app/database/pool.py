@@ -0,0 +1,184 @@
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Generator, Iterator, List, Optional
+
+import duckdb
+from app.metrics import CURSOR_WAIT_DURATION
+
+
+class PoolTimeoutError(TimeoutError):
+    """Raised when no cursor becomes available within the configured wait time."""
+
+
+class CursorPool:
+    """
+    Bounded pool of DuckDB cursors created from a single parent connection.
+
+    Each cursor is an independent connection to the same database, so requests running
+    in FastAPI's threadpool can execute queries concurrently instead of sharing one
+    DuckDBPyConnection. Cursors are created lazily up to `size` and reused afterwards.
+    """
+
+    def __init__(self, conn: duckdb.DuckDBPyConnection, size: int = 4, timeout: float = 5.0):
+        """
+        Initialize the pool.
+
+        Args:
+            conn (duckdb.DuckDBPyConnection): Parent connection the cursors are created from.
+            size (int): Maximum number of cursors handed out at the same time.
+            timeout (float): Maximum number of seconds to wait for a free cursor.
+        """
+        if size < 1:
+            raise ValueError("Cursor pool size must be at least 1")
+
+        self.size = size
+        self.timeout = timeout
+        self._conn = conn
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._cursors: List[duckdb.DuckDBPyConnection] = []
+        self._lock = threading.Lock()
+
+        # Wait-time metrics
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def acquire(self, timeout: Optional[float] = None) -> duckdb.DuckDBPyConnection:
+        """
+        Check out a cursor, creating a new one while the pool is below its size.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for a free cursor. Defaults to the pool timeout.
+
+        Returns:
+            duckdb.DuckDBPyConnection: A cursor for the exclusive use of the caller.
+
+        Raises:
+            PoolTimeoutError: If no cursor became available in time.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started = time.perf_counter()
+        cursor = self._try_acquire()
+        if cursor is None:
+            try:
+                cursor = self._idle.get(timeout=timeout)
+            except queue.Empty:
+                with self._lock:
+                    self.timeouts += 1
+                raise PoolTimeoutError(f"No database cursor available after {timeout} seconds")
+
+        waited = time.perf_counter() - started
+        CURSOR_WAIT_DURATION.observe(waited)
+        with self._lock:
+            self.acquisitions += 1
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        return cursor
+
+    def _try_acquire(self) -> Optional[duckdb.DuckDBPyConnection]:
+        """Return an idle cursor or a newly created one without blocking, if possible."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._cursors) < self.size:
+                cursor = self._conn.cursor()
+                self._cursors.append(cursor)
+                return cursor
+        return None
+
+    def release(self, cursor: duckdb.DuckDBPyConnection) -> None:
+        """Return a checked out cursor to the pool."""
+        self._idle.put(cursor)
+
+    @contextmanager
+    def cursor(self) -> Generator[duckdb.DuckDBPyConnection, None, None]:
+        """
+        Context manager that checks out a cursor and always returns it.
+
+        Yields:
+            duckdb.DuckDBPyConnection: A pooled cursor.
+        """
+        cursor = self.acquire()
+        try:
+            yield cursor
+        finally:
+            self.release(cursor)
+
+    def stream(self, produce: Callable[[duckdb.DuckDBPyConnection], Iterator]) -> Iterator:
+        """
+        Check out a cursor now and hold it while a response stream read from it is iterated.
+
+        The cursor is acquired before returning, so a busy pool fails while the caller can still
+        answer with an error status instead of breaking a response that has already started.
+        It is returned to the pool once the stream is exhausted or closed, including when the
+        stream is dropped before its first chunk.
+
+        Args:
+            produce (Callable[[duckdb.DuckDBPyConnection], Iterator]): Builds the stream from the cursor.
+
+        Returns:
+            Iterator: The chunks of the stream.
+
+        Raises:
+            PoolTimeoutError: If no cursor became available in time.
+        """
+        cursor = self.acquire()
+
+        def held() -> Iterator:
+            try:
+                yield
+                yield from produce(cursor)
+            finally:
+                self.release(cursor)
+
+        stream = held()
+        # Run up to the first yield, inside the try block, so closing the stream always releases the cursor
+        next(stream)
+        return stream
+
+    def close(self) -> None:
+        """Close every cursor created by the pool."""
+        with self._lock:
+            for cursor in self._cursors:
+                cursor.close()
+            self._cursors.clear()
+        while not self._idle.empty():
+            self._idle.get_nowait()
+
+    def stats(self) -> dict:
+        """
+        Return the pool usage and wait-time metrics.
+
+        Returns:
+            dict: Pool size, created/idle cursors, acquisitions, timeouts and wait times.
+        """
+        with self._lock:
+            return {
+                "size": self.size,
+                "created": len(self._cursors),
+                "idle": self._idle.qsize(),
+                "acquisitions": self.acquisitions,
+                "timeouts": self.timeouts,
+                "total_wait_seconds": self.total_wait_seconds,
+                "max_wait_seconds": self.max_wait_seconds,
+            }
+
+    def render_metrics(self) -> list:
+        """Render the pool counters in the Prometheus text exposition format."""
+        stats = self.stats()
+        return [
+            "# TYPE razzie_db_pool_size gauge",
+            f"razzie_db_pool_size {stats['size']}",
+            "# TYPE razzie_db_pool_cursors gauge",
+            f"razzie_db_pool_cursors {stats['created']}",
+            "# TYPE razzie_db_pool_idle_cursors gauge",
+            f"razzie_db_pool_idle_cursors {stats['idle']}",
+            "# TYPE razzie_db_pool_timeouts_total counter",
+            f"razzie_db_pool_timeouts_total {stats['timeouts']}",
+        ]
@@ -1,23 +1,61 @@
-from fastapi import FastAPI
+import asyncio
+import time
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 from contextlib import asynccontextmanager
+from app.config import get_settings
 from app.database.connection import DatabaseManager
-from app.routers import producers
+from app.metrics import REGISTRY, REQUEST_DURATION
+from app.profiling import ProfilingMiddleware, profile_routes
+from app.profiling import router as profiling_router
+from app.routers import admin, batch, nominations, producers, studios
+from app.services.loader import DataLoader
+
+# Load the application settings from the environment.
+settings = get_settings()
 
 # Instantiate the database manager.
 # Responsible for setting up and managing the database connection.
-_db_manager = DatabaseManager()
+_db_manager = DatabaseManager(
+    db_path=settings.db_path,
+    csv_path=settings.csv_path,
+    source_format=settings.source_format,
+    shared=settings.shared_db,
+    pool_size=settings.pool_size,
+    pool_timeout=settings.pool_timeout
+)
+
+def _warm_up():
+    """Precompute the default interval response so the first request is served from the cache."""
+    try:
+        producers.load_encoded_intervals(_db_manager)
+    except HTTPException as error:
+        # An empty dataset has nothing to warm up.
+        if error.status_code != 404:
+            raise
+
+# Loads the data and runs the warm-up, reporting progress to the health endpoints.
+_loader = DataLoader(_db_manager, warm_up=_warm_up if settings.warmup_enabled else None)
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     """
     Manages the application lifespan.
 
-    Initializes the database when the application starts.
-    You can expand this to close connections or clean up resources on shutdown if needed.
+    Loads the database in a worker thread so the application starts answering liveness
+    probes immediately; with RAZZIE_BACKGROUND_LOAD=false the load blocks start-up instead.
+    On shutdown, a load still in progress is awaited before the application exits.
     """
-    _db_manager.initialize_database()
+    load = None
+    _loader.start()
+    if settings.background_load:
+        load = asyncio.create_task(asyncio.to_thread(_loader.run))
+    else:
+        _loader.run()
     yield # Control is passed to the app runtime here
-    # _db_manager.close() could be called here if a close method is implemented.
+    if load is not None:
+        # Failures are already logged and reported by /health/ready.
+        await asyncio.gather(load, return_exceptions=True)
 
 # Create the FastAPI app instance with metadata and lifespan context.
 app = FastAPI(
@@ -27,9 +65,73 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Expose the cursor pool counters of the database manager on /metrics.
+REGISTRY.register_collector(lambda: _db_manager.pool.render_metrics() if _db_manager.pool else [])
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """
+    Record the latency of every request in a histogram labelled by route template.
+
+    The route template (e.g. "/api/v1/producers/intervals") is used instead of the raw
+    path to keep the number of label values bounded.
+    """
+    started = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    REQUEST_DURATION.observe(
+        time.perf_counter() - started,
+        method=request.method,
+        route=route.path if route else "unmatched",
+        status=response.status_code
+    )
+    return response
+
+@app.middleware("http")
+async def reject_queries_while_loading(request: Request, call_next):
+    """
+    Answer API requests with 503 while the dataset is loading or failed to load.
+
+    Health, metrics and root endpoints stay available so probes keep working during the load.
+    """
+    if _loader.blocking_queries and request.url.path.startswith("/api/"):
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "Data is not loaded yet, try again later."},
+            headers={"Retry-After": "5"}
+        )
+    return await call_next(request)
+
+# Per-request profiling is opt-in: without RAZZIE_PROFILING the middleware is not installed at all,
+# and with it only requests carrying the X-Profile header are profiled.
+if settings.profiling_enabled:
+    app.add_middleware(ProfilingMiddleware, interval=settings.profiling_interval)
+    app.include_router(profiling_router, prefix="/debug", tags=["debug"])
+
 # Register the producers router under the "/api/v1" prefix.
 app.include_router(producers.router, prefix="/api/v1", tags=["producers"])
 
+# Register the studios router under the "/api/v1" prefix.
+app.include_router(studios.router, prefix="/api/v1", tags=["studios"])
+
+# Register the nominations export router under the "/api/v1" prefix.
+app.include_router(nominations.router, prefix="/api/v1", tags=["nominations"])
+
+# Register the batch query router under the "/api/v1" prefix.
+app.include_router(batch.router, prefix="/api/v1", tags=["batch"])
+
+# The administrative endpoints change the served dataset: they are opt-in with RAZZIE_ADMIN,
+# registered under the "/api/v1/admin" prefix and require the RAZZIE_ADMIN_TOKEN bearer token.
+if settings.admin_enabled:
+    if not settings.admin_token:
+        raise RuntimeError("RAZZIE_ADMIN requires RAZZIE_ADMIN_TOKEN to be set")
+    app.include_router(
+        admin.router,
+        prefix="/api/v1/admin",
+        tags=["admin"],
+        dependencies=[Depends(admin.require_admin_token(settings.admin_token))]
+    )
+
 @app.get("/")
 async def root():
     """
@@ -37,4 +139,36 @@ async def root():
 
     Returns a welcome message when accessing the root path ("/").
     """
-    return {"message": "Welcome to the Razzie Awards API"}
\ No newline at end of file
+    return {"message": "Welcome to the Razzie Awards API"}
+
+@app.get("/health/live")
+async def health_live():
+    """
+    Liveness endpoint.
+
+    Answers as soon as the process serves HTTP, independently of the data load.
+    """
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+async def health_ready():
+    """
+    Readiness endpoint.
+
+    Returns 200 once the data is loaded and warmed up, 503 with the load progress otherwise.
+    """
+    return JSONResponse(status_code=200 if _loader.ready else 503, content=_loader.status())
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics():
+    """
+    Metrics endpoint.
+
+    Returns every application metric in the Prometheus text exposition format.
+    """
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+# With profiling enabled, the thread running the endpoint of a profiled request is sampled for the whole call.
+# This wraps every route registered above, so it must stay the last statement of the module.
+if settings.profiling_enabled:
+    profile_routes(app.routes)
@@ -0,0 +1,300 @@
+import asyncio
+import sys
+import threading
+import uuid
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+from fastapi.routing import APIRoute
+
+# Request header that triggers profiling. "inline" returns the profile as the response body,
+# any other value stores it and returns its id in the X-Profile-Id response header.
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+
+# Only stacks running code from the application package are kept, which filters out the
+# profiled request's threads while they wait outside of it.
+APP_ROOT = str(Path(__file__).resolve().parent)
+
+# Profile of the request being handled, propagated to threadpool workers with the context.
+ACTIVE_PROFILE: ContextVar[Optional["RequestProfile"]] = ContextVar("active_profile", default=None)
+
+
+class RequestProfile:
+    """
+    Sampling profile of a single request, in collapsed-stack (flamegraph-ready) format.
+
+    A background thread samples the stacks of the threads registered by the profiled request
+    (see profile_thread and profile_routes), so concurrent requests served by other threadpool
+    workers are left out, and keeps the ones running application code. Samples taken while
+    a thread is inside an interval calculation phase are prefixed with a "[phase:<name>]"
+    frame, so flamegraphs group them by phase.
+    """
+
+    def __init__(self, interval: float = 0.001):
+        """
+        Initialize the profile.
+
+        Args:
+            interval (float): Seconds between two samples.
+        """
+        self.id = uuid.uuid4().hex
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._phases: Dict[int, List[str]] = {}
+        # Ident of every thread running work of this request -> nesting depth of its registrations
+        self._threads: Counter = Counter()
+        self._threads_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        self._thread = threading.Thread(target=self._run, name=f"profiler-{self.id[:8]}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread to finish."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    @contextmanager
+    def thread(self):
+        """Sample the current thread for the duration of the block."""
+        ident = threading.get_ident()
+        with self._threads_lock:
+            self._threads[ident] += 1
+        try:
+            yield
+        finally:
+            with self._threads_lock:
+                self._threads[ident] -= 1
+                if not self._threads[ident]:
+                    del self._threads[ident]
+
+    @contextmanager
+    def phase(self, name: str):
+        """Sample the current thread and tag its samples with a phase name for the duration of the block."""
+        phases = self._phases.setdefault(threading.get_ident(), [])
+        phases.append(name)
+        try:
+            with self.thread():
+                yield
+        finally:
+            phases.pop()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            with self._threads_lock:
+                threads = set(self._threads)
+            if not threads:
+                continue
+            for ident, frame in sys._current_frames().items():
+                if ident in threads:
+                    self._sample(ident, frame)
+
+    def _sample(self, ident: int, frame) -> None:
+        stack = []
+        in_app = False
+        while frame is not None:
+            code = frame.f_code
+            in_app = in_app or code.co_filename.startswith(APP_ROOT)
+            stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+            frame = frame.f_back
+        if not in_app:
+            return
+
+        stack.reverse()
+        phases = self._phases.get(ident)
+        if phases:
+            stack.insert(0, f"[phase:{phases[-1]}]")
+        self.samples[";".join(stack)] += 1
+
+    def collapsed(self) -> str:
+        """
+        Render the profile in the collapsed-stack format used by flamegraph.pl and speedscope.
+
+        Returns:
+            str: One "frame;frame;frame count" line per distinct stack.
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+class ProfileStore:
+    """Bounded in-memory store of the most recent request profiles."""
+
+    def __init__(self, max_profiles: int = 50):
+        self.max_profiles = max_profiles
+        self._profiles: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, profile: RequestProfile) -> None:
+        """Store a finished profile, evicting the oldest one when full."""
+        with self._lock:
+            self._profiles[profile.id] = profile.collapsed()
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[str]:
+        """Return a stored profile in collapsed-stack format, or None if unknown."""
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+
+# Shared store for profiles requested with "X-Profile: store".
+profile_store = ProfileStore()
+
+
+@contextmanager
+def profile_thread():
+    """
+    Sample the current thread for the duration of the block when the current request is being profiled.
+
+    The profile only samples the threads registered this way, so the threadpool workers serving
+    other requests at the same time do not end up in its flamegraph.
+    Without an active profile this is a single ContextVar lookup.
+    """
+    profile = ACTIVE_PROFILE.get()
+    if profile is None:
+        yield
+        return
+    with profile.thread():
+        yield
+
+
+@contextmanager
+def profile_phase(name: str):
+    """
+    Tag profiling samples with a phase name when the current request is being profiled.
+
+    The current thread is sampled for the duration of the phase, as with profile_thread.
+
+    Without an active profile this is a single ContextVar lookup.
+    """
+    profile = ACTIVE_PROFILE.get()
+    if profile is None:
+        yield
+        return
+    with profile.phase(name):
+        yield
+
+
+def profile_routes(routes: Iterable) -> None:
+    """
+    Sample the thread running the endpoint of a profiled request for the whole endpoint call.
+
+    Sync endpoints are sampled on their threadpool worker, async ones on the event loop
+    thread, so encoding, cache hits and validation done by the endpoint are profiled as well
+    as its database work. Must run once, after every route is registered.
+
+    Args:
+        routes (Iterable): Routes of the application; only API routes are instrumented.
+    """
+    for route in routes:
+        if isinstance(route, APIRoute):
+            # The route handler reads dependant.call on every request
+            route.dependant.call = _profiled_call(route.dependant.call)
+
+
+def _profiled_call(endpoint):
+    """Wrap an endpoint so it runs inside profile_thread, keeping it sync or async."""
+    if asyncio.iscoroutinefunction(endpoint):
+        async def call(**values):
+            with profile_thread():
+                return await endpoint(**values)
+    else:
+        def call(**values):
+            with profile_thread():
+                return endpoint(**values)
+    return call
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware that profiles requests carrying the X-Profile header.
+
+    Requests without the header are passed straight through to the application.
+    """
+
+    def __init__(self, app, interval: float = 0.001, store: ProfileStore = profile_store):
+        self.app = app
+        self.interval = interval
+        self.store = store
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        mode = dict(scope["headers"]).get(PROFILE_HEADER)
+        if mode is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(self.interval)
+        inline = mode.strip().lower() == b"inline"
+        token = ACTIVE_PROFILE.set(profile)
+        profile.start()
+        try:
+            if inline:
+                await self.app(scope, receive, _discard)
+            else:
+                await self.app(scope, receive, _with_header(send, PROFILE_ID_HEADER, profile.id.encode()))
+        finally:
+            profile.stop()
+            ACTIVE_PROFILE.reset(token)
+
+        if inline:
+            body = profile.collapsed().encode()
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode()),
+                    (PROFILE_ID_HEADER, profile.id.encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+        else:
+            self.store.add(profile)
+
+
+async def _discard(message) -> None:
+    """ASGI send callable that drops the application's response."""
+
+
+def _with_header(send, name: bytes, value: bytes):
+    """Wrap an ASGI send callable so the response start message carries an extra header."""
+    async def wrapped(message):
+        if message["type"] == "http.response.start":
+            message = dict(message)
+            message["headers"] = list(message.get("headers", [])) + [(name, value)]
+        await send(message)
+    return wrapped
+
+
+# Router exposing the stored profiles.
+router = APIRouter()
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+def get_profile(profile_id: str):
+    """
+    Retrieve a stored request profile in collapsed-stack format.
+
+    Args:
+        profile_id (str): The id returned in the X-Profile-Id response header.
+
+    Raises:
+        HTTPException: 404 if the profile is unknown or has been evicted.
+    """
+    collapsed = profile_store.get(profile_id)
+    if collapsed is None:
+        raise HTTPException(status_code=404, detail="Profile not found.")
+    return PlainTextResponse(collapsed)
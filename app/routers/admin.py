@@ -0,0 +1,63 @@
+from fastapi import APIRouter, Depends, Header, HTTPException
+from typing import Callable, List, Optional
+from app.database.connection import DatabaseManager, get_db_manager
+from app.schemas.nominations import Nomination, NominationAppendResponse
+import hmac
+import logging
+
+# Initialize the API router for administrative endpoints
+router = APIRouter()
+
+def require_admin_token(token: str) -> Callable[[Optional[str]], None]:
+    """
+    Build the dependency guarding the administrative endpoints.
+
+    Args:
+        token (str): The configured admin token (RAZZIE_ADMIN_TOKEN).
+
+    Returns:
+        Callable[[Optional[str]], None]: A dependency raising 401 unless the request carries
+            "Authorization: Bearer <token>".
+    """
+    expected = f"Bearer {token}".encode("utf-8")
+
+    def check(authorization: Optional[str] = Header(default=None)) -> None:
+        # Constant-time comparison so the token cannot be guessed from response times
+        if not authorization or not hmac.compare_digest(authorization.encode("utf-8"), expected):
+            raise HTTPException(
+                status_code=401,
+                detail="Invalid or missing admin token.",
+                headers={"WWW-Authenticate": "Bearer"}
+            )
+
+    return check
+
+@router.post("/nominations", response_model=NominationAppendResponse, status_code=201)
+def append_nominations(nominations: List[Nomination], db_manager: DatabaseManager = Depends(get_db_manager)):
+    """
+    Append a batch of nominations to the loaded dataset.
+
+    Only the producers touched by the batch are updated, and the dataset version is bumped
+    so cached interval results are invalidated.
+
+    Args:
+        nominations (List[Nomination]): The nominations to append.
+        db_manager (DatabaseManager): The database manager provided via FastAPI dependency injection.
+
+    Returns:
+        NominationAppendResponse: Number of inserted rows and the new dataset version.
+
+    Raises:
+        HTTPException: 409 if the database is not initialized, 500 if an unexpected error occurs.
+    """
+    try:
+        inserted = db_manager.append_nominations(nominations)
+
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    except Exception:
+        logging.exception("Unexpected error while appending nominations")
+        raise HTTPException(status_code=500, detail="Internal server error.")
+
+    return NominationAppendResponse(inserted=inserted, dataset_version=db_manager.dataset_version)
@@ -0,0 +1,107 @@
+from fastapi import APIRouter, Depends, HTTPException, Response
+from typing import Dict, List, Optional
+from app.database.connection import DatabaseManager, get_db_manager
+from app.database.pool import PoolTimeoutError
+from app.metrics import RESPONSE_ENCODE_DURATION
+from app.services.cache import EncodedResponse, intervals_cache
+from app.services.producer_service import IntervalQuery, calculate_producer_intervals_batch
+from app.schemas.batch import BatchRequest, BatchResponse
+from app.schemas.producers import ProducerWins
+import json
+import logging
+
+# Initialize the API router for the batch endpoint
+router = APIRouter()
+
+@router.post("/batch", response_model=BatchResponse)
+def run_batch(request: BatchRequest, db_manager: DatabaseManager = Depends(get_db_manager)):
+    """
+    Answer many producer interval and producer lookup queries in one round trip.
+
+    Interval queries are first looked up in the result cache shared with
+    GET /producers/intervals; the misses are deduplicated and answered together on a single
+    pooled cursor, sharing one scan of the intervals, and their results are cached for both
+    endpoints. Producer lookups are served from the in-memory producer index. Each result
+    carries the status the standalone endpoint would have answered, so a query without data
+    does not fail the rest of the batch.
+
+    Args:
+        request (BatchRequest): The queries to answer.
+        db_manager (DatabaseManager): The database manager provided via FastAPI dependency injection.
+
+    Returns:
+        Response: The JSON encoded BatchResponse, with one result per query in request order.
+
+    Raises:
+        HTTPException: 422 if a query is invalid, 503 if no cursor is available,
+            500 if an unexpected error occurs.
+    """
+    version = db_manager.dataset_version
+    results: List[Optional[bytes]] = [None] * len(request.queries)
+    # Cache key of every interval query missing from the cache -> positions asking for it
+    pending: Dict[tuple, List[int]] = {}
+
+    for position, query in enumerate(request.queries):
+        if query.type == "producer":
+            results[position] = _lookup_result(db_manager, query.name)
+            continue
+
+        key = ("intervals", query.top, query.bottom, query.from_year, query.to_year)
+        encoded = intervals_cache.get(version, key)
+        if encoded is None:
+            pending.setdefault(key, []).append(position)
+        else:
+            results[position] = _encoded_result(encoded)
+
+    if pending:
+        keys = list(pending)
+        try:
+            with db_manager.cursor() as db:
+                responses = calculate_producer_intervals_batch(
+                    db, [IntervalQuery(*key[1:]) for key in keys], index=db_manager.producer_index
+                )
+
+        except PoolTimeoutError:
+            logging.warning("Timed out waiting for a database cursor")
+            raise HTTPException(status_code=503, detail="Service busy, try again later.")
+
+        except Exception:
+            logging.exception("Unexpected error while running a batch")
+            raise HTTPException(status_code=500, detail="Internal server error.")
+
+        for key, response in zip(keys, responses):
+            if not response.min and not response.max:
+                result = _error_result(404, "No producer intervals found.")
+            else:
+                with RESPONSE_ENCODE_DURATION.time(endpoint="intervals"):
+                    encoded = EncodedResponse.from_model(response)
+                intervals_cache.put(version, key, encoded)
+                result = _encoded_result(encoded)
+            for position in pending[key]:
+                results[position] = result
+
+    return Response(content=b'{"results":[' + b",".join(results) + b"]}", media_type="application/json")
+
+
+def _lookup_result(db_manager: DatabaseManager, name: str) -> bytes:
+    """Encode the result of a producer lookup query."""
+    if db_manager.producer_index is None:
+        return _error_result(503, "Producer index not loaded.")
+
+    found = db_manager.producer_index.lookup(name)
+    if found is None:
+        return _error_result(404, "Producer not found.")
+
+    producer, wins = found
+    body = ProducerWins(producer=producer, wins=wins).model_dump_json().encode("utf-8")
+    return b'{"status":200,"body":' + body + b"}"
+
+
+def _encoded_result(encoded: EncodedResponse) -> bytes:
+    """Wrap a cached, pre-encoded interval response into a batch result without re-serializing it."""
+    return b'{"status":200,"body":' + encoded.body + b"}"
+
+
+def _error_result(status: int, detail: str) -> bytes:
+    """Encode a failed batch result."""
+    return json.dumps({"status": status, "detail": detail}, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,106 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from app.database.connection import DatabaseManager, get_db_manager
+from app.database.pool import PoolTimeoutError
+from app.schemas.nominations import MAX_YEAR, MIN_YEAR, NominationPage
+from app.services import nomination_service
+from app.services.nomination_service import (
+    ExpiredCursorError,
+    MalformedCursorError,
+    fetch_nominations_page,
+    iter_nominations_arrow,
+    iter_nominations_parquet,
+)
+import logging
+
+# Initialize the API router for nomination export endpoints
+router = APIRouter()
+
+# Page size bounds of the JSON export.
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 10_000
+
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+
+@router.get("/nominations", response_model=NominationPage)
+def export_nominations(
+        format: str = Query(default="json", pattern="^(json|arrow|parquet)$",
+                            description="'json' for paginated pages, 'arrow' for an Arrow IPC stream, 'parquet' for a file"),
+        from_year: Optional[int] = Query(default=None, ge=MIN_YEAR, le=MAX_YEAR, description="Only nominations from this year on"),
+        to_year: Optional[int] = Query(default=None, ge=MIN_YEAR, le=MAX_YEAR, description="Only nominations up to this year"),
+        winner: Optional[bool] = Query(default=None, description="Only winners (true) or non-winners (false)"),
+        cursor: Optional[str] = Query(default=None, description="Cursor of the next JSON page"),
+        limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="JSON page size"),
+        db_manager: DatabaseManager = Depends(get_db_manager)
+):
+    """
+    Export the raw nominations, optionally filtered by year range and winner flag.
+
+    'arrow' and 'parquet' stream the whole filtered table straight from DuckDB's columnar
+    output, without converting rows to Python objects. 'json' returns one page at a time with
+    keyset pagination: pass the returned `next_cursor` to get the following page. Cursors
+    embed the dataset version and are rejected once the data is reloaded or appended to.
+
+    Args:
+        format (str): "json" (default), "arrow" or "parquet".
+        from_year (Optional[int]): First year, inclusive.
+        to_year (Optional[int]): Last year, inclusive.
+        winner (Optional[bool]): Winner flag filter.
+        cursor (Optional[str]): Cursor of the next JSON page.
+        limit (int): JSON page size.
+        db_manager (DatabaseManager): The database manager provided via FastAPI dependency injection.
+
+    Returns:
+        NominationPage | StreamingResponse: A JSON page, or the Arrow/Parquet stream.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed, 406 if Arrow is requested without pyarrow
+            installed, 410 if the cursor is outdated, 503 if no cursor is available,
+            500 if an unexpected error occurs.
+    """
+    if format == "arrow":
+        if nomination_service.pyarrow is None:
+            raise HTTPException(status_code=406, detail="Arrow export is not available on this server.")
+        return _stream(db_manager, iter_nominations_arrow, ARROW_MEDIA_TYPE, from_year, to_year, winner)
+
+    if format == "parquet":
+        return _stream(db_manager, iter_nominations_parquet, PARQUET_MEDIA_TYPE, from_year, to_year, winner,
+                       headers={"Content-Disposition": 'attachment; filename="nominations.parquet"'})
+
+    version = db_manager.dataset_version
+    try:
+        with db_manager.cursor() as db:
+            items, next_cursor = fetch_nominations_page(db, version, limit, cursor, from_year, to_year, winner)
+
+    except MalformedCursorError as error:
+        raise HTTPException(status_code=400, detail=str(error))
+
+    except ExpiredCursorError as error:
+        raise HTTPException(status_code=410, detail=str(error))
+
+    except PoolTimeoutError:
+        logging.warning("Timed out waiting for a database cursor")
+        raise HTTPException(status_code=503, detail="Service busy, try again later.")
+
+    except Exception:
+        logging.exception("Unexpected error while exporting nominations")
+        raise HTTPException(status_code=500, detail="Internal server error.")
+
+    return NominationPage(items=items, next_cursor=next_cursor, dataset_version=version)
+
+
+def _stream(db_manager: DatabaseManager, export, media_type: str, from_year: Optional[int],
+            to_year: Optional[int], winner: Optional[bool], headers: Optional[dict] = None) -> StreamingResponse:
+    """Stream an export, holding a pooled cursor checked out before the response starts."""
+    try:
+        body = db_manager.get_pool().stream(
+            lambda db: export(db, from_year=from_year, to_year=to_year, winner=winner)
+        )
+
+    except PoolTimeoutError:
+        logging.warning("Timed out waiting for a database cursor")
+        raise HTTPException(status_code=503, detail="Service busy, try again later.")
+
+    return StreamingResponse(body, media_type=media_type, headers=headers)
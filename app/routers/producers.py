@@ -1,47 +1,235 @@
-from fastapi import APIRouter, Depends, HTTPException
-from app.database.connection import get_connection_db
-from app.services.producer_service import calculate_producer_intervals
-from app.schemas.producers import ProducerIntervalResponse
-import duckdb
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Optional, Tuple
+from app.database.connection import DatabaseManager, get_db_manager
+from app.database.pool import PoolTimeoutError
+from app.services.cache import EncodedResponse, intervals_cache
+from app.services.producer_service import calculate_producer_intervals, iter_producer_intervals
+from app.services.responses import encoded_json_response, load_encoded_response
+from app.schemas.nominations import MAX_YEAR, MIN_YEAR
+from app.schemas.producers import MAX_RANKED_INTERVALS, ProducerIntervalResponse, ProducerSearchResponse, ProducerWins
+import json
 import logging
 
 # Initialize the API router for producer-related endpoints
 router = APIRouter()
 
+# Upper bound for the number of producers returned by a prefix search.
+MAX_SEARCH_RESULTS = 100
+
 @router.get("/producers/intervals", response_model=ProducerIntervalResponse)
-def get_producers_with_intervals(db: duckdb.DuckDBPyConnection = Depends(get_connection_db)):
+def get_producers_with_intervals(
+        top: Optional[int] = Query(default=None, ge=1, le=MAX_RANKED_INTERVALS,
+                                   description="Return the K longest intervals in 'max'"),
+        bottom: Optional[int] = Query(default=None, ge=1, le=MAX_RANKED_INTERVALS,
+                                      description="Return the K shortest intervals in 'min'"),
+        from_year: Optional[int] = Query(default=None, ge=MIN_YEAR, le=MAX_YEAR,
+                                         description="Only consider wins from this year on"),
+        to_year: Optional[int] = Query(default=None, ge=MIN_YEAR, le=MAX_YEAR,
+                                       description="Only consider wins up to this year"),
+        db_manager: DatabaseManager = Depends(get_db_manager),
+        if_none_match: Optional[str] = Header(default=None),
+        accept_encoding: Optional[str] = Header(default=None)
+):
     """
     Retrieve the producers with the shortest and longest award intervals.
 
     This endpoint queries the database to find producers who have won multiple times,
-    and calculates the time intervals between their wins. If no interval data is found,
-    it returns a 404 error. If any unexpected error occurs, it returns a 500 error with
-    a generic error message.
+    and calculates the time intervals between their wins. The encoded response (plain,
+    gzip and brotli) is cached per dataset version, so repeated calls are served without
+    touching DuckDB or re-encoding JSON until the data is reloaded. A strong ETag is sent
+    and a matching If-None-Match header is answered with 304 Not Modified.
+    Concurrent cache misses for the same dataset version and parameters are coalesced
+    into one computation whose result every caller receives (X-Cache: COALESCED).
+    With `top` and/or `bottom`, the 'max' and/or 'min' lists hold the K longest and/or
+    shortest intervals of any producer instead of only the tied extremes.
+    With `from_year` and/or `to_year`, only wins inside the (inclusive) year range are
+    considered; the filter is pushed down into the DuckDB scan.
+    If no interval data is found, it returns a 404 error. If any unexpected error occurs,
+    it returns a 500 error with a generic error message.
+
+    Args:
+        top (Optional[int]): Number of longest intervals to return in 'max'.
+        bottom (Optional[int]): Number of shortest intervals to return in 'min'.
+        from_year (Optional[int]): First year of the range, inclusive.
+        to_year (Optional[int]): Last year of the range, inclusive.
+        db_manager (DatabaseManager): The database manager provided via FastAPI dependency injection.
+        if_none_match (Optional[str]): ETags already held by the client.
+        accept_encoding (Optional[str]): Content encodings accepted by the client.
+
+    Returns:
+        Response: The JSON encoded ProducerIntervalResponse, or an empty 304 response.
+
+    Raises:
+        HTTPException: 404 if no data found, 422 if the year range is inverted,
+            500 if an unexpected error occurs.
+    """
+    if from_year is not None and to_year is not None and from_year > to_year:
+        raise HTTPException(status_code=422, detail="from_year must not be greater than to_year.")
+
+    encoded, cache_status = load_encoded_intervals(db_manager, top, bottom, from_year, to_year)
+    return encoded_json_response(encoded, if_none_match, accept_encoding, cache_status)
+
+
+def load_encoded_intervals(db_manager: DatabaseManager, top: Optional[int] = None, bottom: Optional[int] = None,
+                           from_year: Optional[int] = None,
+                           to_year: Optional[int] = None) -> Tuple[EncodedResponse, str]:
+    """
+    Return the encoded producer interval response from the result cache, computing it on a miss.
+
+    Also used by the start-up warm-up to fill the cache before the first request.
+
+    Args:
+        db_manager (DatabaseManager): The database manager.
+        top (Optional[int]): Number of longest intervals to return in 'max'.
+        bottom (Optional[int]): Number of shortest intervals to return in 'min'.
+        from_year (Optional[int]): First year of the range, inclusive.
+        to_year (Optional[int]): Last year of the range, inclusive.
+
+    Returns:
+        Tuple[EncodedResponse, str]: The encoded response and its cache status
+            ("HIT", "MISS" or "COALESCED").
+
+    Raises:
+        HTTPException: 404 if no data found, 503 if no cursor is available,
+            500 if an unexpected error occurs.
+    """
+    return load_encoded_response(
+        db_manager,
+        ("intervals", top, bottom, from_year, to_year),
+        lambda db: calculate_producer_intervals(
+            db, index=db_manager.producer_index, top=top, bottom=bottom,
+            from_year=from_year, to_year=to_year
+        ),
+        endpoint="intervals",
+        not_found="No producer intervals found."
+    )
+
+
+@router.get("/producers/intervals/all")
+def stream_all_producer_intervals(
+        format: str = Query(default="ndjson", pattern="^(ndjson|json)$",
+                            description="'ndjson' for one JSON object per line, 'json' for a chunked JSON array"),
+        db_manager: DatabaseManager = Depends(get_db_manager)
+):
+    """
+    Stream every consecutive-win interval of every producer.
+
+    Rows are read from a DuckDB cursor in batches and written to the response as they
+    arrive, so the full interval list is never built in memory. The pooled cursor is checked
+    out before the response starts and held until the stream ends.
 
     Args:
-        db (duckdb.DuckDBPyConnection): A DuckDB connection instance provided via FastAPI dependency injection.
+        format (str): Output format, "ndjson" (default) or "json".
+        db_manager (DatabaseManager): The database manager provided via FastAPI dependency injection.
 
     Returns:
-        ProducerIntervalResponse: A response containing the producers with minimum and maximum intervals.
+        StreamingResponse: The intervals as NDJSON or as a JSON array.
 
     Raises:
-        HTTPException: 404 if no data found, 500 if an unexpected error occurs.
+        HTTPException: 503 if no cursor is available.
     """
+    def encode(row) -> str:
+        producer, interval, previous_win, following_win = row
+        return json.dumps({
+            "producer": producer,
+            "interval": interval,
+            "previousWin": previous_win,
+            "followingWin": following_win
+        })
+
+    def ndjson(db):
+        for batch in iter_producer_intervals(db):
+            yield "".join(encode(row) + "\n" for row in batch)
+
+    def json_array(db):
+        separator = "["
+        for batch in iter_producer_intervals(db):
+            yield separator + ",".join(encode(row) for row in batch)
+            separator = ","
+        yield "]" if separator == "," else "[]"
+
     try:
-        # Call the service function to calculate the producer intervals
-        response = calculate_producer_intervals(db)
+        # The cursor is checked out for the lifetime of the stream, not of the dependency.
+        body = db_manager.get_pool().stream(json_array if format == "json" else ndjson)
+
+    except PoolTimeoutError:
+        logging.warning("Timed out waiting for a database cursor")
+        raise HTTPException(status_code=503, detail="Service busy, try again later.")
 
-        # If both lists are empty, raise 404
-        if not response.min and not response.max:
-            raise HTTPException(status_code=404, detail="No producer intervals found.")
+    if format == "json":
+        return StreamingResponse(body, media_type="application/json")
+    return StreamingResponse(body, media_type="application/x-ndjson")
+
+
+@router.get("/producers/intervals/cache")
+def get_producers_intervals_cache_stats():
+    """
+    Retrieve the hit/miss counters of the producer intervals result cache.
+
+    Returns:
+        dict: Hits, misses, number of cached entries and the cached dataset version.
+    """
+    return intervals_cache.stats()
+
+
+@router.get("/producers", response_model=ProducerSearchResponse)
+def search_producers(
+        prefix: str = Query(min_length=1, description="Beginning of the producer name, case-insensitive"),
+        limit: int = Query(default=20, ge=1, le=MAX_SEARCH_RESULTS, description="Maximum number of producers"),
+        db_manager: DatabaseManager = Depends(get_db_manager)
+):
+    """
+    Search winning producers by name prefix.
+
+    Served from the in-memory producer index (a sorted array of case-folded names), so
+    the lookup never scans the concatenated 'producers' column in DuckDB.
+
+    Args:
+        prefix (str): Beginning of the producer name.
+        limit (int): Maximum number of producers to return.
+        db_manager (DatabaseManager): The database manager provided via FastAPI dependency injection.
+
+    Returns:
+        ProducerSearchResponse: Matching producers and their winning years, alphabetically.
+
+    Raises:
+        HTTPException: 503 if the producer index is not loaded yet.
+    """
+    index = _loaded_producer_index(db_manager)
+    return ProducerSearchResponse(producers=[
+        ProducerWins(producer=producer, wins=wins) for producer, wins in index.search(prefix, limit)
+    ])
+
+
+@router.get("/producers/{name}", response_model=ProducerWins)
+def get_producer_wins(name: str, db_manager: DatabaseManager = Depends(get_db_manager)):
+    """
+    Retrieve the winning years of a single producer.
+
+    The name is matched exactly first and then ignoring case. This route is declared
+    after the '/producers/intervals' routes so it does not shadow them.
+
+    Args:
+        name (str): Name of the producer.
+        db_manager (DatabaseManager): The database manager provided via FastAPI dependency injection.
+
+    Returns:
+        ProducerWins: The producer name and its winning years.
+
+    Raises:
+        HTTPException: 404 if the producer never won, 503 if the producer index is not loaded yet.
+    """
+    found = _loaded_producer_index(db_manager).lookup(name)
+    if found is None:
+        raise HTTPException(status_code=404, detail="Producer not found.")
 
-        return response
+    producer, wins = found
+    return ProducerWins(producer=producer, wins=wins)
 
-    except HTTPException:
-        # Let FastAPI handle explicitly raised HTTPExceptions
-        raise
 
-    except Exception as e:
-        # Log the unexpected error for debugging purposes
-        logging.exception("Unexpected error while calculating producer intervals")
-        raise HTTPException(status_code=500, detail="Internal server error.")
+def _loaded_producer_index(db_manager: DatabaseManager):
+    """Return the producer index, or raise 503 while the data is not loaded."""
+    if db_manager.producer_index is None:
+        raise HTTPException(status_code=503, detail="Producer index not loaded.")
+    return db_manager.producer_index
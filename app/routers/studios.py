@@ -0,0 +1,60 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from typing import Optional
+from app.database.connection import DatabaseManager, get_db_manager
+from app.services.responses import encoded_json_response, load_encoded_response
+from app.services.studio_service import calculate_studio_intervals
+from app.schemas.nominations import MAX_YEAR, MIN_YEAR
+from app.schemas.producers import MAX_RANKED_INTERVALS
+from app.schemas.studios import StudioIntervalResponse
+
+# Initialize the API router for studio-related endpoints
+router = APIRouter()
+
+@router.get("/studios/intervals", response_model=StudioIntervalResponse)
+def get_studios_with_intervals(
+        top: Optional[int] = Query(default=None, ge=1, le=MAX_RANKED_INTERVALS,
+                                   description="Return the K longest intervals in 'max'"),
+        bottom: Optional[int] = Query(default=None, ge=1, le=MAX_RANKED_INTERVALS,
+                                      description="Return the K shortest intervals in 'min'"),
+        from_year: Optional[int] = Query(default=None, ge=MIN_YEAR, le=MAX_YEAR,
+                                         description="Only consider wins from this year on"),
+        to_year: Optional[int] = Query(default=None, ge=MIN_YEAR, le=MAX_YEAR,
+                                       description="Only consider wins up to this year"),
+        db_manager: DatabaseManager = Depends(get_db_manager),
+        if_none_match: Optional[str] = Header(default=None),
+        accept_encoding: Optional[str] = Header(default=None)
+):
+    """
+    Retrieve the studios with the shortest and longest award intervals.
+
+    Same contract as the producer intervals endpoint, computed by the grouped interval
+    engine over the 'studios' column: cached per dataset version, served with ETag and
+    content negotiation, with optional top/bottom K and year range.
+
+    Args:
+        top (Optional[int]): Number of longest intervals to return in 'max'.
+        bottom (Optional[int]): Number of shortest intervals to return in 'min'.
+        from_year (Optional[int]): First year of the range, inclusive.
+        to_year (Optional[int]): Last year of the range, inclusive.
+        db_manager (DatabaseManager): The database manager provided via FastAPI dependency injection.
+        if_none_match (Optional[str]): ETags already held by the client.
+        accept_encoding (Optional[str]): Content encodings accepted by the client.
+
+    Returns:
+        Response: The JSON encoded StudioIntervalResponse, or an empty 304 response.
+
+    Raises:
+        HTTPException: 404 if no data found, 422 if the year range is inverted,
+            500 if an unexpected error occurs.
+    """
+    if from_year is not None and to_year is not None and from_year > to_year:
+        raise HTTPException(status_code=422, detail="from_year must not be greater than to_year.")
+
+    encoded, cache_status = load_encoded_response(
+        db_manager,
+        ("studio_intervals", top, bottom, from_year, to_year),
+        lambda db: calculate_studio_intervals(db, top=top, bottom=bottom, from_year=from_year, to_year=to_year),
+        endpoint="studio_intervals",
+        not_found="No studio intervals found."
+    )
+    return encoded_json_response(encoded, if_none_match, accept_encoding, cache_status)
@@ -0,0 +1,75 @@
+from pydantic import BaseModel, Field, model_validator
+from typing import Annotated, List, Literal, Optional, Union
+from app.schemas.nominations import MAX_YEAR, MIN_YEAR
+from app.schemas.producers import MAX_RANKED_INTERVALS, ProducerIntervalResponse, ProducerWins
+
+# Upper bound for the number of queries of a single batch.
+MAX_BATCH_QUERIES = 50
+
+class ProducerIntervalsQuery(BaseModel):
+    """
+    Producer interval query of a batch, with the parameters of GET /producers/intervals.
+
+    Attributes:
+        type (str): Always "producer_intervals".
+        top (Optional[int]): Number of longest intervals to return in 'max'.
+        bottom (Optional[int]): Number of shortest intervals to return in 'min'.
+        from_year (Optional[int]): First year of the range, inclusive.
+        to_year (Optional[int]): Last year of the range, inclusive.
+    """
+    type: Literal["producer_intervals"]
+    top: Optional[int] = Field(default=None, ge=1, le=MAX_RANKED_INTERVALS)
+    bottom: Optional[int] = Field(default=None, ge=1, le=MAX_RANKED_INTERVALS)
+    from_year: Optional[int] = Field(default=None, ge=MIN_YEAR, le=MAX_YEAR)
+    to_year: Optional[int] = Field(default=None, ge=MIN_YEAR, le=MAX_YEAR)
+
+    @model_validator(mode="after")
+    def check_year_range(self) -> "ProducerIntervalsQuery":
+        """Reject an inverted year range."""
+        if self.from_year is not None and self.to_year is not None and self.from_year > self.to_year:
+            raise ValueError("from_year must not be greater than to_year.")
+        return self
+
+class ProducerLookupQuery(BaseModel):
+    """
+    Single producer query of a batch, as GET /producers/{name}.
+
+    Attributes:
+        type (str): Always "producer".
+        name (str): Name of the producer, matched exactly first and then ignoring case.
+    """
+    type: Literal["producer"]
+    name: str = Field(min_length=1)
+
+BatchQuery = Annotated[Union[ProducerIntervalsQuery, ProducerLookupQuery], Field(discriminator="type")]
+
+class BatchRequest(BaseModel):
+    """
+    Request model of the batch endpoint.
+
+    Attributes:
+        queries (List[BatchQuery]): The queries to answer, at most MAX_BATCH_QUERIES.
+    """
+    queries: List[BatchQuery] = Field(min_length=1, max_length=MAX_BATCH_QUERIES)
+
+class BatchResult(BaseModel):
+    """
+    Result of one query of a batch.
+
+    Attributes:
+        status (int): HTTP status the standalone endpoint would have answered.
+        body (Optional[Union[ProducerIntervalResponse, ProducerWins]]): The response body on success.
+        detail (Optional[str]): The error message otherwise.
+    """
+    status: int
+    body: Optional[Union[ProducerIntervalResponse, ProducerWins]] = None
+    detail: Optional[str] = None
+
+class BatchResponse(BaseModel):
+    """
+    Response model of the batch endpoint.
+
+    Attributes:
+        results (List[BatchResult]): One result per query, in the order of the request.
+    """
+    results: List[BatchResult]
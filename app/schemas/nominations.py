@@ -0,0 +1,47 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+# Bounds of a nomination year, shared by the year filters of every query.
+MIN_YEAR = 0
+MAX_YEAR = 65535
+
+class Nomination(BaseModel):
+    """
+    Represents a single Worst Picture nomination.
+
+    Attributes:
+        year (int): Year of the award, between MIN_YEAR and MAX_YEAR like the year filters of the queries.
+        title (str): Title of the nominated movie.
+        studios (Optional[str]): Comma separated studios.
+        producers (Optional[str]): Producers separated by ',' or ' and '.
+        winner (bool): Whether the movie won the award.
+    """
+    year: int = Field(ge=MIN_YEAR, le=MAX_YEAR)
+    title: str
+    studios: Optional[str] = None
+    producers: Optional[str] = None
+    winner: bool = False
+
+class NominationAppendResponse(BaseModel):
+    """
+    Response model for an incremental nominations append.
+
+    Attributes:
+        inserted (int): Number of nominations inserted.
+        dataset_version (int): Dataset version after the append.
+    """
+    inserted: int
+    dataset_version: int
+
+class NominationPage(BaseModel):
+    """
+    One page of nominations of the JSON export.
+
+    Attributes:
+        items (List[Nomination]): Nominations of the page, in table order.
+        next_cursor (Optional[str]): Cursor of the next page, None on the last page.
+        dataset_version (int): Dataset version the page was read from.
+    """
+    items: List[Nomination]
+    next_cursor: Optional[str] = None
+    dataset_version: int
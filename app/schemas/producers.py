@@ -1,6 +1,9 @@
 from pydantic import BaseModel
 from typing import List
 
+# Upper bound for the top/bottom K parameters of the interval queries.
+MAX_RANKED_INTERVALS = 1000
+
 class ProducerInterval(BaseModel):
     """
     Represents the interval between two award wins for a producer.
@@ -26,3 +29,23 @@ class ProducerIntervalResponse(BaseModel):
     """
     min: List[ProducerInterval]
     max: List[ProducerInterval]
+
+class ProducerWins(BaseModel):
+    """
+    Winning years of a single producer.
+
+    Attributes:
+        producer (str): Name of the producer.
+        wins (List[int]): Distinct years in which the producer won, in ascending order.
+    """
+    producer: str
+    wins: List[int]
+
+class ProducerSearchResponse(BaseModel):
+    """
+    Response model for a producer prefix search.
+
+    Attributes:
+        producers (List[ProducerWins]): Matching producers in alphabetical order.
+    """
+    producers: List[ProducerWins]
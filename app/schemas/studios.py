@@ -0,0 +1,28 @@
+from pydantic import BaseModel
+from typing import List
+
+class StudioInterval(BaseModel):
+    """
+    Represents the interval between two award wins for a studio.
+
+    Attributes:
+        studio (str): Name of the studio.
+        interval (int): Number of years between two consecutive wins.
+        previousWin (int): Year of the earlier win.
+        followingWin (int): Year of the later win.
+    """
+    studio: str
+    interval: int
+    previousWin: int
+    followingWin: int
+
+class StudioIntervalResponse(BaseModel):
+    """
+    Response model containing studios with minimum and maximum award intervals.
+
+    Attributes:
+        min (List[StudioInterval]): List of studios with the shortest intervals between wins.
+        max (List[StudioInterval]): List of studios with the longest intervals between wins.
+    """
+    min: List[StudioInterval]
+    max: List[StudioInterval]
@@ -0,0 +1,287 @@
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from pydantic import BaseModel
+
+from app.metrics import REGISTRY, SINGLEFLIGHT_CALLS
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is an optional dependency
+    brotli = None
+
+# Brotli's default quality (11) is two orders of magnitude slower than quality 5
+# for a few percent smaller payloads, which makes the first request after a reload slow.
+BROTLI_QUALITY = 5
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache for computed results, keyed by dataset version.
+
+    Every entry is stored together with the dataset version it was computed from.
+    When a newer version is seen, all entries from older versions are dropped, so a
+    (re)load of the database automatically invalidates every cached result.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of entries kept for the current dataset version.
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, version: int, key: Hashable) -> Optional[Any]:
+        """
+        Retrieve a cached value for the given dataset version and key.
+
+        Args:
+            version (int): Current dataset version.
+            key (Hashable): Cache key, usually the request parameters.
+
+        Returns:
+            The cached value, or None on a miss.
+        """
+        with self._lock:
+            if version == self._version and key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, version: int, key: Hashable, value: Any) -> None:
+        """
+        Store a value computed from the given dataset version.
+
+        Values computed from a version older than the newest one seen are discarded.
+        """
+        with self._lock:
+            if self._version is not None and version < self._version:
+                return
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Return the cache counters.
+
+        Returns:
+            dict: Hits, misses, number of entries and the cached dataset version.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "version": self._version,
+            }
+
+    def render_metrics(self, name: str) -> list:
+        """
+        Render the cache counters in the Prometheus text exposition format.
+
+        Args:
+            name (str): Cache name used as the 'cache' label.
+        """
+        stats = self.stats()
+        return [
+            "# TYPE razzie_cache_hits_total counter",
+            f'razzie_cache_hits_total{{cache="{name}"}} {stats["hits"]}',
+            "# TYPE razzie_cache_misses_total counter",
+            f'razzie_cache_misses_total{{cache="{name}"}} {stats["misses"]}',
+            "# TYPE razzie_cache_entries gauge",
+            f'razzie_cache_entries{{cache="{name}"}} {stats["entries"]}',
+        ]
+
+
+class _Call:
+    """An in-flight computation and its outcome."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent computations of the same key into one.
+
+    The first caller for a key (the leader) runs the computation; callers arriving while it
+    is in flight block until it finishes and share its result or exception. Nothing is kept
+    once the computation completes, so this complements a result cache rather than replacing it.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize the coalescing group.
+
+        Args:
+            name (str): Name used as the 'flight' label of the metrics.
+        """
+        self.name = name
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, compute: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run `compute` for a key, or wait for the run already in flight.
+
+        Args:
+            key (Hashable): Identifies equivalent computations, e.g. dataset version and parameters.
+            compute (Callable[[], Any]): Computation run by the leader.
+
+        Returns:
+            Tuple[Any, bool]: The result and whether it was shared from another caller's run.
+
+        Raises:
+            Exception: Whatever `compute` raised, re-raised in every waiting caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            SINGLEFLIGHT_CALLS.inc(flight=self.name, role="collapsed")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+
+        SINGLEFLIGHT_CALLS.inc(flight=self.name, role="leader")
+        try:
+            call.value = compute()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value, False
+
+    def in_flight(self) -> int:
+        """Return the number of computations currently running."""
+        with self._lock:
+            return len(self._calls)
+
+
+@dataclass(frozen=True)
+class EncodedResponse:
+    """
+    A response body serialized once and kept in every supported content encoding.
+
+    Attributes:
+        body (bytes): The JSON encoded body.
+        gzip (bytes): The gzip compressed body.
+        br (Optional[bytes]): The brotli compressed body, None when brotli is not installed.
+        etag (str): Strong entity tag derived from the JSON body.
+    """
+    body: bytes
+    gzip: bytes
+    br: Optional[bytes]
+    etag: str
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> "EncodedResponse":
+        """
+        Serialize a pydantic model to JSON and precompute its compressed variants.
+
+        Args:
+            model (BaseModel): The response model to serialize.
+
+        Returns:
+            EncodedResponse: The encoded response.
+        """
+        body = model.model_dump_json().encode("utf-8")
+        return cls(
+            body=body,
+            gzip=gzip.compress(body, mtime=0),
+            br=brotli.compress(body, quality=BROTLI_QUALITY) if brotli else None,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+        )
+
+    def etag_for(self, encoding: Optional[str]) -> str:
+        """Return the strong ETag of the given content encoding variant."""
+        if encoding is None:
+            return self.etag
+        return f'{self.etag[:-1]}-{encoding}"'
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """
+        Check an If-None-Match header against every encoding variant of this response.
+
+        If-None-Match uses the weak comparison (RFC 9110, section 13.1.2), so a tag the client
+        sends back as W/"..." matches as well.
+
+        Args:
+            if_none_match (Optional[str]): The raw If-None-Match header value.
+
+        Returns:
+            bool: True if the client already holds the current representation.
+        """
+        if not if_none_match:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags:
+            return True
+        variants = {self.etag_for(encoding) for encoding in (None, "gzip", "br")}
+        return not tags.isdisjoint(variants)
+
+    def negotiate(self, accept_encoding: Optional[str]) -> tuple:
+        """
+        Pick the best precomputed variant for an Accept-Encoding header.
+
+        Args:
+            accept_encoding (Optional[str]): The raw Accept-Encoding header value.
+
+        Returns:
+            tuple: (content encoding or None for identity, body bytes).
+        """
+        accepted = set()
+        for part in (accept_encoding or "").split(","):
+            coding, _, params = part.strip().partition(";")
+            if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                continue
+            accepted.add(coding.strip().lower())
+
+        if self.br is not None and "br" in accepted:
+            return "br", self.br
+        if "gzip" in accepted:
+            return "gzip", self.gzip
+        return None, self.body
+
+
+# Shared cache for the producer interval results.
+intervals_cache = ResultCache()
+REGISTRY.register_collector(lambda: intervals_cache.render_metrics("intervals"))
+
+# Coalesces concurrent cold computations of the producer interval results.
+intervals_flight = SingleFlight("intervals")
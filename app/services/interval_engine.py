@@ -0,0 +1,147 @@
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import duckdb
+
+from app.metrics import interval_phase
+from app.services.tokenizer import PRODUCER_SEPARATOR, canonical_name_sql, strip_sql
+
+
+@dataclass(frozen=True)
+class Dimension:
+    """
+    A multi-valued text column of 'worst_movie_nominations' to compute win intervals for.
+
+    Attributes:
+        name (str): Name of the dimension in the results, e.g. "studios".
+        column (str): Column holding the delimited values.
+        separator (str): Regular expression separating the values, valid for both DuckDB (RE2) and Python.
+    """
+    name: str
+    column: str
+    separator: str
+
+
+PRODUCERS = Dimension("producers", "producers", PRODUCER_SEPARATOR)
+STUDIOS = Dimension("studios", "studios", r",")
+
+ENGINE_GROUPED = "grouped"
+
+
+class IntervalSelection(NamedTuple):
+    """
+    Selected gaps of one dimension, as (name, interval, previous_win, following_win) tuples.
+
+    Attributes:
+        min (List[Tuple[str, int, int, int]]): The shortest gaps.
+        max (List[Tuple[str, int, int, int]]): The longest gaps.
+    """
+    min: List[Tuple[str, int, int, int]]
+    max: List[Tuple[str, int, int, int]]
+
+
+# Splits every dimension of the winning rows in the same scan, canonicalizes the names like
+# the tokenizer, computes the consecutive-win gaps per (dimension, name) and ranks them
+# within each dimension.
+GROUPED_INTERVALS_SQL = r"""
+    WITH entries AS (
+        SELECT year, unnest([{entries}]) AS entry
+        FROM worst_movie_nominations
+        WHERE winner = TRUE AND year IS NOT NULL{year_filter}
+    ),
+    wins AS (
+        SELECT DISTINCT dimension, min(name) OVER (PARTITION BY dimension, lower(name)) AS name, year
+        FROM (
+            SELECT year, dimension, """ + canonical_name_sql("raw.name") + r""" AS name
+            FROM (
+                SELECT year, entry.dimension AS dimension, """ + strip_sql("unnest(entry.names)") + r""" AS name
+                FROM entries
+            ) AS raw
+        ) AS split
+        WHERE name <> ''
+    ),
+    gaps AS (
+        SELECT dimension, name,
+               year - lag(year) OVER by_name AS interval,
+               lag(year) OVER by_name AS previous_win,
+               year AS following_win
+        FROM wins
+        WINDOW by_name AS (PARTITION BY dimension, name ORDER BY year)
+    ),
+    ranked AS (
+        SELECT *,
+               min(interval) OVER by_dimension AS min_interval,
+               max(interval) OVER by_dimension AS max_interval,
+               row_number() OVER (PARTITION BY dimension ORDER BY interval, name, previous_win) AS shortest_rank,
+               row_number() OVER (PARTITION BY dimension ORDER BY interval DESC, name, previous_win) AS longest_rank
+        FROM gaps
+        WHERE previous_win IS NOT NULL
+        WINDOW by_dimension AS (PARTITION BY dimension)
+    )
+    SELECT 'min' AS kind, dimension, name, interval, previous_win, following_win, shortest_rank AS position
+    FROM ranked WHERE {min_predicate}
+    UNION ALL
+    SELECT 'max' AS kind, dimension, name, interval, previous_win, following_win, longest_rank AS position
+    FROM ranked WHERE {max_predicate}
+    ORDER BY dimension, kind DESC, position;
+"""
+
+
+def calculate_grouped_intervals(db: duckdb.DuckDBPyConnection, dimensions: Sequence[Dimension],
+                                top: Optional[int] = None, bottom: Optional[int] = None,
+                                from_year: Optional[int] = None,
+                                to_year: Optional[int] = None) -> Dict[str, IntervalSelection]:
+    """
+    Compute the shortest and longest win intervals of several dimensions in one table scan.
+
+    Each dimension column is split on its separator inside DuckDB, the values of every
+    dimension are unnested from the same pass over the winning rows, and only the selected
+    gaps are returned to Python.
+
+    Args:
+        db (duckdb.DuckDBPyConnection): Active DuckDB connection.
+        dimensions (Sequence[Dimension]): Dimensions to compute, e.g. [PRODUCERS, STUDIOS].
+        top (Optional[int]): If given, 'max' holds the `top` longest gaps instead of the ties.
+        bottom (Optional[int]): If given, 'min' holds the `bottom` shortest gaps instead of the ties.
+        from_year (Optional[int]): Only consider wins from this year on (inclusive).
+        to_year (Optional[int]): Only consider wins up to this year (inclusive).
+
+    Returns:
+        Dict[str, IntervalSelection]: The selection of every dimension, keyed by dimension name.
+
+    Raises:
+        ValueError: If no dimension is given.
+    """
+    if not dimensions:
+        raise ValueError("At least one dimension is required")
+
+    entries = ", ".join(
+        f"{{'dimension': '{dimension.name}', "
+        f"'names': regexp_split_to_array({dimension.column}, '{_quote(dimension.separator)}')}}"
+        for dimension in dimensions
+    )
+    year_filter = ""
+    if from_year is not None:
+        year_filter += f" AND year >= {int(from_year)}"
+    if to_year is not None:
+        year_filter += f" AND year <= {int(to_year)}"
+
+    query = GROUPED_INTERVALS_SQL.format(
+        entries=entries,
+        year_filter=year_filter,
+        min_predicate=f"shortest_rank <= {int(bottom)}" if bottom else "interval = min_interval",
+        max_predicate=f"longest_rank <= {int(top)}" if top else "interval = max_interval",
+    )
+
+    with interval_phase(ENGINE_GROUPED, "query"):
+        rows = db.execute(query).fetchall()
+
+    results = {dimension.name: IntervalSelection(min=[], max=[]) for dimension in dimensions}
+    for kind, dimension, name, interval, previous_win, following_win, _ in rows:
+        getattr(results[dimension], kind).append((name, interval, previous_win, following_win))
+    return results
+
+
+def _quote(value: str) -> str:
+    """Escape a value for use inside a single-quoted SQL literal."""
+    return value.replace("'", "''")
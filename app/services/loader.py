@@ -0,0 +1,103 @@
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from app.database.connection import DatabaseManager
+
+# Loader states, in the order they are normally reached.
+STATE_PENDING = "pending"
+STATE_LOADING = "loading"
+STATE_WARMING_UP = "warming_up"
+STATE_READY = "ready"
+STATE_FAILED = "failed"
+
+
+class DataLoader:
+    """
+    Loads the dataset and warms the caches, tracking progress for the health endpoints.
+
+    The load runs off the event loop, so the application answers liveness probes while a
+    large file is being ingested. Queries are accepted once the data is loaded; readiness
+    is only reported after the optional warm-up step has also finished.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, warm_up: Optional[Callable[[], None]] = None):
+        """
+        Initialize the loader.
+
+        Args:
+            db_manager (DatabaseManager): The database manager to initialize.
+            warm_up (Optional[Callable[[], None]]): Step run after the load, e.g. precomputing responses.
+        """
+        self.db_manager = db_manager
+        self.warm_up = warm_up
+        self.state = STATE_PENDING
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self.warm_up_seconds: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """
+        Report the load as started before run() is scheduled.
+
+        Requests arriving between the server start and the first step of the load thread are
+        then refused instead of reaching tables that do not exist yet.
+        """
+        self.state = STATE_LOADING
+
+    def run(self) -> None:
+        """
+        Initialize the database and run the warm-up step.
+
+        A failed load leaves the loader in the "failed" state and re-raises the error;
+        a failed warm-up is logged and does not prevent serving requests.
+        """
+        with self._lock:
+            self.state = STATE_LOADING
+            started = time.perf_counter()
+            try:
+                self.db_manager.initialize_database()
+            except Exception as error:
+                self.state = STATE_FAILED
+                self.error = str(error)
+                logging.exception("Failed to load the dataset")
+                raise
+            self.load_seconds = time.perf_counter() - started
+
+            if self.warm_up is not None:
+                self.state = STATE_WARMING_UP
+                started = time.perf_counter()
+                try:
+                    self.warm_up()
+                except Exception:
+                    logging.exception("Warm-up failed, serving with cold caches")
+                self.warm_up_seconds = time.perf_counter() - started
+
+            self.state = STATE_READY
+
+    @property
+    def ready(self) -> bool:
+        """Whether the data is loaded and the warm-up has finished."""
+        return self.state == STATE_READY
+
+    @property
+    def blocking_queries(self) -> bool:
+        """Whether data endpoints must be refused because the data is being loaded or failed to load."""
+        return self.state in (STATE_LOADING, STATE_FAILED)
+
+    def status(self) -> dict:
+        """
+        Return the loader progress.
+
+        Returns:
+            dict: State, dataset version, load and warm-up durations, and the load error if any.
+        """
+        return {
+            "status": self.state,
+            "dataset_version": self.db_manager.dataset_version,
+            "load_seconds": self.load_seconds,
+            "warm_up_seconds": self.warm_up_seconds,
+            "error": self.error,
+        }
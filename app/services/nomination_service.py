@@ -0,0 +1,207 @@
+import base64
+import json
+import os
+import tempfile
+from typing import Iterator, List, Optional, Tuple
+
+import duckdb
+
+from app.schemas.nominations import Nomination
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover - pyarrow is an optional dependency
+    pyarrow = None
+
+# Columns exported by the nominations endpoints, in table order.
+NOMINATION_COLUMNS = "year, title, studios, producers, winner"
+
+# Rows per Arrow record batch and bytes per Parquet chunk written to the response.
+EXPORT_BATCH_SIZE = 65_536
+EXPORT_CHUNK_BYTES = 1024 * 1024
+
+# End-of-stream marker of the Arrow IPC streaming format.
+ARROW_EOS = b"\xff\xff\xff\xff\x00\x00\x00\x00"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be used."""
+
+
+class MalformedCursorError(InvalidCursorError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class ExpiredCursorError(InvalidCursorError):
+    """Raised when a pagination cursor belongs to another dataset version."""
+
+
+def encode_cursor(version: int, rowid: int) -> str:
+    """
+    Build an opaque pagination cursor.
+
+    Args:
+        version (int): Dataset version the page was read from.
+        rowid (int): Row id of the last row of the page.
+
+    Returns:
+        str: URL-safe cursor token.
+    """
+    payload = json.dumps({"v": version, "r": rowid}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, version: int) -> int:
+    """
+    Read the last row id from a pagination cursor.
+
+    Args:
+        token (str): Cursor returned by a previous page.
+        version (int): Current dataset version.
+
+    Returns:
+        int: Row id after which the next page starts.
+
+    Raises:
+        MalformedCursorError: If the token cannot be decoded.
+        ExpiredCursorError: If the dataset was reloaded or changed since it was issued.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        cursor_version, rowid = int(payload["v"]), int(payload["r"])
+    except (ValueError, KeyError, TypeError) as error:
+        raise MalformedCursorError("Malformed cursor.") from error
+    if cursor_version != version:
+        raise ExpiredCursorError("The dataset changed since this cursor was issued, restart the pagination.")
+    return rowid
+
+
+def _nomination_filter(from_year: Optional[int], to_year: Optional[int], winner: Optional[bool]) -> Tuple[str, list]:
+    """Build the WHERE clause and parameters of the nomination filters."""
+    conditions, params = ["TRUE"], []
+    if from_year is not None:
+        conditions.append("year >= ?")
+        params.append(from_year)
+    if to_year is not None:
+        conditions.append("year <= ?")
+        params.append(to_year)
+    if winner is not None:
+        conditions.append("winner = ?")
+        params.append(winner)
+    return " AND ".join(conditions), params
+
+
+def fetch_nominations_page(db: duckdb.DuckDBPyConnection, version: int, limit: int, cursor: Optional[str] = None,
+                           from_year: Optional[int] = None, to_year: Optional[int] = None,
+                           winner: Optional[bool] = None) -> Tuple[List[Nomination], Optional[str]]:
+    """
+    Read one page of nominations with keyset pagination on the table row id.
+
+    Each page starts right after the last row id of the previous one, so its cost does not
+    grow with the page number the way OFFSET does.
+
+    Args:
+        db (duckdb.DuckDBPyConnection): Active DuckDB connection.
+        version (int): Current dataset version, embedded in the returned cursor.
+        limit (int): Maximum number of nominations in the page.
+        cursor (Optional[str]): Cursor of the previous page, None for the first page.
+        from_year (Optional[int]): Only nominations from this year on.
+        to_year (Optional[int]): Only nominations up to this year.
+        winner (Optional[bool]): Only winners (True) or only non-winners (False).
+
+    Returns:
+        Tuple[List[Nomination], Optional[str]]: The page and the cursor of the next page, None on the last page.
+
+    Raises:
+        MalformedCursorError: If the cursor cannot be decoded.
+        ExpiredCursorError: If the cursor is outdated.
+    """
+    where, params = _nomination_filter(from_year, to_year, winner)
+    if cursor is not None:
+        where += " AND rowid > ?"
+        params.append(decode_cursor(cursor, version))
+
+    rows = db.execute(f"""
+        SELECT rowid, {NOMINATION_COLUMNS}
+        FROM worst_movie_nominations
+        WHERE {where}
+        ORDER BY rowid
+        LIMIT ?;
+    """, params + [limit + 1]).fetchall()
+
+    next_cursor = encode_cursor(version, rows[limit - 1][0]) if len(rows) > limit else None
+    return [
+        Nomination(year=year, title=title, studios=studios, producers=producers, winner=won)
+        for _, year, title, studios, producers, won in rows[:limit]
+    ], next_cursor
+
+
+def iter_nominations_arrow(db: duckdb.DuckDBPyConnection, from_year: Optional[int] = None,
+                           to_year: Optional[int] = None, winner: Optional[bool] = None,
+                           batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    """
+    Stream nominations in the Arrow IPC streaming format.
+
+    DuckDB produces Arrow record batches directly from its vectors, and every batch is
+    written out as an IPC message as soon as it is read, without converting rows to Python.
+
+    Args:
+        db (duckdb.DuckDBPyConnection): Active DuckDB connection.
+        from_year (Optional[int]): Only nominations from this year on.
+        to_year (Optional[int]): Only nominations up to this year.
+        winner (Optional[bool]): Only winners (True) or only non-winners (False).
+        batch_size (int): Rows per record batch.
+
+    Yields:
+        bytes: The schema message, one message per record batch, then the end-of-stream marker.
+
+    Raises:
+        RuntimeError: If pyarrow is not installed.
+    """
+    if pyarrow is None:
+        raise RuntimeError("Arrow export requires the optional 'pyarrow' package.")
+
+    where, params = _nomination_filter(from_year, to_year, winner)
+    reader = db.execute(
+        f"SELECT {NOMINATION_COLUMNS} FROM worst_movie_nominations WHERE {where};", params
+    ).fetch_record_batch(batch_size)
+
+    yield reader.schema.serialize().to_pybytes()
+    for batch in reader:
+        yield batch.serialize().to_pybytes()
+    yield ARROW_EOS
+
+
+def iter_nominations_parquet(db: duckdb.DuckDBPyConnection, from_year: Optional[int] = None,
+                             to_year: Optional[int] = None, winner: Optional[bool] = None,
+                             chunk_size: int = EXPORT_CHUNK_BYTES) -> Iterator[bytes]:
+    """
+    Stream nominations as a Parquet file.
+
+    Parquet needs its footer written last, so DuckDB's native writer exports the rows to a
+    temporary file that is then streamed in chunks and removed.
+
+    Args:
+        db (duckdb.DuckDBPyConnection): Active DuckDB connection.
+        from_year (Optional[int]): Only nominations from this year on.
+        to_year (Optional[int]): Only nominations up to this year.
+        winner (Optional[bool]): Only winners (True) or only non-winners (False).
+        chunk_size (int): Bytes per yielded chunk.
+
+    Yields:
+        bytes: Consecutive chunks of the Parquet file.
+    """
+    where, params = _nomination_filter(from_year, to_year, winner)
+    handle, path = tempfile.mkstemp(suffix=".parquet")
+    os.close(handle)
+    try:
+        db.execute(
+            f"COPY (SELECT {NOMINATION_COLUMNS} FROM worst_movie_nominations WHERE {where}) "
+            f"TO '{path}' (FORMAT parquet, COMPRESSION zstd);",
+            params
+        )
+        with open(path, "rb") as exported:
+            for chunk in iter(lambda: exported.read(chunk_size), b""):
+                yield chunk
+    finally:
+        os.remove(path)
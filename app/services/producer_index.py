@@ -0,0 +1,240 @@
+import heapq
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.schemas.producers import ProducerInterval, ProducerIntervalResponse
+
+
+class ProducerIndex:
+    """
+    In-memory index of producer wins with incrementally maintained intervals.
+
+    Keeps, for every producer, a sorted array of distinct winning years, and groups every
+    consecutive-win gap by its length. Adding a win only touches the producer it belongs to:
+    at most one gap is split in two, so the global min and max interval sets stay current
+    without recomputing every producer.
+
+    Producer names are interned and also kept in an array sorted by their case-folded form,
+    so exact lookups are a dict hit and prefix searches are a binary search plus a short scan.
+
+    Appends and reads may run on different threads, so every public method holds the index
+    lock: a response is always built from one consistent state of the gaps.
+    """
+
+    def __init__(self):
+        self._years: Dict[str, array] = {}
+        # Case-folded names and the original names, both in case-folded order.
+        self._keys: List[str] = []
+        self._names: List[str] = []
+        # interval length -> {(producer, previous_win, following_win)}
+        self._intervals: Dict[int, Set[Tuple[str, int, int]]] = defaultdict(set)
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_wins(cls, wins: Iterable[Tuple[str, int]]) -> "ProducerIndex":
+        """
+        Build an index from (producer, year) pairs.
+
+        Args:
+            wins (Iterable[Tuple[str, int]]): Winning producer and year pairs, in any order.
+
+        Returns:
+            ProducerIndex: The populated index.
+        """
+        index = cls()
+        for producer, year in wins:
+            index._add_year(producer, year)
+        # Sort the name array once instead of inserting every new producer in order.
+        entries = sorted((name.casefold(), name) for name in index._years)
+        index._keys = [key for key, _ in entries]
+        index._names = [name for _, name in entries]
+        return index
+
+    def add_win(self, producer: str, year: int) -> bool:
+        """
+        Record a win for a producer and update the affected intervals.
+
+        Args:
+            producer (str): Name of the producer.
+            year (int): Winning year.
+
+        Returns:
+            bool: False if the producer already had a win in that year, True otherwise.
+        """
+        with self._lock:
+            if producer not in self._years:
+                key = producer.casefold()
+                position = bisect_left(self._keys, key)
+                self._keys.insert(position, key)
+                self._names.insert(position, sys.intern(producer))
+            return self._add_year(producer, year)
+
+    def rename(self, producer: str, new_name: str) -> None:
+        """
+        Report a producer under another spelling, keeping its wins and gaps.
+
+        Args:
+            producer (str): Current name of the producer. Unknown names are ignored.
+            new_name (str): New name, equal to the current one ignoring case.
+        """
+        with self._lock:
+            years = self._years.pop(producer, None)
+            if years is None:
+                return
+            self._years[sys.intern(new_name)] = years
+
+            position = bisect_left(self._keys, producer.casefold())
+            while self._names[position] != producer:
+                position += 1
+            del self._keys[position], self._names[position]
+            key = new_name.casefold()
+            position = bisect_left(self._keys, key)
+            self._keys.insert(position, key)
+            self._names.insert(position, sys.intern(new_name))
+
+            for previous_win, following_win in zip(years, years[1:]):
+                bucket = self._intervals[following_win - previous_win]
+                bucket.discard((producer, previous_win, following_win))
+                bucket.add((new_name, previous_win, following_win))
+
+    def _add_year(self, producer: str, year: int) -> bool:
+        """Insert a winning year and split or create the affected gaps."""
+        years = self._years.get(producer)
+        if years is None:
+            years = self._years[sys.intern(producer)] = array('H')
+        position = bisect_left(years, year)
+        if position < len(years) and years[position] == year:
+            return False
+
+        previous_win = years[position - 1] if position > 0 else None
+        following_win = years[position] if position < len(years) else None
+
+        if previous_win is not None and following_win is not None:
+            self._remove_interval(producer, previous_win, following_win)
+        if previous_win is not None:
+            self._intervals[year - previous_win].add((producer, previous_win, year))
+        if following_win is not None:
+            self._intervals[following_win - year].add((producer, year, following_win))
+
+        years.insert(position, year)
+        return True
+
+    def _remove_interval(self, producer: str, previous_win: int, following_win: int) -> None:
+        """Drop a gap that has been split by a new win."""
+        interval = following_win - previous_win
+        bucket = self._intervals.get(interval)
+        if bucket is None:
+            return
+        bucket.discard((producer, previous_win, following_win))
+        if not bucket:
+            del self._intervals[interval]
+
+    def years(self, producer: str) -> List[int]:
+        """Return the sorted winning years of a producer (empty if unknown)."""
+        with self._lock:
+            return list(self._years.get(producer, ()))
+
+    def lookup(self, name: str) -> Optional[Tuple[str, List[int]]]:
+        """
+        Find a producer by name, exactly or ignoring case.
+
+        Args:
+            name (str): Name of the producer.
+
+        Returns:
+            Optional[Tuple[str, List[int]]]: The stored producer name and its winning years,
+                or None if no producer matches.
+        """
+        with self._lock:
+            years = self._years.get(name)
+            if years is not None:
+                return name, list(years)
+
+            key = name.casefold()
+            position = bisect_left(self._keys, key)
+            if position < len(self._keys) and self._keys[position] == key:
+                producer = self._names[position]
+                return producer, list(self._years[producer])
+            return None
+
+    def search(self, prefix: str, limit: int) -> List[Tuple[str, List[int]]]:
+        """
+        Find producers whose name starts with a prefix, ignoring case.
+
+        Args:
+            prefix (str): Beginning of the producer name.
+            limit (int): Maximum number of producers to return.
+
+        Returns:
+            List[Tuple[str, List[int]]]: Producer names and winning years, in alphabetical order.
+        """
+        key = prefix.casefold()
+        with self._lock:
+            position = bisect_left(self._keys, key)
+            matches = []
+            while position < len(self._keys) and len(matches) < limit and self._keys[position].startswith(key):
+                producer = self._names[position]
+                matches.append((producer, list(self._years[producer])))
+                position += 1
+            return matches
+
+    def __len__(self) -> int:
+        """Return the number of producers with at least one win."""
+        with self._lock:
+            return len(self._years)
+
+    def to_response(self, top: Optional[int] = None, bottom: Optional[int] = None) -> ProducerIntervalResponse:
+        """
+        Build the min/max interval response from the current state of the index.
+
+        Args:
+            top (Optional[int]): If given, 'max' holds the `top` longest intervals instead of the ties.
+            bottom (Optional[int]): If given, 'min' holds the `bottom` shortest intervals instead of the ties.
+
+        Returns:
+            ProducerIntervalResponse: Producers with the shortest and longest intervals.
+        """
+        with self._lock:
+            if not self._intervals:
+                return ProducerIntervalResponse(min=[], max=[])
+
+            return ProducerIntervalResponse(
+                min=self._select(bottom, reverse=False) if bottom else self._bucket(min(self._intervals)),
+                max=self._select(top, reverse=True) if top else self._bucket(max(self._intervals)),
+            )
+
+    def _select(self, k: int, reverse: bool) -> List[ProducerInterval]:
+        """
+        Select the k shortest (or longest) intervals.
+
+        Interval lengths are visited in order and each bucket is reduced with a heap,
+        so only k entries are ever sorted.
+        """
+        selected = []
+        for interval in sorted(self._intervals, reverse=reverse):
+            for producer, previous_win, following_win in heapq.nsmallest(k - len(selected), self._intervals.get(interval, ())):
+                selected.append(ProducerInterval(
+                    producer=producer,
+                    interval=interval,
+                    previousWin=previous_win,
+                    followingWin=following_win
+                ))
+            if len(selected) >= k:
+                break
+        return selected
+
+    def _bucket(self, interval: int) -> List[ProducerInterval]:
+        """Return every gap of the given length, ordered by producer and year."""
+        return [
+            ProducerInterval(
+                producer=producer,
+                interval=interval,
+                previousWin=previous_win,
+                followingWin=following_win
+            )
+            for producer, previous_win, following_win in sorted(self._intervals.get(interval, ()))
+        ]
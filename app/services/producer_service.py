@@ -1,11 +1,173 @@
+from array import array
 from collections import defaultdict
-from typing import List
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
 import duckdb
-import re
+import heapq
+from app.metrics import interval_phase
 from app.schemas.producers import ProducerInterval, ProducerIntervalResponse
+from app.services.producer_index import ProducerIndex
+from app.services.tokenizer import canonical_name_sql, producer_tokenizer, strip_sql
 
+# Available engines for the interval calculation.
+# "sql" runs the whole pipeline inside DuckDB and only returns the min/max rows,
+# "bridge" reads the 'producer_intervals' table materialized at ingest,
+# "python" fetches every winning row and computes the intervals in Python,
+# "index" answers from the incrementally maintained in-memory ProducerIndex,
+# "auto" picks "index" when an index is given and no year range is requested, then
+# "bridge" when 'producer_intervals' exists and "sql" otherwise.
+ENGINE_AUTO = "auto"
+ENGINE_SQL = "sql"
+ENGINE_BRIDGE = "bridge"
+ENGINE_PYTHON = "python"
+ENGINE_INDEX = "index"
 
-def calculate_producer_intervals(db: duckdb.DuckDBPyConnection) -> ProducerIntervalResponse:
+# Winning (producer, year) pairs parsed from the free-text producers column, canonicalized
+# like the tokenizer: names differing only in case or spacing are one producer, reported
+# under its smallest spelling. The year filter is applied in the scan, before the string split.
+RAW_WINS_SQL = r"""
+    SELECT DISTINCT min(producer) OVER (PARTITION BY lower(producer)) AS producer, year
+    FROM (
+        SELECT year, """ + canonical_name_sql("raw.producer") + r""" AS producer
+        FROM (
+            SELECT year, """ + strip_sql(r"unnest(regexp_split_to_array(producers, ',|\s+and\s+'))") + r""" AS producer
+            FROM worst_movie_nominations
+            WHERE winner = TRUE AND year IS NOT NULL AND producers IS NOT NULL AND producers <> ''{year_filter}
+        ) AS raw
+    ) AS split
+    WHERE producer <> ''
+"""
+
+# Consecutive-win gaps per producer computed with a LAG() window over the parsed wins.
+RAW_INTERVALS_SQL = """
+    SELECT producer, interval, previous_win, following_win
+    FROM (
+        SELECT producer,
+               year - lag(year) OVER (PARTITION BY producer ORDER BY year) AS interval,
+               lag(year) OVER (PARTITION BY producer ORDER BY year) AS previous_win,
+               year AS following_win
+        FROM ({wins}) AS wins
+    ) AS gaps
+    WHERE previous_win IS NOT NULL
+"""
+
+# Consecutive-win gaps read from the 'producer_intervals' table materialized at ingest.
+# The table is stored ordered by previous_win, so year filters prune row groups by zone map.
+MATERIALIZED_INTERVALS_SQL = """
+    SELECT producer, interval, previous_win, following_win
+    FROM producer_intervals
+    WHERE TRUE{year_filter}
+"""
+
+# Min/max selection over every interval, in a single DuckDB query.
+INTERVALS_SQL = """
+    WITH intervals AS ({intervals}),
+    ranked AS (
+        SELECT *,
+               min(interval) OVER () AS min_interval,
+               max(interval) OVER () AS max_interval
+        FROM intervals
+    )
+    SELECT 'min' AS kind, producer, interval, previous_win, following_win
+    FROM ranked WHERE interval = min_interval
+    UNION ALL
+    SELECT 'max' AS kind, producer, interval, previous_win, following_win
+    FROM ranked WHERE interval = max_interval
+    ORDER BY kind DESC, producer, previous_win;
+"""
+
+# K shortest or longest intervals. ORDER BY ... LIMIT runs as a heap-based Top-N in DuckDB.
+RANKED_INTERVALS_SQL = """
+    WITH intervals AS ({intervals})
+    SELECT producer, interval, previous_win, following_win
+    FROM intervals
+    ORDER BY interval {direction}, producer, previous_win
+    LIMIT {limit};
+"""
+
+# Min/max ties and top/bottom K of several queries in one scan of the intervals. Each interval
+# is joined to every query whose year range holds it; per query, one aggregation finds the
+# min/max interval and keeps the K shortest and longest gaps with bounded top-N min_by lists.
+BATCH_INTERVALS_SQL = """
+    WITH queries(query_id, top, bottom, from_year, to_year) AS (VALUES {queries}),
+    intervals AS ({intervals}),
+    matched AS MATERIALIZED (
+        SELECT q.query_id, q.top, q.bottom, i.producer, i.interval, i.previous_win, i.following_win
+        FROM intervals AS i
+        JOIN queries AS q
+          ON (q.from_year IS NULL OR i.previous_win >= q.from_year)
+         AND (q.to_year IS NULL OR i.following_win <= q.to_year)
+    ),
+    bounds AS (
+        SELECT query_id,
+               min(interval) AS min_interval,
+               max(interval) AS max_interval,
+               min_by(gap, {{'interval': interval, 'producer': producer, 'previous_win': previous_win}}, {limit}) AS shortest,
+               min_by(gap, {{'interval': -interval, 'producer': producer, 'previous_win': previous_win}}, {limit}) AS longest
+        FROM (
+            SELECT *, {{'producer': producer, 'interval': interval,
+                        'previous_win': previous_win, 'following_win': following_win}} AS gap
+            FROM matched
+        ) AS gaps
+        GROUP BY query_id
+    ),
+    ties AS (
+        SELECT m.query_id, 'min' AS kind, m.producer, m.interval, m.previous_win, m.following_win
+        FROM matched AS m JOIN bounds AS b USING (query_id)
+        WHERE m.bottom IS NULL AND m.interval = b.min_interval
+        UNION ALL
+        SELECT m.query_id, 'max' AS kind, m.producer, m.interval, m.previous_win, m.following_win
+        FROM matched AS m JOIN bounds AS b USING (query_id)
+        WHERE m.top IS NULL AND m.interval = b.max_interval
+    ),
+    top_n AS (
+        SELECT query_id, kind, unnest(gaps) AS gap, generate_subscripts(gaps, 1) AS position
+        FROM (
+            SELECT b.query_id, 'min' AS kind, b.shortest[1:q.bottom] AS gaps
+            FROM bounds AS b JOIN queries AS q USING (query_id) WHERE q.bottom IS NOT NULL
+            UNION ALL
+            SELECT b.query_id, 'max' AS kind, b.longest[1:q.top] AS gaps
+            FROM bounds AS b JOIN queries AS q USING (query_id) WHERE q.top IS NOT NULL
+        ) AS lists
+    )
+    SELECT query_id, kind, producer, interval, previous_win, following_win, 0 AS position
+    FROM ties
+    UNION ALL
+    SELECT query_id, kind, gap.producer, gap.interval, gap.previous_win, gap.following_win, position
+    FROM top_n
+    ORDER BY query_id, kind DESC, position, producer, previous_win;
+"""
+
+# Every interval, for streaming.
+ALL_INTERVALS_SQL = """
+    WITH intervals AS ({intervals})
+    SELECT producer, interval, previous_win, following_win
+    FROM intervals
+    ORDER BY producer, previous_win;
+"""
+
+# Number of rows fetched from DuckDB at a time when streaming intervals.
+STREAM_BATCH_SIZE = 10_000
+
+
+def split_producers(producers_str: str) -> List[str]:
+    """
+    Split a producers string by comma or ' and ' into canonical, deduplicated producer names.
+
+    Parsing is memoized by the shared producer tokenizer, so each distinct string is only split once.
+
+    Args:
+        producers_str (str): Free-text producers column value.
+
+    Returns:
+        List[str]: The individual producer names, in order of appearance.
+    """
+    return list(producer_tokenizer.split(producers_str))
+
+
+def calculate_producer_intervals(db: duckdb.DuckDBPyConnection, engine: str = ENGINE_AUTO,
+                                 index: Optional[ProducerIndex] = None, top: Optional[int] = None,
+                                 bottom: Optional[int] = None, from_year: Optional[int] = None,
+                                 to_year: Optional[int] = None) -> ProducerIntervalResponse:
     """
     Calculate the shortest and longest award intervals for producers.
 
@@ -16,53 +178,326 @@ def calculate_producer_intervals(db: duckdb.DuckDBPyConnection) -> ProducerInter
 
     Args:
         db (duckdb.DuckDBPyConnection): A DuckDB connection instance.
+        engine (str): Calculation engine: ENGINE_AUTO (default), ENGINE_SQL, ENGINE_BRIDGE,
+            ENGINE_PYTHON or ENGINE_INDEX.
+        index (Optional[ProducerIndex]): In-memory index used by ENGINE_INDEX.
+        top (Optional[int]): If given, 'max' lists the `top` longest intervals of any producer
+            instead of only the ones tied for the maximum.
+        bottom (Optional[int]): If given, 'min' lists the `bottom` shortest intervals of any producer
+            instead of only the ones tied for the minimum.
+        from_year (Optional[int]): Only consider wins from this year on (inclusive).
+        to_year (Optional[int]): Only consider wins up to this year (inclusive).
 
     Returns:
         ProducerIntervalResponse: A response model containing lists of producers with the
         shortest and longest intervals between awards.
+
+    Raises:
+        ValueError: If an unknown engine is requested, ENGINE_INDEX without an index,
+            or ENGINE_INDEX with a year range.
+    """
+    year_range = from_year is not None or to_year is not None
+
+    if engine == ENGINE_AUTO:
+        if index is not None and not year_range:
+            engine = ENGINE_INDEX
+        else:
+            engine = ENGINE_BRIDGE if _has_materialized_intervals(db) else ENGINE_SQL
+
+    if engine == ENGINE_INDEX:
+        if index is None:
+            raise ValueError("The index engine requires a ProducerIndex")
+        if year_range:
+            raise ValueError("The index engine does not support year ranges")
+        with interval_phase(ENGINE_INDEX, "build_models"):
+            return index.to_response(top=top, bottom=bottom)
+
+    if engine in (ENGINE_SQL, ENGINE_BRIDGE):
+        intervals_sql = _intervals_source(engine, from_year, to_year)
+        return _calculate_intervals_sql(db, intervals_sql, engine, top, bottom)
+    if engine == ENGINE_PYTHON:
+        return _calculate_intervals_python(db, top, bottom, from_year, to_year)
+    raise ValueError(f"Unknown interval engine: '{engine}'")
+
+
+def iter_producer_intervals(db: duckdb.DuckDBPyConnection,
+                            batch_size: int = STREAM_BATCH_SIZE) -> Iterator[List[Tuple[str, int, int, int]]]:
     """
-    query = """
-        SELECT year, producers 
-        FROM worst_movie_nominations 
-        WHERE winner = TRUE AND producers IS NOT NULL AND producers <> '';
+    Stream every producer interval straight from a DuckDB cursor, in batches.
+
+    Memory use is bounded by `batch_size` regardless of how many intervals exist.
+
+    Args:
+        db (duckdb.DuckDBPyConnection): A DuckDB connection or cursor used exclusively by the iterator.
+        batch_size (int): Number of rows fetched from DuckDB at a time.
+
+    Yields:
+        List[Tuple[str, int, int, int]]: Batches of (producer, interval, previous win, following win),
+        ordered by producer and year.
     """
+    engine = ENGINE_BRIDGE if _has_materialized_intervals(db) else ENGINE_SQL
+    db.execute(ALL_INTERVALS_SQL.format(intervals=_intervals_source(engine)))
+    while True:
+        rows = db.fetchmany(batch_size)
+        if not rows:
+            return
+        yield rows
 
-    # Execute the query and fetch all rows
-    result = db.execute(query).fetchall()
 
-    # Dictionary to collect all winning years for each producer
-    producer_years = defaultdict(list)
+class IntervalQuery(NamedTuple):
+    """Parameters of one producer interval query of a batch, as in calculate_producer_intervals."""
+    top: Optional[int] = None
+    bottom: Optional[int] = None
+    from_year: Optional[int] = None
+    to_year: Optional[int] = None
 
-    for year, producers_str in result:
-        # Split producer names by comma or ' and ', and strip whitespace
-        producers = [p.strip() for p in re.split(r',|\s+and\s+', producers_str) if p.strip()]
-        for producer in producers:
-            producer_years[producer].append(int(year))
 
-    intervals: List[ProducerInterval] = []
+def calculate_producer_intervals_batch(db: duckdb.DuckDBPyConnection, queries: Sequence[IntervalQuery],
+                                       index: Optional[ProducerIndex] = None) -> List[ProducerIntervalResponse]:
+    """
+    Answer several producer interval queries together.
 
-    # Calculate intervals between consecutive wins for each producer
-    for producer, years in producer_years.items():
-        sorted_years = sorted(set(years))  # Remove duplicates and sort
-        for i in range(1, len(sorted_years)):
-            interval = sorted_years[i] - sorted_years[i - 1]
-            intervals.append(ProducerInterval(
+    Queries without a year range are answered by the in-memory index when one is given.
+    The others share a single scan of the intervals (the materialized table when present,
+    the raw winning rows otherwise) restricted to the union of their year ranges, and are
+    ranked per query in the same DuckDB statement. Every response equals the one
+    calculate_producer_intervals returns for the same parameters.
+
+    Args:
+        db (duckdb.DuckDBPyConnection): A DuckDB connection instance.
+        queries (Sequence[IntervalQuery]): The queries to answer.
+        index (Optional[ProducerIndex]): In-memory index answering the queries without a year range.
+
+    Returns:
+        List[ProducerIntervalResponse]: One response per query, in the order of `queries`.
+    """
+    responses: List[Optional[ProducerIntervalResponse]] = [None] * len(queries)
+    scanned = []
+    for position, query in enumerate(queries):
+        if index is not None and query.from_year is None and query.to_year is None:
+            with interval_phase(ENGINE_INDEX, "build_models"):
+                responses[position] = index.to_response(top=query.top, bottom=query.bottom)
+        else:
+            scanned.append(position)
+
+    if not scanned:
+        return responses
+
+    # The scan covers the union of the year ranges; each query is then restricted to its own.
+    from_years = [queries[position].from_year for position in scanned]
+    to_years = [queries[position].to_year for position in scanned]
+    engine = ENGINE_BRIDGE if _has_materialized_intervals(db) else ENGINE_SQL
+    intervals_sql = _intervals_source(
+        engine,
+        None if None in from_years else min(from_years),
+        None if None in to_years else max(to_years)
+    )
+    values = ", ".join(
+        f"({position}, {_sql_integer(queries[position].top)}, {_sql_integer(queries[position].bottom)}, "
+        f"{_sql_integer(queries[position].from_year)}, {_sql_integer(queries[position].to_year)})"
+        for position in scanned
+    )
+    # Length of the top-N lists, the largest K of any query.
+    limit = max(max(queries[position].top or 1, queries[position].bottom or 1) for position in scanned)
+
+    with interval_phase(engine, "query"):
+        rows = db.execute(
+            BATCH_INTERVALS_SQL.format(queries=values, intervals=intervals_sql, limit=int(limit))
+        ).fetchall()
+
+    with interval_phase(engine, "build_models"):
+        selected = {position: ([], []) for position in scanned}
+        for position, kind, producer, interval, previous_win, following_win, _ in rows:
+            shortest, longest = selected[position]
+            (shortest if kind == 'min' else longest).append(ProducerInterval(
                 producer=producer,
                 interval=interval,
-                previousWin=sorted_years[i - 1],
-                followingWin=sorted_years[i]
+                previousWin=previous_win,
+                followingWin=following_win
             ))
+        for position, (shortest, longest) in selected.items():
+            responses[position] = ProducerIntervalResponse(min=shortest, max=longest)
+
+    return responses
+
+
+def _sql_integer(value: Optional[int]) -> str:
+    """Render an optional integer as a typed SQL literal."""
+    return "CAST(NULL AS INTEGER)" if value is None else str(int(value))
+
 
-    # If no valid intervals were found, return empty response
-    if not intervals:
-        return ProducerIntervalResponse(min=[], max=[])
+def _has_materialized_intervals(db: duckdb.DuckDBPyConnection) -> bool:
+    """Check whether the 'producer_intervals' table has been materialized."""
+    return db.execute(
+        "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = 'producer_intervals';"
+    ).fetchone()[0] > 0
 
-    # Identify the smallest and largest intervals
-    min_interval = min(i.interval for i in intervals)
-    max_interval = max(i.interval for i in intervals)
 
-    # Collect all intervals matching the min and max
-    min_intervals = [i for i in intervals if i.interval == min_interval]
-    max_intervals = [i for i in intervals if i.interval == max_interval]
+def _year_filter(lower_column: str, upper_column: str, from_year: Optional[int], to_year: Optional[int]) -> str:
+    """Build the ' AND ...' predicate restricting wins to [from_year, to_year]."""
+    predicate = ""
+    if from_year is not None:
+        predicate += f" AND {lower_column} >= {int(from_year)}"
+    if to_year is not None:
+        predicate += f" AND {upper_column} <= {int(to_year)}"
+    return predicate
+
+
+def _intervals_source(engine: str, from_year: Optional[int] = None, to_year: Optional[int] = None) -> str:
+    """
+    Return the SQL producing (producer, interval, previous_win, following_win) rows for an engine.
+
+    An interval lies within [from_year, to_year] exactly when both of its wins do, so the
+    materialized table is filtered on previous_win/following_win and the raw scan on year.
+    """
+    if engine == ENGINE_BRIDGE:
+        return MATERIALIZED_INTERVALS_SQL.format(
+            year_filter=_year_filter("previous_win", "following_win", from_year, to_year)
+        )
+    wins_sql = RAW_WINS_SQL.format(year_filter=_year_filter("year", "year", from_year, to_year))
+    return RAW_INTERVALS_SQL.format(wins=wins_sql)
+
+
+def _calculate_intervals_sql(db: duckdb.DuckDBPyConnection, intervals_sql: str, engine: str,
+                             top: Optional[int] = None, bottom: Optional[int] = None) -> ProducerIntervalResponse:
+    """
+    Compute the min and max intervals entirely inside DuckDB.
+
+    Only the rows that belong to the response are transferred back to Python.
+    """
+    min_intervals: List[ProducerInterval] = []
+    max_intervals: List[ProducerInterval] = []
+
+    with interval_phase(engine, "query"):
+        rows = []
+        if not top or not bottom:
+            rows = db.execute(INTERVALS_SQL.format(intervals=intervals_sql)).fetchall()
+        if bottom:
+            rows = [row for row in rows if row[0] != 'min'] + _fetch_ranked(db, intervals_sql, 'min', bottom)
+        if top:
+            rows = [row for row in rows if row[0] != 'max'] + _fetch_ranked(db, intervals_sql, 'max', top)
+
+    with interval_phase(engine, "build_models"):
+        for kind, producer, interval, previous_win, following_win in rows:
+            target = min_intervals if kind == 'min' else max_intervals
+            target.append(ProducerInterval(
+                producer=producer,
+                interval=interval,
+                previousWin=previous_win,
+                followingWin=following_win
+            ))
+
+        return ProducerIntervalResponse(min=min_intervals, max=max_intervals)
+
+
+def _fetch_ranked(db: duckdb.DuckDBPyConnection, intervals_sql: str, kind: str, limit: int) -> List[tuple]:
+    """Fetch the `limit` shortest ('min') or longest ('max') intervals, tagged with their kind."""
+    direction = "ASC" if kind == 'min' else "DESC"
+    query = RANKED_INTERVALS_SQL.format(intervals=intervals_sql, direction=direction, limit=int(limit))
+    return [(kind,) + row for row in db.execute(query).fetchall()]
+
+
+def _calculate_intervals_python(db: duckdb.DuckDBPyConnection, top: Optional[int] = None,
+                                bottom: Optional[int] = None, from_year: Optional[int] = None,
+                                to_year: Optional[int] = None) -> ProducerIntervalResponse:
+    """
+    Compute the min and max intervals in Python from every winning row.
+
+    Producers strings are split by the memoizing tokenizer into integer producer ids.
+    Winning years are kept in one compact unsigned 16-bit array per producer, and the gaps
+    are scanned once as plain tuples while the running min and max tie sets (or bounded
+    top/bottom heaps) are maintained. Pydantic models are only built for the selected rows.
+    """
+    query = f"""
+        SELECT year, producers
+        FROM worst_movie_nominations
+        WHERE winner = TRUE AND year IS NOT NULL AND producers IS NOT NULL AND producers <> ''{_year_filter("year", "year", from_year, to_year)};
+    """
+
+    # Execute the query and fetch all rows
+    with interval_phase(ENGINE_PYTHON, "query"):
+        result = db.execute(query).fetchall()
+
+    # Compact array of winning years for each producer id
+    producer_years = defaultdict(lambda: array('H'))
+
+    # Smallest spelling of each producer id in this dataset, as reported by the SQL engines
+    spellings = {}
+
+    with interval_phase(ENGINE_PYTHON, "split"):
+        parse = producer_tokenizer.parse
+        for year, producers_str in result:
+            # Memoized split of the producers string into canonical producer ids
+            for producer_id, name in zip(*parse(producers_str)):
+                producer_years[producer_id].append(year)
+                spelling = spellings.get(producer_id)
+                if spelling is None or name < spelling:
+                    spellings[producer_id] = name
+        producer_years = {spellings[producer_id]: years for producer_id, years in producer_years.items()}
+
+    with interval_phase(ENGINE_PYTHON, "select"):
+        if top and bottom:
+            shortest, longest = _shortest(producer_years, bottom), _longest(producer_years, top)
+        else:
+            shortest, longest = _select_ties(producer_years)
+            if bottom:
+                shortest = _shortest(producer_years, bottom)
+            if top:
+                longest = _longest(producer_years, top)
+
+    with interval_phase(ENGINE_PYTHON, "build_models"):
+        return ProducerIntervalResponse(min=_to_models(shortest), max=_to_models(longest))
+
+
+def _gaps(producer_years: dict) -> Iterator[Tuple[int, str, int, int]]:
+    """Yield (interval, producer, previous_win, following_win) for every consecutive-win gap."""
+    for producer, years in producer_years.items():
+        if len(years) < 2:
+            continue
+        ordered = sorted(set(years))  # Remove duplicates and sort
+        previous_win = ordered[0]
+        for following_win in ordered[1:]:
+            yield following_win - previous_win, producer, previous_win, following_win
+            previous_win = following_win
+
+
+def _shortest(producer_years: dict, k: int) -> list:
+    """Select the k shortest gaps with a bounded heap, ordered by interval, producer and year."""
+    return heapq.nsmallest(k, _gaps(producer_years))
+
+
+def _longest(producer_years: dict, k: int) -> list:
+    """Select the k longest gaps with a bounded heap, ordered by descending interval, then producer and year."""
+    return heapq.nsmallest(k, _gaps(producer_years), key=lambda gap: (-gap[0], gap[1], gap[2]))
+
+
+def _select_ties(producer_years: dict) -> Tuple[list, list]:
+    """
+    Collect every gap tied for the shortest and for the longest interval in a single pass.
+
+    Returns:
+        Tuple[list, list]: The shortest and the longest gaps, ordered by producer and year.
+    """
+    min_interval = max_interval = None
+    shortest, longest = [], []
+    for gap in _gaps(producer_years):
+        interval = gap[0]
+        if min_interval is None or interval < min_interval:
+            min_interval, shortest = interval, [gap]
+        elif interval == min_interval:
+            shortest.append(gap)
+        if max_interval is None or interval > max_interval:
+            max_interval, longest = interval, [gap]
+        elif interval == max_interval:
+            longest.append(gap)
+    shortest.sort()
+    longest.sort()
+    return shortest, longest
+
 
-    return ProducerIntervalResponse(min=min_intervals, max=max_intervals)
+def _to_models(gaps: list) -> List[ProducerInterval]:
+    """Build the response models of the selected (interval, producer, previous_win, following_win) gaps."""
+    return [
+        ProducerInterval(producer=producer, interval=interval, previousWin=previous_win, followingWin=following_win)
+        for interval, producer, previous_win, following_win in gaps
+    ]
@@ -0,0 +1,102 @@
+import logging
+from typing import Callable, Optional, Tuple
+
+import duckdb
+from fastapi import HTTPException, Response
+from pydantic import BaseModel
+
+from app.database.connection import DatabaseManager
+from app.database.pool import PoolTimeoutError
+from app.metrics import RESPONSE_ENCODE_DURATION
+from app.services.cache import EncodedResponse, intervals_cache, intervals_flight
+
+
+def load_encoded_response(db_manager: DatabaseManager, cache_key: tuple,
+                          calculate: Callable[[duckdb.DuckDBPyConnection], BaseModel],
+                          endpoint: str, not_found: str) -> Tuple[EncodedResponse, str]:
+    """
+    Return an encoded min/max interval response from the result cache, computing it on a miss.
+
+    Args:
+        db_manager (DatabaseManager): The database manager.
+        cache_key (tuple): Key of the response in the result cache, including every parameter.
+        calculate (Callable[[duckdb.DuckDBPyConnection], BaseModel]): Computes the response model
+            with 'min' and 'max' lists on a pooled cursor.
+        endpoint (str): Endpoint label of the encoding metrics.
+        not_found (str): 404 detail returned when both lists are empty.
+
+    Returns:
+        Tuple[EncodedResponse, str]: The encoded response and its cache status
+            ("HIT", "MISS" or "COALESCED").
+
+    Raises:
+        HTTPException: 404 if no data found, 503 if no cursor is available,
+            500 if an unexpected error occurs.
+    """
+    version = db_manager.dataset_version
+    encoded = intervals_cache.get(version, cache_key)
+    cache_status = "HIT"
+
+    if encoded is None:
+        def compute() -> EncodedResponse:
+            # Call the service function to calculate the intervals on a pooled cursor
+            with db_manager.cursor() as db:
+                result = calculate(db)
+
+            # If both lists are empty, raise 404
+            if not result.min and not result.max:
+                raise HTTPException(status_code=404, detail=not_found)
+
+            with RESPONSE_ENCODE_DURATION.time(endpoint=endpoint):
+                computed = EncodedResponse.from_model(result)
+            intervals_cache.put(version, cache_key, computed)
+            return computed
+
+        try:
+            # Concurrent misses for the same version and parameters share a single computation
+            encoded, shared = intervals_flight.do((version, cache_key), compute)
+            cache_status = "COALESCED" if shared else "MISS"
+
+        except HTTPException:
+            # Let FastAPI handle explicitly raised HTTPExceptions
+            raise
+
+        except PoolTimeoutError:
+            logging.warning("Timed out waiting for a database cursor")
+            raise HTTPException(status_code=503, detail="Service busy, try again later.")
+
+        except Exception:
+            # Log the unexpected error for debugging purposes
+            logging.exception("Unexpected error while calculating %s", endpoint)
+            raise HTTPException(status_code=500, detail="Internal server error.")
+
+    return encoded, cache_status
+
+
+def encoded_json_response(encoded: EncodedResponse, if_none_match: Optional[str],
+                          accept_encoding: Optional[str], cache_status: str) -> Response:
+    """
+    Build the HTTP response for a pre-serialized payload.
+
+    Args:
+        encoded (EncodedResponse): The cached, pre-encoded payload.
+        if_none_match (Optional[str]): The If-None-Match request header.
+        accept_encoding (Optional[str]): The Accept-Encoding request header.
+        cache_status (str): Value of the X-Cache header ("HIT", "MISS" or "COALESCED").
+
+    Returns:
+        Response: A 304 response if the client copy is current, otherwise the encoded body.
+    """
+    encoding, body = encoded.negotiate(accept_encoding)
+    headers = {
+        "ETag": encoded.etag_for(encoding),
+        "Vary": "Accept-Encoding",
+        "X-Cache": cache_status,
+    }
+
+    if encoded.matches(if_none_match):
+        return Response(status_code=304, headers=headers)
+
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,37 @@
+from typing import List, Optional
+
+import duckdb
+
+from app.metrics import interval_phase
+from app.schemas.studios import StudioInterval, StudioIntervalResponse
+from app.services.interval_engine import ENGINE_GROUPED, STUDIOS, calculate_grouped_intervals
+
+
+def calculate_studio_intervals(db: duckdb.DuckDBPyConnection, top: Optional[int] = None,
+                               bottom: Optional[int] = None, from_year: Optional[int] = None,
+                               to_year: Optional[int] = None) -> StudioIntervalResponse:
+    """
+    Calculate the studios with the shortest and longest intervals between consecutive wins.
+
+    Args:
+        db (duckdb.DuckDBPyConnection): Active DuckDB connection.
+        top (Optional[int]): If given, 'max' holds the `top` longest intervals instead of the ties.
+        bottom (Optional[int]): If given, 'min' holds the `bottom` shortest intervals instead of the ties.
+        from_year (Optional[int]): Only consider wins from this year on (inclusive).
+        to_year (Optional[int]): Only consider wins up to this year (inclusive).
+
+    Returns:
+        StudioIntervalResponse: Studios with the shortest and longest intervals between wins.
+    """
+    selection = calculate_grouped_intervals(db, [STUDIOS], top, bottom, from_year, to_year)[STUDIOS.name]
+
+    with interval_phase(ENGINE_GROUPED, "build_models"):
+        return StudioIntervalResponse(min=_to_models(selection.min), max=_to_models(selection.max))
+
+
+def _to_models(gaps: list) -> List[StudioInterval]:
+    """Build the response models of the selected (studio, interval, previous_win, following_win) gaps."""
+    return [
+        StudioInterval(studio=studio, interval=interval, previousWin=previous_win, followingWin=following_win)
+        for studio, interval, previous_win, following_win in gaps
+    ]
@@ -0,0 +1,148 @@
+import re
+import sys
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Separator of the names in a free-text producers column: ',' or ' and '.
+PRODUCER_SEPARATOR = r",|\s+and\s+"
+
+WHITESPACE = re.compile(r"\s+")
+
+# Every character str.strip() removes (str.isspace()), so SQL trims like the Python code paths.
+STRIP_CHARACTERS = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005"
+    "\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+
+def canonical_name(token: str) -> str:
+    """Trim a name and collapse its inner whitespace runs to single spaces."""
+    return WHITESPACE.sub(" ", token.strip())
+
+
+def strip_sql(expression: str) -> str:
+    """
+    Return the DuckDB expression applying str.strip() to a string.
+
+    DuckDB's one-argument trim() only removes spaces, so names or winner flags padded with
+    tabs or line breaks would otherwise differ from the Python code paths.
+
+    Args:
+        expression (str): SQL expression of the string.
+
+    Returns:
+        str: SQL expression of the stripped string.
+    """
+    return f"trim({expression}, '{STRIP_CHARACTERS}')"
+
+
+def canonical_name_sql(expression: str) -> str:
+    """
+    Return the DuckDB expression applying canonical_name to an already trimmed name.
+
+    The regexp_replace only runs on the rare names holding a whitespace run or a tab or
+    newline, so canonicalizing a bulk ingest costs little more than the split itself.
+
+    Args:
+        expression (str): SQL expression of the trimmed name.
+
+    Returns:
+        str: SQL expression of the canonical name.
+    """
+    return (
+        rf"CASE WHEN regexp_matches({expression}, '\s\s|[^\S ]') "
+        rf"THEN regexp_replace({expression}, '\s+', ' ', 'g') ELSE {expression} END"
+    )
+
+
+class NameTokenizer:
+    """
+    Memoizing tokenizer turning delimited name strings into stable integer ids.
+
+    Every distinct raw string is parsed once: later calls with an equal string are a dict
+    hit returning the same tuples. Names are canonicalized (trimmed, whitespace collapsed),
+    interned, compared case-insensitively for their id and deduplicated within a string.
+    The SQL engines apply the same rules (trim, canonical_name_sql, grouping on lower())
+    and report the smallest spelling with min(); callers wanting the same display names
+    pick the smallest spelling they saw for an id.
+    """
+
+    def __init__(self, separator: str, max_cached_strings: int = 1_000_000):
+        """
+        Initialize the tokenizer.
+
+        Args:
+            separator (str): Regular expression separating the names of a raw string.
+            max_cached_strings (int): Parsed raw strings kept before the parse cache is reset.
+                Ids are never dropped, so they stay stable across resets.
+        """
+        self._separator = re.compile(separator)
+        self._max_cached_strings = max_cached_strings
+        self._parsed: Dict[str, Tuple[Tuple[int, ...], Tuple[str, ...]]] = {}
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._lock = threading.Lock()
+
+    def parse(self, raw: Optional[str]) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+        """
+        Split a raw string into its distinct names, in order of appearance.
+
+        Args:
+            raw (Optional[str]): Delimited names, e.g. "Producer A, Producer B and Producer C".
+
+        Returns:
+            Tuple[Tuple[int, ...], Tuple[str, ...]]: The name ids and their canonical spellings
+                in this string, both empty for None or blank strings.
+        """
+        if not raw:
+            return (), ()
+        parsed = self._parsed.get(raw)
+        if parsed is None:
+            parsed = self._parse(raw)
+        return parsed
+
+    def tokenize(self, raw: Optional[str]) -> Tuple[int, ...]:
+        """Return the ids of the distinct names of a raw string, in order of appearance."""
+        return self.parse(raw)[0]
+
+    def split(self, raw: Optional[str]) -> Tuple[str, ...]:
+        """Return the canonical names of a raw string, in order of appearance."""
+        return self.parse(raw)[1]
+
+    def name(self, token_id: int) -> str:
+        """Return the first spelling seen for an id."""
+        return self._names[token_id]
+
+    def id_of(self, name: str) -> Optional[int]:
+        """Return the id of a name, compared case-insensitively, or None if it was never seen."""
+        return self._ids.get(canonical_name(name).lower())
+
+    def __len__(self) -> int:
+        """Return the number of distinct names seen."""
+        return len(self._names)
+
+    def _parse(self, raw: str) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+        """Parse a raw string not found in the cache, assigning ids to new names."""
+        with self._lock:
+            ids, names = [], []
+            for token in self._separator.split(raw):
+                name = canonical_name(token)
+                if not name:
+                    continue
+                key = name.lower()
+                token_id = self._ids.get(key)
+                if token_id is None:
+                    token_id = self._ids[sys.intern(key)] = len(self._names)
+                    self._names.append(sys.intern(name))
+                if token_id not in ids:
+                    ids.append(token_id)
+                    names.append(sys.intern(name))
+
+            if len(self._parsed) >= self._max_cached_strings:
+                self._parsed.clear()
+            parsed = self._parsed[raw] = (tuple(ids), tuple(names))
+            return parsed
+
+
+# Shared tokenizer of the producers column, used by ingest appends and by the python engine.
+producer_tokenizer = NameTokenizer(PRODUCER_SEPARATOR)
@@ -0,0 +1,108 @@
+import argparse
+import csv
+import random
+from itertools import accumulate
+from pathlib import Path
+from typing import List
+
+# Building blocks for synthetic names. None of them contain ',' or a standalone 'and',
+# so the only separators in a producers string are the ones added by the generator.
+FIRST_NAMES = [
+    "Allan", "Barbara", "Carl", "Diane", "Edward", "Frances", "George", "Helen", "Irwin", "Joan",
+    "Kevin", "Linda", "Matthew", "Nancy", "Oliver", "Patricia", "Quentin", "Rose", "Steven", "Teresa",
+    "Ulysses", "Victoria", "Walter", "Xena", "Yuri", "Zelda",
+]
+LAST_NAMES = [
+    "Carr", "Weintraub", "Shagan", "Cunningham", "Silver", "Vaughn", "Bruckheimer", "Simpson", "Wachowski",
+    "Bay", "Emmerich", "Devlin", "Sandler", "Giarraputo", "Perry", "Goldwyn", "Kassar", "Vajna", "Golan",
+    "Globus", "Pressman", "Ponti", "Lansing", "Jaffe", "Mancuso", "Yablans",
+]
+STUDIOS = [
+    "Associated Film Distribution", "Lorimar Productions", "United Artists", "MGM", "Paramount Pictures",
+    "Universal Studios", "Warner Bros.", "20th Century Fox", "Columbia Pictures", "TriStar Pictures",
+    "Cannon Films", "Carolco Pictures", "Lionsgate", "Summit Entertainment", "Screen Gems",
+]
+TITLE_WORDS = [
+    "Return", "Night", "Revenge", "Love", "Storm", "Dead", "Island", "Money", "Ghost", "Street",
+    "Shadow", "Fire", "Legend", "Dream", "Last", "Dark", "City", "Game", "Heart", "Blood",
+]
+
+
+def _producer_pool(size: int, rng: random.Random) -> List[str]:
+    """Build `size` distinct producer names, suffixing repeated combinations with a number."""
+    combinations = len(FIRST_NAMES) * len(LAST_NAMES)
+    names = []
+    for i in range(size):
+        first = FIRST_NAMES[i % len(FIRST_NAMES)]
+        last = LAST_NAMES[(i // len(FIRST_NAMES)) % len(LAST_NAMES)]
+        round_ = i // combinations
+        names.append(f"{first} {last} {round_ + 1}" if round_ else f"{first} {last}")
+    rng.shuffle(names)
+    return names
+
+
+def _join_producers(producers: List[str], rng: random.Random) -> str:
+    """Join producer names the way Movielist.csv does: commas, with ' and ' before the last one."""
+    if len(producers) == 1:
+        return producers[0]
+    if rng.random() < 0.5:
+        return ", ".join(producers[:-1]) + " and " + producers[-1]
+    return ", ".join(producers)
+
+
+def generate_nominations_csv(path: str, rows: int, seed: int = 42, start_year: int = 1900,
+                             end_year: int = 2099, winner_ratio: float = 0.2) -> Path:
+    """
+    Write a synthetic, reproducible Razzie nominations CSV in the Movielist.csv format.
+
+    Rows are written one at a time, so even 10M-row files are produced in constant memory.
+    Producer popularity follows a Zipf-like distribution, so some producers win many times
+    and the interval computation has realistic work to do.
+
+    Args:
+        path (str): Output file path.
+        rows (int): Number of nomination rows to write.
+        seed (int): Random seed; the same seed always yields the same file.
+        start_year (int): First award year.
+        end_year (int): Last award year.
+        winner_ratio (float): Fraction of nominations marked as winners.
+
+    Returns:
+        Path: The path of the written file.
+    """
+    rng = random.Random(seed)
+    producers = _producer_pool(max(50, rows // 20), rng)
+    cum_weights = list(accumulate(1.0 / rank for rank in range(1, len(producers) + 1)))
+    years = end_year - start_year + 1
+
+    output = Path(path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.open("w", newline="", encoding="utf-8", buffering=1024 * 1024) as handle:
+        writer = csv.writer(handle, delimiter=";", lineterminator="\n")
+        writer.writerow(["year", "title", "studios", "producers", "winner"])
+
+        for row in range(rows):
+            year = start_year + (row * years) // rows
+            title = " ".join(rng.sample(TITLE_WORDS, rng.randint(1, 3)))
+            studios = ", ".join(rng.sample(STUDIOS, rng.randint(1, 2)))
+            count = rng.choices((1, 2, 3, 4), weights=(60, 25, 10, 5))[0]
+            names = list(dict.fromkeys(rng.choices(producers, cum_weights=cum_weights, k=count)))
+            winner = "yes" if rng.random() < winner_ratio else ""
+            writer.writerow([year, title, studios, _join_producers(names, rng), winner])
+
+    return output
+
+
+def main():
+    """Command line entry point: python -m benchmarks.generator OUTPUT --rows N --seed S."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic Razzie nominations CSV.")
+    parser.add_argument("output", help="Output CSV path")
+    parser.add_argument("--rows", type=int, default=10_000, help="Number of nomination rows")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    print(generate_nominations_csv(args.output, rows=args.rows, seed=args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Generator, List, Optional, Sequence
+
+import httpx
+
+from benchmarks.generator import generate_nominations_csv
+
+DEFAULT_PATHS = ["/api/v1/producers/intervals", "/"]
+
+# Seconds to wait for a started server to report ready on /health/ready.
+READY_TIMEOUT = 120.0
+
+
+def summarize_latencies(samples: Sequence[float], errors: int, elapsed: float) -> Dict[str, float]:
+    """
+    Summarize request latencies (in seconds) as throughput, error rate and percentiles.
+
+    Percentiles use the nearest-rank method, so p99 is a latency that was actually observed.
+
+    Args:
+        samples (Sequence[float]): Latency of every completed request, failed ones included.
+        errors (int): Number of failed requests (transport errors or status >= 400).
+        elapsed (float): Wall-clock seconds of the measured window.
+
+    Returns:
+        Dict[str, float]: Requests, errors, error rate, RPS and p50/p95/p99/max milliseconds.
+    """
+    ordered = sorted(samples)
+
+    def percentile(q: float) -> float:
+        return ordered[max(0, math.ceil(q * len(ordered)) - 1)] * 1000 if ordered else 0.0
+
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "error_rate": errors / len(ordered) if ordered else 0.0,
+        "rps": len(ordered) / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": ordered[-1] * 1000 if ordered else 0.0,
+    }
+
+
+async def drive_load(base_url: str, paths: List[str], concurrency: int, duration: float,
+                     warmup: float = 0.0) -> dict:
+    """
+    Send requests from `concurrency` concurrent clients for `duration` seconds.
+
+    Every client cycles through `paths` and waits for each response before sending the next
+    request (closed loop), so the measured RPS is what the server sustains at that concurrency.
+    Requests finishing during the warm-up period are not measured.
+
+    Args:
+        base_url (str): Base URL of the server, e.g. "http://127.0.0.1:8000".
+        paths (List[str]): Request paths, spread round-robin over the requests of every client.
+        concurrency (int): Number of concurrent clients.
+        duration (float): Seconds of measured load.
+        warmup (float): Seconds of unmeasured load sent first.
+
+    Returns:
+        dict: The summary of every path and of all requests together.
+    """
+    samples: Dict[str, List[float]] = {path: [] for path in paths}
+    errors: Dict[str, int] = {path: 0 for path in paths}
+    loop = asyncio.get_running_loop()
+    measure_from = loop.time() + warmup
+    deadline = measure_from + duration
+
+    async def client_loop(client: httpx.AsyncClient, offset: int):
+        position = offset
+        while loop.time() < deadline:
+            path = paths[position % len(paths)]
+            position += 1
+            started = loop.time()
+            try:
+                response = await client.get(path)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            finished = loop.time()
+            if finished >= measure_from:
+                samples[path].append(finished - started)
+                errors[path] += failed
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        await asyncio.gather(*(client_loop(client, offset) for offset in range(concurrency)))
+    # Clients stop at the first response after the deadline, so the window slightly exceeds it.
+    elapsed = loop.time() - measure_from
+
+    return {
+        "total": summarize_latencies(
+            [sample for path in paths for sample in samples[path]], sum(errors.values()), elapsed
+        ),
+        "paths": {path: summarize_latencies(samples[path], errors[path], elapsed) for path in paths},
+    }
+
+
+def _free_port() -> int:
+    """Return a TCP port that is currently free on the loopback interface."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def run_server(csv_path: str, workers: int = 1,
+               env: Optional[Dict[str, str]] = None) -> Generator[str, None, None]:
+    """
+    Start the application under uvicorn in a subprocess and wait until it is ready.
+
+    Args:
+        csv_path (str): Dataset served by the application (RAZZIE_CSV_PATH).
+        workers (int): Number of uvicorn worker processes.
+        env (Optional[Dict[str, str]]): Extra environment variables, e.g. RAZZIE_POOL_SIZE.
+
+    Yields:
+        str: Base URL of the running server.
+
+    Raises:
+        RuntimeError: If the server exits or is not ready within READY_TIMEOUT seconds.
+    """
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        env={**os.environ, "RAZZIE_CSV_PATH": csv_path, **(env or {})},
+        cwd=str(Path(__file__).resolve().parent.parent),
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        _wait_until_ready(process, base_url)
+        yield base_url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def _wait_until_ready(process: subprocess.Popen, base_url: str):
+    """Poll /health/ready until the data is loaded, failing fast if the server exits."""
+    deadline = time.monotonic() + READY_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode} before becoming ready")
+        try:
+            if httpx.get(f"{base_url}/health/ready", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"Server not ready after {READY_TIMEOUT:.0f}s")
+
+
+def run_load_test(csv_path: str, paths: List[str], concurrency: int, duration: float, warmup: float,
+                  workers: int = 1, env: Optional[Dict[str, str]] = None, url: Optional[str] = None) -> dict:
+    """
+    Load-test the application and return machine-readable results.
+
+    Args:
+        csv_path (str): Dataset served by the started server (ignored with `url`).
+        paths (List[str]): Request paths.
+        concurrency (int): Number of concurrent clients.
+        duration (float): Seconds of measured load.
+        warmup (float): Seconds of unmeasured load sent first.
+        workers (int): Number of uvicorn worker processes of the started server.
+        env (Optional[Dict[str, str]]): Extra environment variables of the started server.
+        url (Optional[str]): Base URL of an already running server to target instead.
+
+    Returns:
+        dict: The load summary with the configuration and environment metadata.
+    """
+    meta = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "concurrency": concurrency,
+        "duration_seconds": duration,
+        "warmup_seconds": warmup,
+    }
+
+    if url:
+        meta["url"] = url
+        return {"meta": meta, **asyncio.run(drive_load(url, paths, concurrency, duration, warmup))}
+
+    meta.update({"dataset": csv_path, "workers": workers, "env": env or {}})
+    with run_server(csv_path, workers, env) as base_url:
+        return {"meta": meta, **asyncio.run(drive_load(base_url, paths, concurrency, duration, warmup))}
+
+
+def _parse_env(assignments: List[str]) -> Dict[str, str]:
+    """Parse NAME=VALUE command line assignments."""
+    env = {}
+    for assignment in assignments:
+        name, separator, value = assignment.partition("=")
+        if not separator:
+            raise argparse.ArgumentTypeError(f"Expected NAME=VALUE, got '{assignment}'")
+        env[name] = value
+    return env
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command line entry point: python -m benchmarks.load --rows 100000 --workers 2 --concurrency 32."""
+    parser = argparse.ArgumentParser(description="Load-test the API under uvicorn and report latency percentiles.")
+    dataset = parser.add_mutually_exclusive_group()
+    dataset.add_argument("--csv", default=None, help="Dataset to serve (defaults to the bundled Movielist.csv)")
+    dataset.add_argument("--rows", type=int, default=None, help="Generate a synthetic dataset with this many rows")
+    dataset.add_argument("--url", default=None, help="Target an already running server instead of starting one")
+    parser.add_argument("--seed", type=int, default=42, help="Dataset generator seed")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--env", nargs="*", default=[], metavar="NAME=VALUE",
+                        help="Server settings, e.g. RAZZIE_POOL_SIZE=8 RAZZIE_SHARED_DB=true")
+    parser.add_argument("--paths", nargs="+", default=DEFAULT_PATHS, help="Request paths, requested round-robin")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of measured load")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Seconds of unmeasured load sent first")
+    parser.add_argument("--output", default=None, help="Results JSON file (printed to stdout as well)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = args.csv or str(Path(__file__).resolve().parent.parent / "data" / "Movielist.csv")
+        if args.rows:
+            csv_path = str(generate_nominations_csv(str(Path(tmp) / "nominations.csv"), rows=args.rows, seed=args.seed))
+        results = run_load_test(
+            csv_path, args.paths, args.concurrency, args.duration, args.warmup,
+            workers=args.workers, env=_parse_env(args.env), url=args.url
+        )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import argparse
+import json
+import platform
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import duckdb
+from fastapi.testclient import TestClient
+
+from app.database.connection import get_db_manager
+from app.main import app
+from app.services.cache import intervals_cache
+from app.services.producer_service import (
+    calculate_producer_intervals, ENGINE_BRIDGE, ENGINE_INDEX, ENGINE_PYTHON, ENGINE_SQL
+)
+from benchmarks.generator import generate_nominations_csv
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+DEFAULT_ENGINES = [ENGINE_SQL, ENGINE_BRIDGE, ENGINE_INDEX, ENGINE_PYTHON]
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    """Summarize timing samples (in seconds) as min/median/p95/max milliseconds."""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return {
+        "samples": len(ordered),
+        "min_ms": ordered[0] * 1000,
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": p95 * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def _time(func: Callable, repeat: int) -> Dict[str, float]:
+    """Run `func` `repeat` times and summarize the wall-clock durations."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return _summarize(samples)
+
+
+def benchmark_size(csv_path: Path, engines: List[str], repeat: int, http_requests: int) -> dict:
+    """
+    Benchmark ingest, interval computation and HTTP latency for one generated dataset.
+
+    Args:
+        csv_path (Path): The generated nominations CSV.
+        engines (List[str]): Interval engines to time.
+        repeat (int): Number of timed runs per engine.
+        http_requests (int): Number of HTTP requests per cache scenario.
+
+    Returns:
+        dict: The timings of this dataset.
+    """
+    db_manager = get_db_manager()
+    db_manager.close()
+    db_manager.db_path = ":memory:"
+    db_manager.csv_path = str(csv_path)
+
+    started = time.perf_counter()
+    db_manager.initialize_database(force=True)
+    ingest_seconds = time.perf_counter() - started
+
+    conn = db_manager.get_connection()
+    rows, winners = conn.execute(
+        "SELECT COUNT(*), COUNT(*) FILTER (WHERE winner) FROM worst_movie_nominations;"
+    ).fetchone()
+
+    engine_timings = {}
+    for engine in engines:
+        index = db_manager.producer_index if engine == ENGINE_INDEX else None
+        with db_manager.cursor() as cursor:
+            engine_timings[engine] = _time(
+                lambda: calculate_producer_intervals(cursor, engine=engine, index=index), repeat
+            )
+
+    client = TestClient(app)
+
+    def cold_request():
+        intervals_cache.clear()
+        client.get("/api/v1/producers/intervals")
+
+    http_timings = {
+        "intervals_cold": _time(cold_request, http_requests),
+        "intervals_warm": _time(lambda: client.get("/api/v1/producers/intervals"), http_requests),
+        "root": _time(lambda: client.get("/"), http_requests),
+    }
+
+    return {
+        "rows": rows,
+        "winners": winners,
+        "file_bytes": csv_path.stat().st_size,
+        "ingest_seconds": ingest_seconds,
+        "engines": engine_timings,
+        "http": http_timings,
+    }
+
+
+def run(sizes: List[int], engines: List[str], seed: int, repeat: int, http_requests: int,
+        data_dir: Path) -> dict:
+    """
+    Generate a dataset for every size and benchmark it.
+
+    Returns:
+        dict: Machine-readable results including environment metadata.
+    """
+    results = []
+    for size in sizes:
+        csv_path = data_dir / f"nominations_{size}_{seed}.csv"
+        if not csv_path.exists():
+            generate_nominations_csv(str(csv_path), rows=size, seed=seed)
+        results.append(benchmark_size(csv_path, engines, repeat, http_requests))
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "duckdb": duckdb.__version__,
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+            "http_requests": http_requests,
+        },
+        "results": results,
+    }
+
+
+def main():
+    """Command line entry point: python -m benchmarks.run --sizes 10000 100000 --output results.json."""
+    parser = argparse.ArgumentParser(description="Benchmark ingest, interval computation and HTTP latency.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Dataset sizes in rows")
+    parser.add_argument("--engines", nargs="+", default=DEFAULT_ENGINES, help="Interval engines to time")
+    parser.add_argument("--seed", type=int, default=42, help="Dataset generator seed")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per engine")
+    parser.add_argument("--http-requests", type=int, default=50, help="HTTP requests per scenario")
+    parser.add_argument("--data-dir", default=None, help="Directory for generated datasets (reused between runs)")
+    parser.add_argument("--output", default="bench_output.json", help="Results JSON file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(args.data_dir or tmp)
+        data_dir.mkdir(parents=True, exist_ok=True)
+        results = run(args.sizes, args.engines, args.seed, args.repeat, args.http_requests, data_dir)
+
+    Path(args.output).write_text(json.dumps(results, indent=2))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
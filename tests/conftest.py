@@ -2,6 +2,11 @@ import pytest
 from pathlib import Path
 from app.database.connection import DatabaseManager
 import duckdb
+from app.services.cache import intervals_cache
+
+
+# Full dataset bundled with the application.
+MOVIELIST_CSV = Path(__file__).parent.parent / "data" / "Movielist.csv"
 
 
 @pytest.fixture
@@ -15,6 +20,15 @@ def test_db(tmp_path):
         db.initialize_database()
         yield db
 
+@pytest.fixture
+def movielist_db():
+    """
+    Fixture providing an in-memory database loaded with the bundled Movielist.csv.
+    """
+    with DatabaseManager(db_path=":memory:", csv_path=str(MOVIELIST_CSV)) as db:
+        db.initialize_database()
+        yield db
+
 @pytest.fixture(autouse=True)
 def clean_duckdb_state():
     """
@@ -22,4 +36,13 @@ def clean_duckdb_state():
     This helps avoid cross-test contamination when using :memory: DBs or default sessions.
     """
     yield
-    duckdb.close()
\ No newline at end of file
+    duckdb.close()
+
+@pytest.fixture(autouse=True)
+def clear_result_caches():
+    """
+    Fixture to ensure cached endpoint results never leak between tests.
+    """
+    intervals_cache.clear()
+    yield
+    intervals_cache.clear()
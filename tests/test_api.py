@@ -1,7 +1,15 @@
+import json
+import pytest
+from fastapi import Depends, FastAPI
 from fastapi.testclient import TestClient
 from unittest.mock import MagicMock, patch
 from app.main import app
-from app.schemas.producers import ProducerIntervalResponse
+from app.database.connection import get_db_manager
+from app.routers import admin
+from app.schemas.nominations import MAX_YEAR, MIN_YEAR
+from app.schemas.producers import MAX_RANKED_INTERVALS, ProducerIntervalResponse
+from app.services.producer_index import ProducerIndex
+from app.services.producer_service import calculate_producer_intervals, ENGINE_INDEX
 
 client = TestClient(app)
 
@@ -92,4 +100,282 @@ def test_get_producers_with_intervals_partial_max_only():
         assert response.status_code == 200
         json_data = response.json()
         assert json_data["min"] == []
-        assert len(json_data["max"]) == 1
\ No newline at end of file
+        assert len(json_data["max"]) == 1
+
+
+def test_get_producers_with_intervals_serves_cached_result():
+    """
+    Test that repeated calls are served from the result cache until the dataset version changes.
+    """
+    with patch("app.routers.producers.calculate_producer_intervals") as mock_calc:
+        mock_calc.return_value = ProducerIntervalResponse(
+            min=[{"producer": "John", "interval": 1, "previousWin": 2000, "followingWin": 2001}],
+            max=[{"producer": "Jane", "interval": 10, "previousWin": 1990, "followingWin": 2000}]
+        )
+
+        first = client.get("/api/v1/producers/intervals")
+        second = client.get("/api/v1/producers/intervals")
+
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert first.json() == second.json()
+        assert mock_calc.call_count == 1
+
+        get_db_manager().dataset_version += 1
+        third = client.get("/api/v1/producers/intervals")
+
+        assert third.headers["X-Cache"] == "MISS"
+        assert mock_calc.call_count == 2
+
+        stats = client.get("/api/v1/producers/intervals/cache").json()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+
+def test_get_producers_with_intervals_supports_etag_and_304():
+    """
+    Test that the endpoint sends a strong ETag and answers a matching If-None-Match with 304,
+    also when the client sends the tag back as a weak validator.
+    """
+    with patch("app.routers.producers.calculate_producer_intervals") as mock_calc:
+        mock_calc.return_value = ProducerIntervalResponse(
+            min=[{"producer": "John", "interval": 1, "previousWin": 2000, "followingWin": 2001}],
+            max=[]
+        )
+
+        first = client.get("/api/v1/producers/intervals", headers={"Accept-Encoding": "identity"})
+        etag = first.headers["ETag"]
+
+        assert first.status_code == 200
+        assert etag.startswith('"') and not etag.startswith('W/')
+        assert "Content-Encoding" not in first.headers
+
+        second = client.get("/api/v1/producers/intervals", headers={"If-None-Match": etag})
+
+        assert second.status_code == 304
+        assert second.content == b""
+        assert mock_calc.call_count == 1
+
+        weak = client.get("/api/v1/producers/intervals", headers={"If-None-Match": f'"other", W/{etag}'})
+
+        assert weak.status_code == 304
+        assert mock_calc.call_count == 1
+
+
+def test_get_producers_with_intervals_negotiates_compressed_variants():
+    """
+    Test that gzip and brotli encoded variants are served according to Accept-Encoding.
+    """
+    with patch("app.routers.producers.calculate_producer_intervals") as mock_calc:
+        mock_calc.return_value = ProducerIntervalResponse(
+            min=[{"producer": "John", "interval": 1, "previousWin": 2000, "followingWin": 2001}],
+            max=[]
+        )
+
+        gzip_response = client.get("/api/v1/producers/intervals", headers={"Accept-Encoding": "gzip"})
+        br_response = client.get("/api/v1/producers/intervals", headers={"Accept-Encoding": "gzip, br"})
+
+        assert gzip_response.headers["Content-Encoding"] == "gzip"
+        assert br_response.headers["Content-Encoding"] == "br"
+        assert gzip_response.json() == br_response.json()
+        assert gzip_response.headers["ETag"] != br_response.headers["ETag"]
+        assert gzip_response.headers["Vary"] == "Accept-Encoding"
+
+def test_append_nominations_invalidates_cached_intervals(test_db):
+    """
+    Test that the token-guarded admin append endpoint inserts nominations and the intervals endpoint reflects them.
+    """
+    # The administrative router is opt-in, so it is mounted on a dedicated app here
+    admin_app = FastAPI()
+    admin_app.include_router(admin.router, prefix="/api/v1/admin",
+                             dependencies=[Depends(admin.require_admin_token("secret"))])
+    admin_client = TestClient(admin_app)
+
+    before = client.get("/api/v1/producers/intervals")
+    assert before.status_code == 404
+
+    nominations = [
+        {"year": 1984, "title": "Sequel", "studios": "Studio", "producers": "Allan Carr", "winner": True}
+    ]
+    unauthorized = admin_client.post("/api/v1/admin/nominations", json=nominations,
+                                     headers={"Authorization": "Bearer wrong"})
+    assert unauthorized.status_code == 401
+    assert client.get("/api/v1/producers/intervals").status_code == 404
+
+    response = admin_client.post("/api/v1/admin/nominations", json=nominations,
+                                 headers={"Authorization": "Bearer secret"})
+    assert response.status_code == 201
+    assert response.json() == {"inserted": 1, "dataset_version": test_db.dataset_version}
+
+    after = client.get("/api/v1/producers/intervals")
+    assert after.status_code == 200
+    assert after.json()["min"] == [
+        {"producer": "Allan Carr", "interval": 4, "previousWin": 1980, "followingWin": 1984}
+    ]
+
+def test_admin_endpoints_are_not_mounted_by_default():
+    """
+    Test that the dataset cannot be changed through the default application.
+    """
+    response = client.post("/api/v1/admin/nominations", json=[])
+
+    assert response.status_code in (404, 405)
+
+def test_metrics_endpoint_exposes_request_and_phase_histograms():
+    """
+    Test that /metrics exposes per-route latency, interval phase timings and cache counters.
+    """
+    index = ProducerIndex.from_wins([("Producer A", 2000), ("Producer A", 2003)])
+
+    def calculate_from_index(db, **_):
+        return calculate_producer_intervals(db, engine=ENGINE_INDEX, index=index)
+
+    with patch("app.routers.producers.calculate_producer_intervals", side_effect=calculate_from_index) as mock_calc:
+        client.get("/api/v1/producers/intervals")
+        client.get("/api/v1/producers/intervals")
+
+    response = client.get("/metrics")
+    body = response.text
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'razzie_http_request_duration_seconds_count{method="GET",route="/api/v1/producers/intervals",status="200"}' in body
+    assert 'razzie_interval_phase_duration_seconds_count{engine="index",phase="build_models"}' in body
+    assert 'razzie_cache_hits_total{cache="intervals"} 1' in body
+    assert mock_calc.call_count == 1
+
+def test_stream_all_producer_intervals_as_ndjson_and_json(movielist_db):
+    """
+    Test that every producer interval is streamed as NDJSON by default and as a JSON array on request.
+    """
+    ndjson = client.get("/api/v1/producers/intervals/all")
+    array = client.get("/api/v1/producers/intervals/all", params={"format": "json"})
+    ranked = client.get("/api/v1/producers/intervals", params={"top": 2, "bottom": 1})
+
+    rows = [json.loads(line) for line in ndjson.text.splitlines()]
+
+    assert ndjson.headers["content-type"] == "application/x-ndjson"
+    assert array.json() == rows
+    assert {"producer": "Joel Silver", "interval": 1, "previousWin": 1990, "followingWin": 1991} in rows
+    assert [i["interval"] for i in ranked.json()["max"]] == [13, 9]
+    assert len(ranked.json()["min"]) == 1
+
+
+def test_stream_all_producer_intervals_returns_503_when_the_pool_is_busy(movielist_db):
+    """
+    Test that the streaming listing answers 503 before starting the response when no cursor is available.
+    """
+    pool = movielist_db.get_pool()
+    pool.timeout = 0.05
+    held = [pool.acquire() for _ in range(pool.size)]
+
+    busy = client.get("/api/v1/producers/intervals/all")
+    for cursor in held:
+        pool.release(cursor)
+    streamed = client.get("/api/v1/producers/intervals/all", params={"format": "json"})
+
+    assert busy.status_code == 503
+    assert busy.json() == {"detail": "Service busy, try again later."}
+    assert streamed.status_code == 200 and streamed.json()
+
+
+def test_get_producer_intervals_rejects_invalid_k():
+    """
+    Test that top/bottom must be positive.
+    """
+    response = client.get("/api/v1/producers/intervals", params={"top": 0})
+
+    assert response.status_code == 422
+
+def test_get_producer_intervals_rejects_inverted_year_range():
+    """
+    Test that from_year greater than to_year is rejected.
+    """
+    response = client.get("/api/v1/producers/intervals", params={"from_year": 2000, "to_year": 1990})
+
+    assert response.status_code == 422
+
+def test_get_producer_wins_and_prefix_search(movielist_db):
+    """
+    Test the per-producer lookup and prefix search endpoints served from the producer index.
+    """
+    found = client.get("/api/v1/producers/joel silver")
+    missing = client.get("/api/v1/producers/Nobody")
+    search = client.get("/api/v1/producers", params={"prefix": "matthew", "limit": 5})
+    intervals = client.get("/api/v1/producers/intervals")
+
+    assert found.status_code == 200
+    assert found.json() == {"producer": "Joel Silver", "wins": [1990, 1991]}
+    assert missing.status_code == 404
+    assert search.json() == {"producers": [{"producer": "Matthew Vaughn", "wins": [2002, 2015]}]}
+    assert intervals.status_code == 200
+
+def test_get_studios_with_intervals(movielist_db):
+    """
+    Test the studio intervals endpoint and that its cache entries do not collide with the producer ones.
+    """
+    producers = client.get("/api/v1/producers/intervals")
+    studios = client.get("/api/v1/studios/intervals", params={"top": 1})
+    cached = client.get("/api/v1/studios/intervals", params={"top": 1})
+
+    assert producers.json()["max"][0]["producer"] == "Matthew Vaughn"
+    assert studios.status_code == 200
+    assert studios.json()["max"] == [
+        {"studio": "Paramount Pictures", "interval": 15, "previousWin": 1993, "followingWin": 2008}
+    ]
+    assert cached.headers["X-Cache"] == "HIT"
+
+def test_batch_answers_interval_and_lookup_queries_in_order(movielist_db):
+    """
+    Test that the batch endpoint returns one result per query, equal to the standalone endpoints.
+    """
+    batch = client.post("/api/v1/batch", json={"queries": [
+        {"type": "producer_intervals", "from_year": 1991, "to_year": 2015},
+        {"type": "producer", "name": "joel silver"},
+        {"type": "producer_intervals", "top": 2, "bottom": 1},
+        {"type": "producer", "name": "Nobody"},
+        {"type": "producer_intervals", "from_year": 1991, "to_year": 2015},
+        {"type": "producer_intervals", "from_year": 2100},
+    ]})
+    ranged = client.get("/api/v1/producers/intervals", params={"from_year": 1991, "to_year": 2015})
+    ranked = client.get("/api/v1/producers/intervals", params={"top": 2, "bottom": 1})
+
+    results = batch.json()["results"]
+
+    assert batch.status_code == 200
+    assert [result["status"] for result in results] == [200, 200, 200, 404, 200, 404]
+    assert results[0]["body"] == ranged.json() == results[4]["body"]
+    assert results[1]["body"] == {"producer": "Joel Silver", "wins": [1990, 1991]}
+    assert results[2]["body"] == ranked.json()
+    assert results[5]["detail"] == "No producer intervals found."
+    # The batch filled the cache shared with the standalone endpoint
+    assert ranged.headers["X-Cache"] == "HIT"
+
+def test_batch_rejects_invalid_queries():
+    """
+    Test that an invalid query, an unknown query type or an empty batch is rejected as a whole.
+    """
+    inverted = client.post("/api/v1/batch", json={"queries": [
+        {"type": "producer_intervals", "from_year": 2000, "to_year": 1990}
+    ]})
+    unknown = client.post("/api/v1/batch", json={"queries": [{"type": "movies"}]})
+    empty = client.post("/api/v1/batch", json={"queries": []})
+
+    assert inverted.status_code == 422
+    assert unknown.status_code == 422
+    assert empty.status_code == 422
+
+@pytest.mark.parametrize("params", [
+    {"top": MAX_RANKED_INTERVALS + 1},
+    {"bottom": MAX_RANKED_INTERVALS + 1},
+    {"from_year": MIN_YEAR - 1},
+    {"to_year": MAX_YEAR + 1},
+])
+def test_batch_and_get_intervals_share_parameter_bounds(params):
+    """
+    Test that a parameter out of bounds is rejected alike by GET /producers/intervals and by a batch query.
+    """
+    get = client.get("/api/v1/producers/intervals", params=params)
+    batch = client.post("/api/v1/batch", json={"queries": [{"type": "producer_intervals", **params}]})
+
+    assert get.status_code == 422
+    assert batch.status_code == 422
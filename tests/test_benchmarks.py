@@ -0,0 +1,52 @@
+from pathlib import Path
+
+from benchmarks.generator import generate_nominations_csv
+from benchmarks.load import run_load_test, summarize_latencies
+from app.database.connection import DatabaseManager
+
+
+def test_generator_is_reproducible_and_loadable(tmp_path):
+    """
+    Test that the synthetic dataset generator is deterministic for a seed and produces a loadable CSV.
+    """
+    first = generate_nominations_csv(str(tmp_path / "first.csv"), rows=500, seed=7)
+    second = generate_nominations_csv(str(tmp_path / "second.csv"), rows=500, seed=7)
+    other = generate_nominations_csv(str(tmp_path / "other.csv"), rows=500, seed=8)
+
+    assert first.read_bytes() == second.read_bytes()
+    assert first.read_bytes() != other.read_bytes()
+    assert " and " in first.read_text()
+
+    with DatabaseManager(db_path=":memory:", csv_path=str(first)) as db:
+        db.initialize_database()
+        assert db.conn.execute("SELECT COUNT(*) FROM worst_movie_nominations;").fetchone()[0] == 500
+        assert db.producer_index.to_response().min
+
+
+def test_summarize_latencies_reports_nearest_rank_percentiles():
+    """
+    Test that latency percentiles are observed samples and that errors and RPS are reported.
+    """
+    summary = summarize_latencies([i / 1000 for i in range(100, 0, -1)], errors=5, elapsed=2.0)
+
+    assert summary["requests"] == 100
+    assert summary["error_rate"] == 0.05
+    assert summary["rps"] == 50.0
+    assert round(summary["p50_ms"]) == 50
+    assert round(summary["p99_ms"]) == 99
+    assert round(summary["max_ms"]) == 100
+    assert summarize_latencies([], errors=0, elapsed=1.0)["p99_ms"] == 0.0
+
+
+def test_load_test_drives_a_uvicorn_server():
+    """
+    Test a short load run against the application started under uvicorn on the bundled dataset.
+    """
+    csv_path = Path(__file__).parent.parent / "data" / "Movielist.csv"
+    results = run_load_test(str(csv_path), ["/api/v1/producers/intervals", "/"], concurrency=2,
+                            duration=0.5, warmup=0.1, env={"RAZZIE_POOL_SIZE": "2"})
+
+    assert results["total"]["requests"] > 0
+    assert results["total"]["errors"] == 0
+    assert set(results["paths"]) == {"/api/v1/producers/intervals", "/"}
+    assert results["meta"]["env"] == {"RAZZIE_POOL_SIZE": "2"}
@@ -0,0 +1,87 @@
+from app.services.cache import ResultCache
+
+
+def test_result_cache_invalidates_older_versions():
+    """
+    Test that storing a result for a newer dataset version drops entries of older versions.
+    """
+    cache = ResultCache()
+    cache.put(1, "intervals", "v1")
+
+    assert cache.get(1, "intervals") == "v1"
+    assert cache.get(2, "intervals") is None
+
+    cache.put(2, "intervals", "v2")
+    cache.put(1, "intervals", "stale")
+
+    assert cache.get(2, "intervals") == "v2"
+    assert cache.stats() == {"hits": 2, "misses": 1, "entries": 1, "version": 2}
+
+
+def test_result_cache_evicts_least_recently_used():
+    """
+    Test that the cache keeps at most max_entries entries, evicting the least recently used one.
+    """
+    cache = ResultCache(max_entries=2)
+    cache.put(1, "a", 1)
+    cache.put(1, "b", 2)
+    cache.get(1, "a")
+    cache.put(1, "c", 3)
+
+    assert cache.get(1, "a") == 1
+    assert cache.get(1, "b") is None
+    assert cache.get(1, "c") == 3
+
+
+def test_single_flight_coalesces_concurrent_callers():
+    """
+    Test that concurrent callers for the same key share one computation and its result.
+    """
+    import threading
+    import time
+    from app.metrics import SINGLEFLIGHT_CALLS
+    from app.services.cache import SingleFlight
+
+    flight = SingleFlight("test-coalesce")
+    release = threading.Event()
+    runs = []
+    results = []
+
+    def compute():
+        runs.append(1)
+        release.wait(5)
+        return "value"
+
+    threads = [threading.Thread(target=lambda: results.append(flight.do("key", compute))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+
+    deadline = time.monotonic() + 5
+    while SINGLEFLIGHT_CALLS.value(flight="test-coalesce", role="collapsed") < 4 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(runs) == 1
+    assert sorted(results) == [("value", False)] + [("value", True)] * 4
+    assert SINGLEFLIGHT_CALLS.value(flight="test-coalesce", role="leader") == 1
+    assert flight.in_flight() == 0
+
+
+def test_single_flight_shares_errors_and_forgets_finished_calls():
+    """
+    Test that an exception is raised in the leader and a later call runs the computation again.
+    """
+    import pytest
+    from app.services.cache import SingleFlight
+
+    flight = SingleFlight("test-errors")
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("key", fail)
+
+    assert flight.do("key", lambda: 42) == (42, False)
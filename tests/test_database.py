@@ -1,6 +1,15 @@
+import subprocess
+import sys
 import pytest
+import duckdb
 from pathlib import Path
+from pydantic import ValidationError
+from app.cli import main
 from app.database.connection import DatabaseManager
+from app.schemas.nominations import Nomination
+from app.services.interval_engine import PRODUCERS, calculate_grouped_intervals
+from app.services.producer_index import ProducerIndex
+from app.services.producer_service import calculate_producer_intervals, ENGINE_BRIDGE, ENGINE_INDEX, ENGINE_PYTHON, ENGINE_SQL
 
 
 def test_lifecycle(tmp_path):
@@ -55,6 +64,38 @@ def test_index_creation(tmp_path):
         assert 'idx_year' in index_names
 
 
+def test_producer_bridge_tables(tmp_path):
+    """
+    Test that ingest builds the normalized producer dictionary and producer_wins tables with indexes.
+    """
+    csv_content = """year;title;studios;producers;winner
+1990;Movie 1;Studio A;Producer X, Producer Y and Producer Z;yes
+1991;Movie 2;Studio B;Producer X;yes
+1991;Movie 3;Studio C;Producer W;
+"""
+    test_csv = tmp_path / "bridge.csv"
+    test_csv.write_text(csv_content)
+
+    with DatabaseManager(
+            db_path=":memory:",
+            csv_path=str(test_csv)
+    ) as db:
+        db.initialize_database()
+
+        dictionary = db.conn.execute(
+            "SELECT producer FROM producer_dictionary ORDER BY producer_id;"
+        ).fetchall()
+        assert [row[0] for row in dictionary] == ["Producer W", "Producer X", "Producer Y", "Producer Z"]
+
+        wins = db.conn.execute(
+            "SELECT producer, year FROM producer_wins ORDER BY producer, year;"
+        ).fetchall()
+        assert wins == [("Producer X", 1990), ("Producer X", 1991), ("Producer Y", 1990), ("Producer Z", 1990)]
+
+        index_names = {row[0] for row in db.conn.execute("SELECT index_name FROM duckdb_indexes;").fetchall()}
+        assert {'idx_producer_wins_producer', 'idx_producer_dictionary_name'} <= index_names
+
+
 def test_data_types(clean_duckdb_state, tmp_path):
     test_csv = Path(__file__).parent / "test_data" / "test_movielist.csv"
 
@@ -96,7 +137,7 @@ def test_missing_csv_handling(tmp_path):
         csv_path=str(fake_csv)
     )
 
-    with pytest.raises(FileNotFoundError):
+    with pytest.raises(FileNotFoundError, match="CSV file not found at"):
         db.initialize_database()
 
 def test_empty_table_returns_empty_response():
@@ -104,9 +145,6 @@ def test_empty_table_returns_empty_response():
     Test that when the table is empty, the service returns an empty response
     without raising exceptions.
     """
-    import duckdb
-    from app.services.producer_service import calculate_producer_intervals
-
     db = duckdb.connect(database=":memory:")
     db.execute("""
         CREATE TABLE worst_movie_nominations (
@@ -125,9 +163,6 @@ def test_producer_with_one_win_only():
     """
     Test that a producer with only one win is not included in interval calculations.
     """
-    import duckdb
-    from app.services.producer_service import calculate_producer_intervals
-
     db = duckdb.connect(database=":memory:")
     db.execute("""
         CREATE TABLE worst_movie_nominations (
@@ -184,4 +219,373 @@ def test_winner_field_normalization(tmp_path):
             WHERE winner = true;
         """).fetchone()[0]
 
-        assert winners == 3, "Expected 3 normalized winners regardless of formatting"
\ No newline at end of file
+        assert winners == 3, "Expected 3 normalized winners regardless of formatting"
+
+
+def test_loading_zero_byte_csv(tmp_path):
+    """
+    Test that a zero-byte CSV file is skipped without raising and leaves the table empty.
+    """
+    empty_csv = tmp_path / "zero.csv"
+    empty_csv.write_text("")
+
+    with DatabaseManager(
+            db_path=":memory:",
+            csv_path=str(empty_csv)
+    ) as db:
+        db.initialize_database()
+
+        result = db.conn.execute("SELECT COUNT(*) FROM worst_movie_nominations;").fetchone()
+        assert result[0] == 0
+
+def test_warm_start_skips_reload_when_snapshot_is_current(tmp_path, monkeypatch):
+    """
+    Test that an on-disk database is reused when the source file has not changed,
+    and reloaded once its contents change.
+    """
+    test_csv = tmp_path / "snapshot.csv"
+    test_csv.write_text("year;title;studios;producers;winner\n1990;Movie 1;Studio A;Producer X;yes\n")
+    db_path = str(tmp_path / "snapshot.db")
+
+    with DatabaseManager(db_path=db_path, csv_path=str(test_csv)) as db:
+        db.initialize_database()
+
+    loads = []
+    monkeypatch.setattr(DatabaseManager, "_load_initial_data", lambda self: loads.append(self.csv_path))
+
+    with DatabaseManager(db_path=db_path, csv_path=str(test_csv)) as db:
+        db.initialize_database()
+        assert loads == []
+        assert db.conn.execute("SELECT COUNT(*) FROM worst_movie_nominations;").fetchone()[0] == 1
+        assert db.dataset_version == 1
+
+    test_csv.write_text("year;title;studios;producers;winner\n1991;Movie 2;Studio B;Producer Y;yes\n")
+
+    with DatabaseManager(db_path=db_path, csv_path=str(test_csv)) as db:
+        db.initialize_database()
+        assert loads == [str(test_csv)]
+
+def test_append_nominations_updates_tables_and_index():
+    """
+    Test that appending nominations updates the bridge tables and the in-memory index incrementally,
+    matching a full recomputation from the database.
+    """
+    test_csv = Path(__file__).parent / "test_data" / "test_movielist.csv"
+
+    with DatabaseManager(db_path=":memory:", csv_path=str(test_csv)) as db:
+        db.initialize_database()
+        version = db.dataset_version
+
+        inserted = db.append_nominations([
+            Nomination(year=1985, title="New Movie", studios="Studio", producers="Allan Carr and New Producer", winner=True),
+            Nomination(year=1986, title="Loser", studios="Studio", producers="New Producer", winner=False),
+        ])
+
+        assert inserted == 2
+        assert db.dataset_version == version + 1
+        assert db.producer_index.years("Allan Carr") == [1980, 1985]
+        assert db.conn.execute(
+            "SELECT COUNT(*) FROM producer_dictionary WHERE producer = 'New Producer';"
+        ).fetchone()[0] == 1
+        assert db.producer_index.to_response() == calculate_producer_intervals(db.conn, engine=ENGINE_BRIDGE)
+
+        # New ids continue after the loaded ones and are found again through the lower-cased key;
+        # a spelling that did not win does not rename a producer that did
+        db.append_nominations([Nomination(year=1987, title="Other", producers="NEW PRODUCER, Another One")])
+        assert db.conn.execute(
+            "SELECT producer_id, producer, producer_key FROM producer_dictionary "
+            "WHERE producer_key IN ('new producer', 'another one') ORDER BY producer_id;"
+        ).fetchall() == [
+            (db._next_producer_id - 2, "New Producer", "new producer"),
+            (db._next_producer_id - 1, "Another One", "another one"),
+        ]
+
+
+def test_append_rebuilds_the_producer_index_when_its_update_fails(monkeypatch):
+    """
+    Test that out-of-range years are rejected, and that a failed index update after the commit
+    rebuilds the index from the committed rows and still bumps the dataset version.
+    """
+    with pytest.raises(ValidationError):
+        Nomination(year=70000, title="Too Late", producers="Allan Carr", winner=True)
+
+    test_csv = Path(__file__).parent / "test_data" / "test_movielist.csv"
+
+    with DatabaseManager(db_path=":memory:", csv_path=str(test_csv)) as db:
+        db.initialize_database()
+        version = db.dataset_version
+
+        def failing_add_win(self, producer, year):
+            raise OverflowError("unsigned short is greater than maximum")
+
+        monkeypatch.setattr(ProducerIndex, "add_win", failing_add_win)
+        db.append_nominations([Nomination(year=1985, title="New Movie", producers="Allan Carr", winner=True)])
+
+        assert db.dataset_version == version + 1
+        assert db.producer_index.years("Allan Carr") == [1980, 1985]
+        assert db.producer_index.to_response() == calculate_producer_intervals(db.conn, engine=ENGINE_BRIDGE)
+
+def test_reload_swaps_tables_without_disturbing_readers(tmp_path):
+    """
+    Test that a reload swaps in the new data atomically while an in-flight reader keeps its snapshot.
+    """
+    test_csv = tmp_path / "reload.csv"
+    test_csv.write_text("year;title;studios;producers;winner\n1990;Movie 1;Studio A;Producer X;yes\n")
+
+    with DatabaseManager(db_path=":memory:", csv_path=str(test_csv)) as db:
+        db.initialize_database()
+
+        reader = db.conn.cursor()
+        reader.execute("BEGIN TRANSACTION;")
+        assert reader.execute("SELECT COUNT(*) FROM worst_movie_nominations;").fetchone()[0] == 1
+
+        test_csv.write_text(
+            "year;title;studios;producers;winner\n"
+            "1990;Movie 1;Studio A;Producer X;yes\n"
+            "1995;Movie 2;Studio B;Producer X;yes\n"
+        )
+        db.initialize_database(force=True)
+
+        assert reader.execute("SELECT COUNT(*) FROM worst_movie_nominations;").fetchone()[0] == 1
+        reader.execute("COMMIT;")
+        assert reader.execute("SELECT COUNT(*) FROM worst_movie_nominations;").fetchone()[0] == 2
+        assert reader.execute("SELECT COUNT(*) FROM producer_wins;").fetchone()[0] == 2
+
+        tables = {row[0] for row in db.conn.execute("SELECT table_name FROM duckdb_tables();").fetchall()}
+        assert not any(table.endswith("_staging") for table in tables)
+
+        index_names = {row[0] for row in db.conn.execute("SELECT index_name FROM duckdb_indexes;").fetchall()}
+        assert {'idx_producer', 'idx_year', 'idx_producer_wins_producer'} <= index_names
+        reader.close()
+
+
+@pytest.mark.parametrize("partition_by_year", [True, False])
+def test_parquet_sources_load_like_csv(tmp_path, partition_by_year):
+    """
+    Test that Parquet files and year-partitioned directories written by the CLI load the same rows as the CSV.
+    """
+    csv_path = Path(__file__).parent / "test_data" / "test_movielist.csv"
+    destination = tmp_path / ("nominations" if partition_by_year else "nominations.parquet")
+    argv = ["convert", str(csv_path), str(destination)] + ([] if partition_by_year else ["--single-file"])
+
+    assert main(argv) == 0
+    if partition_by_year:
+        assert (destination / "year=1980").is_dir()
+
+    query = "SELECT year, title, studios, producers, winner FROM worst_movie_nominations ORDER BY ALL;"
+    with DatabaseManager(db_path=":memory:", csv_path=str(csv_path)) as db:
+        db.initialize_database()
+        expected = db.conn.execute(query).fetchall()
+
+    with DatabaseManager(db_path=":memory:", csv_path=str(destination)) as db:
+        db.initialize_database()
+        assert db.conn.execute(query).fetchall() == expected
+        assert len(db.producer_index) > 0
+
+
+def test_unknown_source_format_is_rejected():
+    """
+    Test that an unsupported source format fails fast.
+    """
+    with pytest.raises(ValueError):
+        DatabaseManager(db_path=":memory:", source_format="xlsx")
+
+
+SHARED_WORKER = """
+import sys
+from app.database.connection import DatabaseManager
+from app.metrics import INGEST_DURATION
+
+db = DatabaseManager(db_path=sys.argv[1], csv_path=sys.argv[2], shared=True)
+db.initialize_database()
+rows = db.conn.execute("SELECT COUNT(*) FROM worst_movie_nominations;").fetchone()[0]
+print(INGEST_DURATION.count(), rows, len(db.producer_index))
+db.close()
+"""
+
+
+def test_shared_database_is_built_once_for_concurrent_workers(tmp_path):
+    """
+    Test that concurrent worker processes load the source once and all open the file read-only.
+    """
+    test_csv = Path(__file__).parent / "test_data" / "test_movielist.csv"
+    db_path = tmp_path / "shared.duckdb"
+    workers = [
+        subprocess.Popen(
+            [sys.executable, "-c", SHARED_WORKER, str(db_path), str(test_csv)],
+            cwd=Path(__file__).parent.parent, stdout=subprocess.PIPE, text=True
+        )
+        for _ in range(3)
+    ]
+    outputs = sorted(worker.communicate(timeout=60)[0].split() for worker in workers)
+
+    assert all(worker.returncode == 0 for worker in workers)
+    assert [output[0] for output in outputs] == ["0", "0", "1"]
+    assert {tuple(output[1:]) for output in outputs} == {("20", outputs[0][2])}
+
+
+def test_shared_database_is_read_only(tmp_path):
+    """
+    Test that a shared database rejects appends and in-memory paths.
+    """
+    test_csv = Path(__file__).parent / "test_data" / "test_movielist.csv"
+    db = DatabaseManager(db_path=str(tmp_path / "shared.duckdb"), csv_path=str(test_csv), shared=True)
+    try:
+        db.initialize_database()
+
+        assert db.conn.execute("SELECT COUNT(*) FROM worst_movie_nominations;").fetchone()[0] == 20
+        with pytest.raises(RuntimeError):
+            db.append_nominations([Nomination(year=2020, title="Movie", producers="Someone", winner=True)])
+    finally:
+        db.close()
+
+    with pytest.raises(ValueError):
+        DatabaseManager(db_path=":memory:", shared=True)
+
+
+def test_ingest_merges_case_and_spacing_variants(tmp_path):
+    """
+    Test that the producer tables built at ingest merge names differing only in case or spacing.
+    """
+    csv_path = tmp_path / "variants.csv"
+    csv_path.write_text(
+        "year;title;studios;producers;winner\n"
+        "2000;Movie A;Studio;Variant  Producer;yes\n"
+        "2004;Movie B;Studio;variant producer and Other;yes\n"
+    )
+
+    with DatabaseManager(db_path=":memory:", csv_path=str(csv_path)) as db:
+        db.initialize_database()
+
+        assert db.conn.execute("SELECT producer FROM producer_dictionary ORDER BY producer;").fetchall() == [
+            ("Other",), ("Variant Producer",)
+        ]
+        assert db.producer_index.years("Variant Producer") == [2000, 2004]
+
+        db.append_nominations([Nomination(year=2010, title="Movie C", producers="VARIANT PRODUCER", winner=True)])
+
+        # The appended spelling is smaller, so it becomes the reported one, as after a reload
+        assert db.producer_index.years("VARIANT PRODUCER") == [2000, 2004, 2010]
+        assert db.producer_index.years("Variant Producer") == []
+        assert db.conn.execute("SELECT count(*) FROM producer_dictionary;").fetchone()[0] == 2
+
+
+def test_appended_dataset_matches_a_reload(tmp_path, movielist_db):
+    """
+    Test that appending rows reports the same producer names and intervals as reloading the same rows.
+    """
+    appended = [
+        Nomination(year=2020, title="Movie A", studios="Studio", producers="new guy", winner=True),
+        Nomination(year=2022, title="Movie B", studios="Studio", producers="New Guy", winner=True),
+        Nomination(year=2023, title="Movie C", studios="Studio", producers="JOEL SILVER", winner=False),
+    ]
+    reloaded_csv = tmp_path / "reloaded.csv"
+    reloaded_csv.write_text(Path(movielist_db.csv_path).read_text().rstrip("\n") + "\n" + "".join(
+        f"{n.year};{n.title};{n.studios};{n.producers};{'yes' if n.winner else ''}\n" for n in appended
+    ))
+
+    def snapshot(db):
+        return (
+            db.conn.execute("SELECT producer_id, producer FROM producer_dictionary ORDER BY producer;").fetchall(),
+            db.conn.execute("SELECT producer, year FROM producer_wins ORDER BY producer, year;").fetchall(),
+            db.conn.execute("SELECT * EXCLUDE (producer_id) FROM producer_intervals ORDER BY ALL;").fetchall(),
+            [
+                calculate_producer_intervals(db.conn, engine=engine, index=db.producer_index, **params)
+                for engine in (ENGINE_SQL, ENGINE_BRIDGE)
+                for params in ({}, {"from_year": 1990, "to_year": 2022})
+            ] + [db.producer_index.to_response(), db.producer_index.lookup("joel silver")],
+        )
+
+    movielist_db.append_nominations(appended)
+    appended_snapshot = snapshot(movielist_db)
+
+    with DatabaseManager(db_path=":memory:", csv_path=str(reloaded_csv)) as db:
+        db.initialize_database()
+        reloaded_snapshot = snapshot(db)
+
+    names = [name for _, name in appended_snapshot[0]]
+    assert "New Guy" in names and "Joel Silver" in names and "JOEL SILVER" not in names
+    assert appended_snapshot[1:] == reloaded_snapshot[1:]
+    assert sorted(names) == sorted(name for _, name in reloaded_snapshot[0])
+
+
+@pytest.mark.parametrize("content", ["\n", " \r\n\t\n", "year;title;studios;producers;winner\n"])
+def test_reload_of_blank_or_header_only_csv_keeps_loaded_data(tmp_path, content):
+    """
+    Test that a blank or header-only CSV is skipped on load and on reload, keeping the loaded data.
+    """
+    test_csv = tmp_path / "reload.csv"
+    test_csv.write_text(content)
+
+    with DatabaseManager(db_path=":memory:", csv_path=str(test_csv)) as db:
+        db.initialize_database()
+        assert db.conn.execute("SELECT COUNT(*) FROM worst_movie_nominations;").fetchone()[0] == 0
+
+        test_csv.write_text("year;title;studios;producers;winner\n1990;Movie 1;Studio A;Producer X;yes\n")
+        db.initialize_database(force=True)
+        test_csv.write_text(content)
+        db.initialize_database(force=True)
+
+        assert db.conn.execute("SELECT COUNT(*) FROM worst_movie_nominations;").fetchone()[0] == 1
+        assert db.conn.execute("SELECT COUNT(*) FROM producer_wins;").fetchone()[0] == 1
+        assert db.producer_index.years("Producer X") == [1990]
+        tables = {row[0] for row in db.conn.execute("SELECT table_name FROM duckdb_tables();").fetchall()}
+        assert not any(table.endswith("_staging") for table in tables)
+
+
+def test_ingest_strips_tabs_and_line_breaks_like_python(tmp_path):
+    """
+    Test that winner flags and producer names padded with tabs or line breaks load like str.strip() reads them.
+    """
+    csv_path = tmp_path / "padded.csv"
+    csv_path.write_bytes(
+        b"year;title;studios;producers;winner\n"
+        b"2000;Movie A;Studio;\tPadded Producer;yes\t\n"
+        b"2003;Movie B;Studio;Padded Producer\t and Other;\tYes \n"
+        b"2009;Movie C;Studio;\"Other\r\n\";\"yes\r\n\"\n"
+        b"2010;Movie D;Studio;Loser;\tno\n"
+    )
+
+    with DatabaseManager(db_path=":memory:", csv_path=str(csv_path)) as db:
+        db.initialize_database()
+
+        assert db.conn.execute("SELECT COUNT(*) FROM worst_movie_nominations WHERE winner;").fetchone()[0] == 3
+        assert db.conn.execute("SELECT producer FROM producer_dictionary ORDER BY producer;").fetchall() == [
+            ("Loser",), ("Other",), ("Padded Producer",)
+        ]
+        assert db.producer_index.years("Padded Producer") == [2000, 2003]
+
+        results = {
+            engine: calculate_producer_intervals(db.conn, engine=engine)
+            for engine in (ENGINE_SQL, ENGINE_BRIDGE, ENGINE_PYTHON)
+        }
+        assert results[ENGINE_SQL] == results[ENGINE_BRIDGE] == results[ENGINE_PYTHON]
+        assert [(gap.producer, gap.interval) for gap in results[ENGINE_SQL].min] == [("Padded Producer", 3)]
+        assert [(gap.producer, gap.interval) for gap in results[ENGINE_SQL].max] == [("Other", 6)]
+
+
+def test_winning_rows_without_a_year_are_loaded_but_not_counted_as_wins(tmp_path):
+    """
+    Test that a winning row with an empty year is loaded like any row and ignored by every interval engine.
+    """
+    csv_path = tmp_path / "no_year.csv"
+    csv_path.write_text(
+        "year;title;studios;producers;winner\n"
+        "2000;Movie A;Studio;Producer X;yes\n"
+        ";Movie B;Studio;Producer X;yes\n"
+        "2004;Movie C;Studio;Producer X;yes\n"
+    )
+
+    with DatabaseManager(db_path=":memory:", csv_path=str(csv_path)) as db:
+        db.initialize_database()
+
+        assert db.conn.execute("SELECT COUNT(*) FROM worst_movie_nominations;").fetchone()[0] == 3
+        assert db.producer_index.years("Producer X") == [2000, 2004]
+
+        results = [
+            calculate_producer_intervals(db.conn, engine=engine, index=db.producer_index)
+            for engine in (ENGINE_SQL, ENGINE_BRIDGE, ENGINE_PYTHON, ENGINE_INDEX)
+        ]
+        assert all(result == results[0] for result in results)
+        assert [(gap.producer, gap.interval) for gap in results[0].min] == [("Producer X", 4)]
+        assert calculate_grouped_intervals(db.conn, [PRODUCERS])["producers"].min == [("Producer X", 4, 2000, 2004)]
@@ -0,0 +1,49 @@
+import pytest
+
+from app.services.interval_engine import PRODUCERS, STUDIOS, calculate_grouped_intervals
+from app.services.producer_service import ENGINE_SQL, calculate_producer_intervals
+from app.services.studio_service import calculate_studio_intervals
+
+
+@pytest.fixture
+def db(movielist_db):
+    return movielist_db.conn
+
+
+def _as_tuples(intervals):
+    return [(i.producer, i.interval, i.previousWin, i.followingWin) for i in intervals]
+
+
+@pytest.mark.parametrize("params", [{}, {"top": 3, "bottom": 2}, {"from_year": 1990, "to_year": 2000}])
+def test_grouped_engine_matches_producer_engine(db, params):
+    """
+    Test that the producers dimension of a grouped scan matches the dedicated producer engine.
+    """
+    grouped = calculate_grouped_intervals(db, [PRODUCERS, STUDIOS], **params)
+    expected = calculate_producer_intervals(db, engine=ENGINE_SQL, **params)
+
+    assert grouped["producers"].min == _as_tuples(expected.min)
+    assert grouped["producers"].max == _as_tuples(expected.max)
+
+
+def test_studio_intervals(db):
+    """
+    Test the studio min/max intervals, with ties ordered by studio and year.
+    """
+    result = calculate_studio_intervals(db)
+    ranked = calculate_studio_intervals(db, top=2, bottom=1)
+
+    assert [(i.studio, i.interval) for i in result.max] == [("Paramount Pictures", 15)]
+    assert [(i.studio, i.previousWin) for i in result.min] == [
+        ("Columbia Pictures", 2017), ("Paramount Pictures", 2008), ("Paramount Pictures", 2009), ("Warner Bros.", 1999)
+    ]
+    assert [(i.studio, i.interval) for i in ranked.max] == [("Paramount Pictures", 15), ("20th Century Fox", 14)]
+    assert [(i.studio, i.interval) for i in ranked.min] == [("Columbia Pictures", 1)]
+
+
+def test_grouped_engine_requires_a_dimension(db):
+    """
+    Test that an empty dimension list is rejected.
+    """
+    with pytest.raises(ValueError):
+        calculate_grouped_intervals(db, [])
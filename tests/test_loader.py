@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.database.connection import DatabaseManager
+from app.routers.producers import load_encoded_intervals
+from app.services.cache import intervals_cache
+from app.services.loader import DataLoader, STATE_LOADING, STATE_PENDING, STATE_READY, STATE_FAILED
+
+client = TestClient(main.app)
+
+
+def test_loader_loads_data_and_warms_up_the_cache():
+    """
+    Test that the loader initializes the database and precomputes the interval response.
+    """
+    csv_path = Path(__file__).parent.parent / "data" / "Movielist.csv"
+
+    with DatabaseManager(db_path=":memory:", csv_path=str(csv_path)) as db:
+        loader = DataLoader(db, warm_up=lambda: load_encoded_intervals(db))
+        loader.run()
+
+        assert loader.ready
+        assert loader.status()["dataset_version"] == db.dataset_version
+        assert intervals_cache.stats()["entries"] == 1
+        assert load_encoded_intervals(db)[1] == "HIT"
+
+
+def test_loader_reports_load_failures():
+    """
+    Test that a failed load is re-raised and reported as failed.
+    """
+    with DatabaseManager(db_path=":memory:", csv_path="/nonexistent/Movielist.csv") as db:
+        loader = DataLoader(db)
+        with pytest.raises(FileNotFoundError):
+            loader.run()
+
+    assert loader.state == STATE_FAILED
+    assert loader.blocking_queries
+    assert "not found" in loader.status()["error"]
+
+
+def test_health_endpoints_and_query_gating(monkeypatch):
+    """
+    Test that liveness is always reported while readiness and API access follow the load state.
+    """
+    monkeypatch.setattr(main._loader, "state", STATE_LOADING)
+
+    assert client.get("/health/live").status_code == 200
+    assert client.get("/health/ready").json()["status"] == STATE_LOADING
+    loading = client.get("/api/v1/producers/intervals")
+    assert loading.status_code == 503
+    assert loading.headers["Retry-After"] == "5"
+
+    monkeypatch.setattr(main._loader, "state", STATE_READY)
+
+    assert client.get("/health/ready").status_code == 200
+    monkeypatch.setattr(main._loader, "state", STATE_PENDING)
+    assert client.get("/health/ready").status_code == 503
+
+
+def test_queries_are_refused_until_the_background_load_starts(monkeypatch):
+    """
+    Test that API requests are refused from the moment the server starts, before the load thread runs.
+    """
+    started = []
+    monkeypatch.setattr(main._loader, "state", STATE_PENDING)
+    monkeypatch.setattr(main._loader, "run", lambda: started.append(main._loader.state))
+
+    with TestClient(main.app) as lifespan_client:
+        assert lifespan_client.get("/api/v1/nominations").status_code == 503
+        assert lifespan_client.get("/api/v1/studios/intervals").status_code == 503
+
+    assert started == [STATE_LOADING]
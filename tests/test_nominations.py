@@ -0,0 +1,87 @@
+import io
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_json_export_paginates_with_cursors(movielist_db):
+    """
+    Test that following next_cursor returns every filtered nomination exactly once.
+    """
+    titles, cursor, pages = [], None, 0
+    while True:
+        params = {"from_year": 1990, "to_year": 1999, "limit": 7}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/api/v1/nominations", params=params).json()
+        titles += [item["title"] for item in page["items"]]
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    expected = movielist_db.conn.execute(
+        "SELECT title FROM worst_movie_nominations WHERE year BETWEEN 1990 AND 1999 ORDER BY rowid;"
+    ).fetchall()
+    assert titles == [title for title, in expected]
+    assert pages == -(-len(expected) // 7)
+
+
+def test_json_export_rejects_outdated_and_malformed_cursors(movielist_db):
+    """
+    Test that cursors expire (410) once the dataset version changes and are rejected (400) when they cannot be decoded.
+    """
+    cursor = client.get("/api/v1/nominations", params={"limit": 1}).json()["next_cursor"]
+    movielist_db.dataset_version += 1
+
+    assert client.get("/api/v1/nominations", params={"cursor": cursor}).status_code == 410
+    assert client.get("/api/v1/nominations", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_arrow_export_streams_filtered_rows(movielist_db):
+    """
+    Test that the Arrow IPC stream holds the filtered nominations.
+    """
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+
+    response = client.get("/api/v1/nominations", params={"format": "arrow", "winner": True})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    table = pyarrow.ipc.open_stream(io.BytesIO(response.content)).read_all()
+    assert table.column_names == ["year", "title", "studios", "producers", "winner"]
+    assert table.num_rows == 42
+    assert all(table.column("winner").to_pylist())
+
+
+def test_parquet_export_streams_filtered_rows(movielist_db, tmp_path):
+    """
+    Test that the Parquet export holds the filtered nominations.
+    """
+    response = client.get("/api/v1/nominations", params={"format": "parquet", "from_year": 2000})
+
+    assert response.status_code == 200
+    exported = tmp_path / "nominations.parquet"
+    exported.write_bytes(response.content)
+    assert movielist_db.conn.execute(f"SELECT count(*), min(year) FROM '{exported}';").fetchone() == \
+        movielist_db.conn.execute("SELECT count(*), min(year) FROM worst_movie_nominations WHERE year >= 2000;").fetchone()
+
+
+def test_parquet_export_returns_503_when_the_pool_is_busy(movielist_db):
+    """
+    Test that a streamed export answers 503 before starting the response when no cursor is available.
+    """
+    movielist_db.get_pool().timeout = 0.05
+    held = [movielist_db.get_pool().acquire() for _ in range(movielist_db.get_pool().size)]
+
+    response = client.get("/api/v1/nominations", params={"format": "parquet"})
+    for cursor in held:
+        movielist_db.get_pool().release(cursor)
+
+    assert response.status_code == 503
+    assert client.get("/api/v1/nominations", params={"format": "parquet"}).status_code == 200
@@ -0,0 +1,99 @@
+import threading
+import pytest
+import duckdb
+from app.database.connection import DatabaseManager
+from app.database.pool import CursorPool, PoolTimeoutError
+
+
+def test_pool_is_bounded_and_reuses_cursors():
+    """
+    Test that the pool never hands out more cursors than its size and reuses released ones.
+    """
+    conn = duckdb.connect(database=":memory:")
+    pool = CursorPool(conn, size=2, timeout=0.05)
+
+    first = pool.acquire()
+    second = pool.acquire()
+
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+
+    pool.release(first)
+    assert pool.acquire() is first
+
+    with pytest.raises(PoolTimeoutError, match="after 0.01 seconds"):
+        pool.acquire(timeout=0.01)
+
+    stats = pool.stats()
+    assert stats["created"] == 2
+    assert stats["acquisitions"] == 3
+    assert stats["timeouts"] == 2
+    pool.close()
+
+
+def test_pooled_cursors_share_the_database_across_threads():
+    """
+    Test that cursors checked out from different threads see the same data.
+    """
+    conn = duckdb.connect(database=":memory:")
+    conn.execute("CREATE TABLE numbers AS SELECT range AS n FROM range(1000);")
+    pool = CursorPool(conn, size=4)
+    results = []
+
+    def worker():
+        with pool.cursor() as cursor:
+            results.append(cursor.execute("SELECT SUM(n) FROM numbers;").fetchone()[0])
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [499500] * 8
+    assert pool.stats()["created"] <= 4
+    pool.close()
+
+
+def test_stream_holds_its_cursor_until_the_stream_ends_or_is_dropped():
+    """
+    Test that a stream checks its cursor out up front and returns it when exhausted or dropped unread.
+    """
+    conn = duckdb.connect(database=":memory:")
+    pool = CursorPool(conn, size=1, timeout=0.05)
+
+    def numbers(cursor):
+        yield from (row[0] for row in cursor.execute("SELECT range FROM range(3);").fetchall())
+
+    stream = pool.stream(numbers)
+    with pytest.raises(PoolTimeoutError):
+        pool.stream(numbers)
+
+    assert list(stream) == [0, 1, 2]
+    unread = pool.stream(numbers)
+    del unread
+    with pool.cursor() as cursor:
+        assert cursor.execute("SELECT 1;").fetchone() == (1,)
+    pool.close()
+
+
+def test_concurrent_first_requests_share_one_pool():
+    """
+    Test that threads asking for the pool of a new connection at the same time all get the same pool.
+    """
+    with DatabaseManager(db_path=":memory:", pool_size=2) as db:
+        barrier = threading.Barrier(8)
+        pools = []
+
+        def worker():
+            barrier.wait()
+            pools.append(db.get_pool())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(pools) == 8
+        assert all(pool is pools[0] for pool in pools)
@@ -0,0 +1,285 @@
+import threading
+
+import pytest
+import duckdb
+from app.database.connection import DatabaseManager
+from app.schemas.nominations import Nomination
+from app.services.interval_engine import PRODUCERS, calculate_grouped_intervals
+from app.services.producer_service import calculate_producer_intervals, calculate_producer_intervals_batch, iter_producer_intervals, IntervalQuery, ENGINE_AUTO, ENGINE_SQL, ENGINE_BRIDGE, ENGINE_PYTHON, ENGINE_INDEX
+from app.services.producer_index import ProducerIndex
+from app.services.tokenizer import NameTokenizer, PRODUCER_SEPARATOR
+
+
+def _create_nominations(rows):
+    db = duckdb.connect(database=":memory:")
+    db.execute("""
+        CREATE TABLE worst_movie_nominations (
+            year INTEGER,
+            producers VARCHAR,
+            winner BOOLEAN
+        )
+    """)
+    if rows:
+        db.executemany("INSERT INTO worst_movie_nominations VALUES (?, ?, ?)", rows)
+    return db
+
+
+@pytest.mark.parametrize("engine", [ENGINE_AUTO, ENGINE_SQL, ENGINE_BRIDGE, ENGINE_PYTHON, ENGINE_INDEX])
+def test_engines_match_on_full_dataset(engine, movielist_db):
+    """
+    Test that every engine returns the expected intervals for the bundled dataset.
+    """
+    index = movielist_db.producer_index if engine == ENGINE_INDEX else None
+    result = calculate_producer_intervals(movielist_db.conn, engine=engine, index=index)
+
+    assert [(i.producer, i.interval, i.previousWin, i.followingWin) for i in result.min] == \
+        [("Joel Silver", 1, 1990, 1991)]
+    assert [(i.producer, i.interval, i.previousWin, i.followingWin) for i in result.max] == \
+        [("Matthew Vaughn", 13, 2002, 2015)]
+
+
+@pytest.mark.parametrize("engine", [ENGINE_SQL, ENGINE_PYTHON])
+def test_engines_split_multi_producer_strings(engine):
+    """
+    Test that comma and ' and ' separated producers are split, trimmed and deduplicated per year.
+    """
+    db = _create_nominations([
+        (2000, "Producer A, Producer B and Producer C", True),
+        (2000, "Producer A", True),
+        (2003, "Producer B and  Producer A", True),
+        (2004, "Producer C,", True),
+        (2010, "Producer A", False),
+    ])
+
+    result = calculate_producer_intervals(db, engine=engine)
+
+    assert [(i.producer, i.interval) for i in result.min] == [("Producer A", 3), ("Producer B", 3)]
+    assert [(i.producer, i.interval) for i in result.max] == [("Producer C", 4)]
+
+
+@pytest.mark.parametrize("engine", [ENGINE_SQL, ENGINE_PYTHON])
+def test_same_interval_is_both_min_and_max(engine):
+    """
+    Test that a single interval is reported in both the min and max lists.
+    """
+    db = _create_nominations([(2000, "Producer A", True), (2002, "Producer A", True)])
+
+    result = calculate_producer_intervals(db, engine=engine)
+
+    assert len(result.min) == 1
+    assert result.min == result.max
+
+
+def test_unknown_engine_raises_value_error():
+    """
+    Test that requesting an unknown engine fails fast.
+    """
+    db = _create_nominations([])
+
+    with pytest.raises(ValueError):
+        calculate_producer_intervals(db, engine="unknown")
+
+
+def test_producer_index_splits_intervals_on_out_of_order_wins():
+    """
+    Test that adding a win between two existing wins replaces their interval with two new ones.
+    """
+    index = ProducerIndex.from_wins([("Producer A", 2000), ("Producer A", 2010), ("Producer B", 1990)])
+
+    assert [(i.producer, i.interval) for i in index.to_response().max] == [("Producer A", 10)]
+
+    assert index.add_win("Producer A", 2004) is True
+    assert index.add_win("Producer A", 2004) is False
+    index.add_win("Producer B", 1991)
+
+    result = index.to_response()
+    assert index.years("Producer A") == [2000, 2004, 2010]
+    assert [(i.producer, i.interval, i.previousWin) for i in result.min] == [("Producer B", 1, 1990)]
+    assert [(i.producer, i.interval, i.previousWin) for i in result.max] == [("Producer A", 6, 2004)]
+
+
+@pytest.mark.parametrize("engine", [ENGINE_SQL, ENGINE_BRIDGE, ENGINE_PYTHON, ENGINE_INDEX])
+def test_engines_return_top_and_bottom_k_intervals(engine, movielist_db):
+    """
+    Test that top/bottom K return the K longest/shortest intervals of any producer, in the same order for every engine.
+    """
+    index = movielist_db.producer_index if engine == ENGINE_INDEX else None
+    result = calculate_producer_intervals(movielist_db.conn, engine=engine, index=index, top=3, bottom=2)
+    only_top = calculate_producer_intervals(movielist_db.conn, engine=engine, index=index, top=1)
+
+    assert [(i.producer, i.interval) for i in result.max] == \
+        [("Matthew Vaughn", 13), ("Buzz Feitshans", 9), ("Bo Derek", 6)]
+    assert [(i.producer, i.interval) for i in result.min] == [("Joel Silver", 1), ("Bo Derek", 6)]
+    assert [(i.producer, i.interval) for i in only_top.min] == [("Joel Silver", 1)]
+
+
+def test_iter_producer_intervals_streams_every_interval_in_batches():
+    """
+    Test that every interval is streamed in batches bounded by the batch size.
+    """
+    db = _create_nominations([(year, "Producer A", True) for year in range(2000, 2010)])
+
+    batches = list(iter_producer_intervals(db, batch_size=4))
+
+    assert [len(batch) for batch in batches] == [4, 4, 1]
+    assert batches[0][0] == ("Producer A", 1, 2000, 2001)
+
+
+@pytest.mark.parametrize("engine", [ENGINE_AUTO, ENGINE_SQL, ENGINE_BRIDGE, ENGINE_PYTHON])
+def test_engines_filter_by_year_range(engine, movielist_db):
+    """
+    Test that only intervals whose both wins fall inside the year range are considered.
+    """
+    index = movielist_db.producer_index if engine == ENGINE_AUTO else None
+    result = calculate_producer_intervals(movielist_db.conn, engine=engine, index=index, from_year=1991, to_year=2015)
+    nineties = calculate_producer_intervals(movielist_db.conn, engine=engine, index=index, from_year=1990, to_year=1999)
+
+    assert [(i.producer, i.interval) for i in result.min] == [("Matthew Vaughn", 13)]
+    assert [(i.producer, i.interval) for i in result.max] == [("Matthew Vaughn", 13)]
+    assert [(i.producer, i.interval) for i in nineties.min] == [("Joel Silver", 1)]
+
+
+def test_index_engine_rejects_year_range():
+    """
+    Test that the in-memory index engine refuses year ranges instead of ignoring them.
+    """
+    db = _create_nominations([])
+
+    with pytest.raises(ValueError):
+        calculate_producer_intervals(db, engine=ENGINE_INDEX, index=ProducerIndex(), from_year=1990)
+
+
+def test_producer_index_lookup_and_prefix_search():
+    """
+    Test exact and case-insensitive lookups and prefix searches on the producer index.
+    """
+    index = ProducerIndex.from_wins([
+        ("Joel Silver", 1990), ("Joel Silver", 1991), ("Jerry Weintraub", 1980), ("Bo Derek", 1984)
+    ])
+    index.add_win("joe Producer", 2000)
+
+    assert index.lookup("Joel Silver") == ("Joel Silver", [1990, 1991])
+    assert index.lookup("JOEL SILVER") == ("Joel Silver", [1990, 1991])
+    assert index.lookup("Joel") is None
+    assert [name for name, _ in index.search("jo", limit=10)] == ["joe Producer", "Joel Silver"]
+    assert [name for name, _ in index.search("J", limit=2)] == ["Jerry Weintraub", "joe Producer"]
+    assert index.search("Z", limit=10) == []
+
+
+def test_producer_index_reads_are_consistent_with_concurrent_appends():
+    """
+    Test that responses built while wins are appended never fail nor leave empty interval buckets behind.
+    """
+    index = ProducerIndex.from_wins([(f"Producer {i}", 1900) for i in range(200)])
+    errors = []
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            try:
+                index.to_response(top=5, bottom=5)
+                index.to_response()
+            except Exception as error:
+                errors.append(error)
+                return
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    for year in range(2000, 1900, -1):
+        for i in range(200):
+            index.add_win(f"Producer {i}", year)
+    done.set()
+    reader.join()
+
+    assert errors == []
+    assert all(index._intervals.values())
+    assert [i.interval for i in index.to_response().min] == [1] * 200 * 100
+
+
+def test_tokenizer_memoizes_and_canonicalizes_names():
+    """
+    Test that equal raw strings are parsed once and names are normalized, deduplicated and given stable ids.
+    """
+    tokenizer = NameTokenizer(PRODUCER_SEPARATOR)
+    raw = "producer  a, Producer B and PRODUCER A"
+
+    ids = tokenizer.tokenize(raw)
+
+    assert tokenizer.tokenize(raw) is ids
+    assert len(ids) == 2
+    assert tokenizer.tokenize(" Producer B ,Producer A") == (ids[1], ids[0])
+    assert tokenizer.split(raw) == ("producer a", "Producer B")
+    assert tokenizer.name(ids[0]) == "producer a"
+    assert tokenizer.id_of("producer b") == ids[1]
+    assert tokenizer.tokenize(None) == ()
+
+
+@pytest.mark.parametrize("engine", [ENGINE_SQL, ENGINE_PYTHON])
+def test_engines_merge_case_and_spacing_variants(engine):
+    """
+    Test that the query-time engines treat names differing only in case or spacing as one producer.
+    """
+    db = _create_nominations([
+        (2000, "Variant  Producer", True),
+        (2004, "variant producer", True),
+        (2005, "Other Producer", True),
+        (2006, "Other Producer", True),
+    ])
+
+    result = calculate_producer_intervals(db, engine=engine)
+
+    assert [(i.producer, i.interval) for i in result.max] == [("Variant Producer", 4)]
+
+
+def test_engines_report_the_smallest_winning_spelling(tmp_path):
+    """
+    Test that every engine and the producer lookup report a name under a spelling that won,
+    even when a smaller spelling only appears in a losing row.
+    """
+    csv_path = tmp_path / "spellings.csv"
+    csv_path.write_text(
+        "year;title;studios;producers;winner\n"
+        "2000;Movie A;Studio;John Doe;yes\n"
+        "2003;Movie B;Studio;JOHN DOE;\n"
+        "2005;Movie C;Studio;John Doe;yes\n"
+    )
+
+    with DatabaseManager(db_path=":memory:", csv_path=str(csv_path)) as db:
+        db.initialize_database()
+        # An appended losing row with a smaller spelling does not rename the producer either
+        db.append_nominations([Nomination(year=2006, title="Movie D", producers="JOHN DOE", winner=False)])
+
+        reported = {
+            engine: [i.producer for i in calculate_producer_intervals(db.conn, engine=engine, index=db.producer_index).min]
+            for engine in (ENGINE_SQL, ENGINE_BRIDGE, ENGINE_PYTHON, ENGINE_INDEX)
+        }
+        grouped = calculate_grouped_intervals(db.conn, [PRODUCERS])["producers"]
+
+        assert reported == {engine: ["John Doe"] for engine in reported}
+        assert [row[0] for row in grouped.min] == ["John Doe"]
+        assert db.producer_index.lookup("john doe") == ("John Doe", [2000, 2005])
+
+
+@pytest.mark.parametrize("materialized", [True, False])
+def test_batch_matches_individual_queries(materialized, movielist_db):
+    """
+    Test that a batch answered in one scan returns, for every query, what the single-query engines return.
+    """
+    queries = [
+        IntervalQuery(),
+        IntervalQuery(top=3, bottom=2),
+        IntervalQuery(from_year=1991, to_year=2015),
+        IntervalQuery(top=2, from_year=1990, to_year=1999),
+        IntervalQuery(bottom=1, to_year=1985),
+        IntervalQuery(from_year=2100),
+    ]
+
+    if not materialized:
+        movielist_db.conn.execute("DROP TABLE producer_intervals;")
+    expected = [calculate_producer_intervals(movielist_db.conn, engine=ENGINE_SQL, **query._asdict()) for query in queries]
+    scanned = calculate_producer_intervals_batch(movielist_db.conn, queries)
+    indexed = calculate_producer_intervals_batch(movielist_db.conn, queries, index=movielist_db.producer_index)
+
+    assert scanned == expected
+    assert indexed == expected
+    assert expected[-1].min == [] and expected[-1].max == []
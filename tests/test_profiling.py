@@ -0,0 +1,128 @@
+import threading
+import duckdb
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.profiling import ProfilingMiddleware, ProfileStore, profile_routes, router as profiling_router
+from app.schemas.producers import ProducerIntervalResponse
+from app.services.cache import EncodedResponse
+from app.services.producer_service import calculate_producer_intervals, split_producers, ENGINE_PYTHON
+
+
+def _profiled_client(store: ProfileStore) -> TestClient:
+    db = duckdb.connect(database=":memory:")
+    db.execute("""
+        CREATE TABLE worst_movie_nominations AS
+        SELECT 1900 + (range % 200) AS year,
+               'Producer ' || (range % 997) || ', Other ' || (range % 13) || ' and Third ' || (range % 7) AS producers,
+               TRUE AS winner
+        FROM range(20000);
+    """)
+
+    test_app = FastAPI()
+    test_app.add_middleware(ProfilingMiddleware, interval=0.0005, store=store)
+
+    @test_app.get("/intervals")
+    def intervals():
+        return calculate_producer_intervals(db, engine=ENGINE_PYTHON)
+
+    @test_app.get("/split")
+    def split(count: int = 1):
+        for _ in range(count):
+            split_producers("Producer 1, Other 2 and Third 3")
+        return {"count": count}
+
+    @test_app.get("/encode")
+    def encode():
+        intervals = [
+            {"producer": f"Producer {n}", "interval": 1, "previousWin": 1900 + n % 100, "followingWin": 1901 + n % 100}
+            for n in range(5000)
+        ]
+        model = ProducerIntervalResponse(min=intervals, max=intervals)
+        for _ in range(10):
+            encoded = EncodedResponse.from_model(model)
+        return {"etag": encoded.etag}
+
+    profile_routes(test_app.routes)
+    return TestClient(test_app)
+
+
+def test_requests_without_header_are_not_profiled():
+    """
+    Test that requests without the X-Profile header pass through untouched.
+    """
+    client = _profiled_client(ProfileStore())
+
+    response = client.get("/intervals")
+
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response.headers
+    assert "min" in response.json()
+
+
+def test_inline_profile_is_collapsed_and_tagged_with_phases():
+    """
+    Test that "X-Profile: inline" returns a collapsed-stack profile tagged with interval phases.
+    """
+    client = _profiled_client(ProfileStore())
+
+    response = client.get("/intervals", headers={"X-Profile": "inline"})
+    lines = response.text.splitlines()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any(line.startswith("[phase:split];") for line in lines)
+
+
+def test_stored_profile_can_be_fetched_by_id():
+    """
+    Test that a stored profile is returned by id while the response body is left untouched.
+    """
+    store = ProfileStore()
+    client = _profiled_client(store)
+
+    response = client.get("/intervals", headers={"X-Profile": "1"})
+    profile_id = response.headers["X-Profile-Id"]
+
+    assert "min" in response.json()
+    assert "calculate_producer_intervals" in store.get(profile_id)
+
+    debug_app = FastAPI()
+    debug_app.include_router(profiling_router, prefix="/debug")
+    assert TestClient(debug_app).get("/debug/profiles/unknown").status_code == 404
+
+
+def test_profile_leaves_out_concurrent_requests():
+    """
+    Test that the threads serving other requests at the same time are not sampled.
+    """
+    client = _profiled_client(ProfileStore())
+    done = threading.Event()
+
+    def unprofiled_load():
+        while not done.is_set():
+            client.get("/split", params={"count": 2000})
+
+    worker = threading.Thread(target=unprofiled_load)
+    worker.start()
+    try:
+        response = client.get("/intervals", headers={"X-Profile": "inline"})
+    finally:
+        done.set()
+        worker.join()
+
+    assert response.status_code == 200
+    assert "calculate_producer_intervals" in response.text
+    assert "split_producers" not in response.text
+
+
+def test_profile_samples_the_endpoint_outside_database_work():
+    """
+    Test that the endpoint thread is sampled for the whole call, including response encoding.
+    """
+    client = _profiled_client(ProfileStore())
+
+    response = client.get("/encode", headers={"X-Profile": "inline"})
+
+    assert response.status_code == 200
+    assert "from_model (cache.py" in response.text